@@ -25,12 +25,13 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
-from .rtl import render_rtl, ALL_PROJECTS
+from .rtl import render_rtl, pla_cache_stats, ALL_PROJECTS
 from .env import PROJECT_ROOT
 
 __all__ = (
     # rtl:
     "render_rtl",
+    "pla_cache_stats",
     "ALL_PROJECTS",
 
     # env:
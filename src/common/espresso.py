@@ -0,0 +1,271 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Two-level logic minimization in the style of Espresso-II.
+#
+# Cubes use positional-cube notation packed into a Python int: input k
+# occupies bits [2k+1:2k], where bit 2k means "may be 0" and bit 2k+1 means
+# "may be 1". A literal x_k is therefore 0b10, ~x_k is 0b01, a don't-care is
+# 0b11 and 0b00 is the empty field. A cover is a list of such cubes over a
+# fixed number of inputs. Multi-output tables are minimized one output at a
+# time, mirroring the one-SOP-per-output form in which ABC writes them back.
+
+
+def _even_mask(n: int) -> int:
+    return int("01" * n, 2) if n else 0
+
+
+def _full(n: int) -> int:
+    return (1 << (2 * n)) - 1
+
+
+def cube_from_str(s: str) -> int:
+    """Convert a PLA input cube such as '1-0' (MSB first) to packed form."""
+    c = 0
+    for k, ch in enumerate(reversed(s)):
+        c |= {"0": 0b01, "1": 0b10, "-": 0b11}[ch] << (2 * k)
+    return c
+
+
+def cube_to_str(c: int, n: int) -> str:
+    return "".join(
+        {0b01: "0", 0b10: "1", 0b11: "-", 0b00: "~"}[(c >> (2 * k)) & 3]
+        for k in reversed(range(n))
+    )
+
+
+def _is_empty(c: int, n: int) -> bool:
+    even = _even_mask(n)
+    return ((c | (c >> 1)) & even) != even
+
+
+def _literal_mask(c: int, n: int) -> int:
+    # Fields in which the cube is not a don't-care, as 0b11 per field.
+    even = _even_mask(n)
+    lit = even & ~(c & (c >> 1))
+    return lit | (lit << 1)
+
+
+def literal_count(c: int, n: int) -> int:
+    return bin(_literal_mask(c, n)).count("1") // 2
+
+
+def _contains(a: int, b: int) -> bool:
+    return (b & ~a) == 0
+
+
+def _cofactor(cover: list[int], p: int, n: int) -> list[int]:
+    # Cofactor of a cover with respect to cube p.
+    raise_mask = _literal_mask(p, n)
+    out = list()
+    for c in cover:
+        if not _is_empty(c & p, n):
+            out.append(c | raise_mask)
+    return out
+
+
+def _binate_select(cover: list[int], n: int) -> int | None:
+    # Most binate variable (appears in both phases in the most cubes).
+    best, best_score = None, (0, 0)
+    for k in range(n):
+        zeros = ones = 0
+        for c in cover:
+            field = (c >> (2 * k)) & 3
+            if field == 0b01:
+                zeros += 1
+            elif field == 0b10:
+                ones += 1
+        if zeros and ones:
+            score = (zeros + ones, -abs(zeros - ones))
+            if score > best_score:
+                best, best_score = k, score
+    return best
+
+
+def _most_used_select(cover: list[int], n: int) -> int:
+    best, best_count = 0, 0
+    for k in range(n):
+        count = sum(1 for c in cover if ((c >> (2 * k)) & 3) != 0b11)
+        if count > best_count:
+            best, best_count = k, count
+    return best
+
+
+def tautology(cover: list[int], n: int) -> bool:
+    """True if the cover evaluates to 1 everywhere."""
+    full = _full(n)
+    if not cover:
+        return False
+    if any(c == full for c in cover):
+        return True
+
+    k = _binate_select(cover, n)
+    if k is None:
+        # Unate cover without a universal cube cannot be a tautology.
+        return False
+
+    x0 = full & ~(0b10 << (2 * k))
+    x1 = full & ~(0b01 << (2 * k))
+    return tautology(_cofactor(cover, x0, n), n) and tautology(
+        _cofactor(cover, x1, n), n
+    )
+
+
+def covers(cover: list[int], c: int, n: int) -> bool:
+    """True if cube c is contained in the union of the cover."""
+    return tautology(_cofactor(cover, c, n), n)
+
+
+def _single_cube_containment(cover: list[int]) -> list[int]:
+    out: list[int] = list()
+    for c in sorted(set(cover), key=lambda x: -bin(x).count("1")):
+        if not any(_contains(o, c) for o in out):
+            out.append(c)
+    return out
+
+
+def complement(cover: list[int], n: int) -> list[int]:
+    """Complement of a cover by recursive Shannon expansion."""
+    full = _full(n)
+    if not cover:
+        return [full]
+    if any(c == full for c in cover):
+        return []
+
+    if len(cover) == 1:
+        # De Morgan on a single cube: one cube per literal.
+        (c,) = cover
+        out: list[int] = list()
+        for j in range(n):
+            field = (c >> (2 * j)) & 3
+            if field != 0b11:
+                out.append((full & ~(3 << (2 * j))) | ((field ^ 3) << (2 * j)))
+        return out
+
+    k = _binate_select(cover, n)
+    if k is None:
+        k = _most_used_select(cover, n)
+
+    out = list()
+    for value in (0b01, 0b10):
+        x = (full & ~(3 << (2 * k))) | (value << (2 * k))
+        for r in complement(_cofactor(cover, x, n), n):
+            out.append(r & x)
+
+    return _single_cube_containment(out)
+
+
+def _expand(on: list[int], off: list[int], n: int) -> list[int]:
+    # Raise literals of each cube while it remains disjoint from the
+    # OFF-set; cubes covered by an expanded cube are dropped.
+    def _feasible(c: int) -> bool:
+        return all(_is_empty(c & r, n) for r in off)
+
+    # Prefer raising literals that are rare in the OFF-set; they are the
+    # least likely to make the cube intersect it.
+    weights = [sum(1 for r in off if ((r >> (2 * k)) & 3) != 0b11) for k in range(n)]
+    order = sorted(range(n), key=lambda k: weights[k])
+
+    out: list[int] = list()
+    for c in sorted(on, key=lambda x: literal_count(x, n), reverse=True):
+        if any(_contains(o, c) for o in out):
+            continue
+        for k in order:
+            field = 3 << (2 * k)
+            if (c & field) == field:
+                continue
+            if _feasible(c | field):
+                c |= field
+        out = [o for o in out if not _contains(c, o)]
+        out.append(c)
+
+    return out
+
+
+def _irredundant(cover: list[int], dc: list[int], n: int) -> list[int]:
+    out = list(cover)
+    # Try to drop the most specific cubes first.
+    for c in sorted(cover, key=lambda x: literal_count(x, n), reverse=True):
+        rest = [o for o in out if o != c]
+        if covers(rest + dc, c, n):
+            out = rest
+    return out
+
+
+def _reduce(cover: list[int], dc: list[int], n: int) -> list[int]:
+    # Shrink each cube to the smallest cube that still covers the minterms
+    # it alone is responsible for, opening room for a different expansion.
+    out = list(cover)
+    # Visit by position: duplicate cubes each keep (and reduce) their own slot.
+    for idx in sorted(range(len(out)), key=lambda i: -literal_count(out[i], n)):
+        c = out[idx]
+        rest = out[:idx] + out[idx + 1 :] + dc
+        uncovered = [r & c for r in complement(_cofactor(rest, c, n), n)]
+        uncovered = [u for u in uncovered if not _is_empty(u, n)]
+        if not uncovered:
+            continue
+        supercube = 0
+        for u in uncovered:
+            supercube |= u
+        out[idx] = supercube
+    return out
+
+
+def _cost(cover: list[int], n: int) -> tuple[int, int]:
+    return (len(cover), sum(literal_count(c, n) for c in cover))
+
+
+def minimize(on: list[int], n: int, dc: list[int] | None = None) -> list[int]:
+    """Minimize a single-output cover (ON-set, optional DC-set)."""
+    dc = list(dc or [])
+    on = _single_cube_containment([c for c in on if not _is_empty(c, n)])
+    if not on:
+        return []
+
+    off = complement(on + dc, n)
+
+    f = _irredundant(_expand(on, off, n), dc, n)
+    cost = _cost(f, n)
+
+    while True:
+        g = _irredundant(_expand(_reduce(f, dc, n), off, n), dc, n)
+        g_cost = _cost(g, n)
+        if g_cost >= cost:
+            break
+        f, cost = g, g_cost
+
+    return sorted(f, reverse=True)
+
+
+def intersect(a: list[int], b: list[int], n: int) -> list[int]:
+    """Product (AND) of two covers."""
+    return [x & y for x in a for y in b if not _is_empty(x & y, n)]
+
+
+def equivalent(a: list[int], b: list[int], n: int) -> bool:
+    """True if two covers describe the same Boolean function."""
+    return all(covers(b, c, n) for c in a) and all(covers(a, c, n) for c in b)
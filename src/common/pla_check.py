@@ -0,0 +1,194 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Equivalence checker for rendered PLA regions.
+#
+# Every PLA region is rendered by the in-process (espresso) backend and, when
+# ABC_EXE is set, by ABC. The espresso result is proven equal to the table it
+# was rendered from and to ABC's output by cover containment (tautology
+# checking), not by simulation.
+#
+#   python -m common.pla_check [file.sv ...]
+
+import pathlib
+import re
+import sys
+
+from .env import PROJECT_ROOT
+from .espresso import complement, covers, cube_from_str, equivalent, intersect
+from .rtl import PLARenderer, _ABC_EXE
+
+
+_DEFAULT_FILES = [PROJECT_ROOT / "rtl" / "e" / "e_priority.sv"]
+
+
+def pla_regions(path: pathlib.Path) -> list[list[str]]:
+    regions: list[list[str]] = list()
+    region: list[str] | None = None
+
+    with open(path, "r") as f:
+        for line in f.readlines():
+            if re.search(r"PLA_END", line):
+                regions.append(region or [])
+                region = None
+            elif region is not None:
+                region.append(line)
+            elif re.search(r"PLA_BEGIN", line):
+                region = list()
+
+    return regions
+
+
+class _SOPParser:
+    """Parse rendered 'assign' lines back into covers over the PLA inputs."""
+
+    _TOKEN = re.compile(r"\s*(1'b[01]|[A-Za-z_][\w\$]*(?:\[\d+\])?|[~!&|()?:])")
+
+    def __init__(self, inputs: list[str], lines: list[str]):
+        self._inputs = inputs
+        self._n = len(inputs)
+        self._exprs: dict[str, str] = dict()
+        self._covers: dict[str, list[int]] = dict()
+
+        for line in lines:
+            if m := re.match(r"\s*assign\s+(.+?)\s*=\s*(.+?)\s*;", line):
+                self._exprs[m.group(1)] = m.group(2)
+
+    def cover(self, name: str) -> list[int]:
+        if name not in self._covers:
+            tokens = self._TOKEN.findall(self._exprs[name])
+            (cover, rest) = self._expr(tokens)
+            if rest:
+                raise ValueError(f"Unparsed tokens in '{name}': {rest}")
+            self._covers[name] = cover
+        return self._covers[name]
+
+    def _expr(self, tokens):
+        (cover, tokens) = self._sum(tokens)
+        if tokens and tokens[0] == "?":
+            # ABC writes multiplexers as 'sel ? a : b'.
+            (then, tokens) = self._expr(tokens[1:])
+            if not tokens or tokens[0] != ":":
+                raise ValueError("Incomplete conditional")
+            (else_, tokens) = self._expr(tokens[1:])
+            cover = intersect(cover, then, self._n) + intersect(
+                complement(cover, self._n), else_, self._n
+            )
+        return (cover, tokens)
+
+    def _sum(self, tokens):
+        (cover, tokens) = self._term(tokens)
+        while tokens and tokens[0] == "|":
+            (rhs, tokens) = self._term(tokens[1:])
+            cover = cover + rhs
+        return (cover, tokens)
+
+    def _term(self, tokens):
+        (cover, tokens) = self._factor(tokens)
+        while tokens and tokens[0] == "&":
+            (rhs, tokens) = self._factor(tokens[1:])
+            cover = intersect(cover, rhs, self._n)
+        return (cover, tokens)
+
+    def _factor(self, tokens):
+        head, tokens = tokens[0], tokens[1:]
+
+        if head in ("~", "!"):
+            (cover, tokens) = self._factor(tokens)
+            return (complement(cover, self._n), tokens)
+        elif head == "(":
+            (cover, tokens) = self._expr(tokens)
+            if not tokens or tokens[0] != ")":
+                raise ValueError("Unbalanced parentheses")
+            return (cover, tokens[1:])
+        elif head == "1'b0":
+            return ([], tokens)
+        elif head == "1'b1":
+            return ([cube_from_str("-" * self._n)], tokens)
+        elif head in self._inputs:
+            j = self._inputs.index(head)
+            return ([cube_from_str("-" * j + "1" + "-" * (self._n - j - 1))], tokens)
+        else:
+            # Intermediate net introduced by the renderer.
+            return (self.cover(head), tokens)
+
+
+def check_region(region: list[str]) -> list[str]:
+    """Return a list of failures (empty if the region checks out)."""
+    espresso = PLARenderer(region, cache=None, backend="espresso")
+    esp_lines = espresso.render()
+
+    inputs = espresso.inputs()
+    n = len(inputs)
+    esp = _SOPParser(inputs, esp_lines)
+
+    abc = None
+    if _ABC_EXE:
+        abc = _SOPParser(
+            inputs, PLARenderer(region, cache=None, backend="abc").render()
+        )
+
+    failures = list()
+    for j, name in enumerate(espresso.outputs()):
+        on = [cube_from_str(i) for i, o in espresso.terms() if o[j] == "1"]
+        dc = [cube_from_str(i) for i, o in espresso.terms() if o[j] == "-"]
+
+        f = esp.cover(name)
+
+        # ON <= F <= ON + DC
+        if not (
+            all(covers(f, c, n) for c in on) and all(covers(on + dc, c, n) for c in f)
+        ):
+            failures.append(f"{name}: espresso result differs from PLA table")
+
+        if abc is not None and not equivalent(f, abc.cover(name), n):
+            failures.append(f"{name}: espresso result differs from ABC output")
+
+    return failures
+
+
+def main(args: list[str] | None = None) -> int:
+    files = [pathlib.Path(a) for a in (args or sys.argv[1:])] or _DEFAULT_FILES
+
+    if not _ABC_EXE:
+        print("ABC_EXE not set; checking against PLA tables only.")
+
+    failed = 0
+    for path in files:
+        for k, region in enumerate(pla_regions(path)):
+            failures = check_region(region)
+            status = "FAIL" if failures else "ok"
+            print(f"{path.name} region {k}: {status}")
+            for failure in failures:
+                print(f"  {failure}")
+            failed += bool(failures)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import os
+import subprocess
+import time
+
+
+class Meter:
+    """Resource usage of the child processes reaped while the meter is active.
+
+    Children must be spawned through this module's Popen (or run) to be
+    accounted for. Meters nest; a child is charged to every active meter.
+    """
+
+    def __init__(self):
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.peak_rss_mb = 0.0
+        self.children = 0
+        # Exit code of the first child to fail, else of the last reaped.
+        self.exit_code = None
+
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.monotonic()
+        _METERS.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _METERS.remove(self)
+        self.wall_s = time.monotonic() - self._start
+
+    def usage(self) -> dict:
+        return {
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "peak_rss_mb": self.peak_rss_mb,
+            "children": self.children,
+            "exit_code": self.exit_code,
+        }
+
+
+_METERS: list[Meter] = list()
+
+
+def meter() -> Meter:
+    return Meter()
+
+
+def _charge(
+    cpu_s: float = 0.0,
+    rss_mb: float = 0.0,
+    children: int = 0,
+    exit_code: int | None = None,
+):
+    for m in _METERS:
+        m.cpu_s += cpu_s
+        m.peak_rss_mb = max(m.peak_rss_mb, rss_mb)
+        m.children += children
+        if exit_code is not None and not m.exit_code:
+            m.exit_code = exit_code
+
+
+class Popen(subprocess.Popen):
+    """subprocess.Popen that reaps its child with wait4(2).
+
+    The child's CPU time and peak RSS (ru_maxrss) are charged to the active
+    meters when it is waited for (wait(), communicate() or leaving a 'with'
+    block). A child reaped by poll() alone is not accounted for.
+    """
+
+    def wait(self, timeout=None):
+        if self.returncode is not None:
+            return self.returncode
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flags = 0 if timeout is None else os.WNOHANG
+        while True:
+            try:
+                (pid, sts, ru) = os.wait4(self.pid, flags)
+            except ChildProcessError:
+                # Reaped elsewhere (e.g. SIGCHLD ignored); defer to Popen.
+                return super().wait(timeout)
+
+            if pid == self.pid:
+                break
+            if time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(0.01)
+
+        self.returncode = os.waitstatus_to_exitcode(sts)
+        # ru_maxrss is in KiB on Linux.
+        _charge(ru.ru_utime + ru.ru_stime, ru.ru_maxrss / 1024, 1, self.returncode)
+        return self.returncode
+
+
+def run(args, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run() for metered children (no input or timeout)."""
+    if kwargs.pop("capture_output", False):
+        kwargs.update(stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    with Popen(args, **kwargs) as p:
+        (stdout, stderr) = p.communicate()
+
+    return subprocess.CompletedProcess(args, p.returncode, stdout, stderr)
+
+
+def peak_rss_mb(pid: int) -> float | None:
+    """High-water mark of a live process' resident set (VmHWM), in MiB."""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def sample(pid: int) -> None:
+    """Charge the peak RSS of a long-lived child to the active meters.
+
+    For processes that outlive the meter (e.g. a tool session shared by many
+    jobs), whose rusage would otherwise only be seen when they exit.
+    """
+    if (rss := peak_rss_mb(pid)) is not None:
+        _charge(rss_mb=rss)
@@ -25,11 +25,14 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
+import functools
 import pathlib
 import os
 import re
 import typing
 import tempfile
+import hashlib
+import json
 
 from .env import PROJECT_ROOT
 
@@ -90,15 +93,268 @@ for i, f in enumerate(_INCLUDE_FILES):
 
 _ABC_EXE = os.environ.get("ABC_EXE", None)
 
+# Shared rendered-RTL root; one tree per design, reused by every job.
+_RENDER_ROOT = pathlib.Path(os.environ.get("RTL_RENDER_DIR", "build/rtl")).resolve()
+
+# PLA rendering backend: "abc" (external ABC), "espresso" (in-process) or
+# "none" (leave PLA regions as comments).
+_PLA_BACKEND = os.environ.get("PLA_BACKEND", "abc" if _ABC_EXE else "espresso")
+
+# Render all (uncached) PLA regions of a tree in a single ABC invocation.
+_ABC_BATCH = os.environ.get("ABC_BATCH", "1") != "0"
+
+# Rendered PLA cache location and size bound
+_PLA_CACHE_DIR = pathlib.Path(
+    os.environ.get("PLA_CACHE_DIR", pathlib.Path.home() / ".cache" / "c" / "pla")
+)
+_PLA_CACHE_MAX_BYTES = int(os.environ.get("PLA_CACHE_MAX_BYTES", 16 << 20))
+
+
+class PLACache:
+    """On-disk cache of rendered PLA regions.
+
+    Entries are keyed by the normalized cube set and I/O token mappings of a
+    region (plus the renderer identity), so identical tables rendered into
+    different build directories, or by different runs, hit the same entry.
+    The cache is bounded in total size; least-recently-used entries are
+    evicted first.
+    """
+
+    def __init__(self, root: pathlib.Path, max_bytes: int):
+        self._root = root
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> list[str] | None:
+        path = self._root / f"{key}.json"
+        try:
+            with open(path, "r") as f:
+                lines = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        # Touch on access; eviction is by modification time.
+        os.utime(path)
+        self.hits += 1
+        return lines
+
+    def put(self, key: str, lines: list[str]) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self._root, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(lines, f)
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, self._root / f"{key}.json")
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._root.glob("*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+_PLA_CACHE = PLACache(_PLA_CACHE_DIR, _PLA_CACHE_MAX_BYTES)
+
+
+def pla_cache_stats() -> dict[str, int]:
+    """Hit/miss counters of the rendered PLA cache in this process."""
+    return {"hits": _PLA_CACHE.hits, "misses": _PLA_CACHE.misses}
+
 
 class PLARenderer:
-    def __init__(self, pla_region: list[str]):
+    def __init__(
+        self,
+        pla_region: list[str],
+        cache: PLACache | None = _PLA_CACHE,
+        backend: str = _PLA_BACKEND,
+    ):
         self._i_token_mappings = list()
         self._o_token_mappings = list()
         self._terms = list()
         self._pla_region = pla_region
+        self._cache = cache
+        self._backend = backend
+        self._parsed = False
 
     def render(self) -> list[str]:
+        if (lines := self.lookup()) is not None:
+            return lines
+
+        render = {
+            "abc": self._render_abc,
+            "espresso": self._render_espresso,
+        }[self._backend]
+
+        from . import trace
+
+        with trace.span("pla_render", backend=self._backend):
+            lines = render()
+        self.store(lines)
+        return lines
+
+    def lookup(self) -> list[str] | None:
+        """Parse the region and return its cached rendering, if any."""
+        self._parse()
+
+        if self._cache is None:
+            return None
+        return self._cache.get(self._cache_key())
+
+    def store(self, lines: list[str]) -> None:
+        if self._cache is not None:
+            self._cache.put(self._cache_key(), lines)
+
+    @staticmethod
+    def render_abc_batch(renderers: list["PLARenderer"]) -> list[list[str]]:
+        """Render several parsed regions with one ABC invocation.
+
+        The regions are merged into a single multi-output PLA whose signals
+        are namespaced per region ('pla<k>__<name>'). Each region's inputs are
+        don't-care in every other region's cubes, so ABC derives each output
+        from its own region alone, and the emitted assigns are split back by
+        namespace. Regions between which ABC nonetheless shares logic are
+        rendered on their own, so that every net has a single driver.
+        """
+        if not renderers:
+            return []
+
+        def _prefix(k: int) -> str:
+            return f"pla{k}__"
+
+        i_n = sum(len(r._i_token_mappings) for r in renderers)
+        o_n = sum(len(r._o_token_mappings) for r in renderers)
+
+        with (
+            tempfile.NamedTemporaryFile(mode="w+", delete=False) as cmdfile,
+            tempfile.NamedTemporaryFile(mode="w+", delete=False) as scriptfile,
+            tempfile.NamedTemporaryFile(delete=False) as verilogfile,
+        ):
+            cmdfile.write(f".i {i_n}\n")
+            cmdfile.write(f".o {o_n}\n")
+
+            ins = " ".join(
+                _prefix(k) + m[1]
+                for k, r in enumerate(renderers)
+                for m in r._i_token_mappings
+            )
+            cmdfile.write(f".ilb {ins}\n")
+
+            outs = " ".join(
+                _prefix(k) + m[1]
+                for k, r in enumerate(renderers)
+                for m in r._o_token_mappings
+            )
+            cmdfile.write(f".ob {outs}\n")
+
+            i_offset = o_offset = 0
+            for r in renderers:
+                i_w = len(r._i_token_mappings)
+                o_w = len(r._o_token_mappings)
+                for i_cube, o_cube in r._terms:
+                    i_pad = "-" * i_offset + i_cube + "-" * (i_n - i_offset - i_w)
+                    o_pad = "0" * o_offset + o_cube + "0" * (o_n - o_offset - o_w)
+                    cmdfile.write(f"{i_pad} {o_pad}\n")
+                i_offset += i_w
+                o_offset += o_w
+
+            cmdfile.write(".e\n")
+            cmdfile.flush()
+
+            renderers[0]._write_abc_script(scriptfile, cmdfile.name, verilogfile.name)
+            scriptfile.flush()
+
+            if not renderers[0]._invoke_abc(scriptfile.name):
+                raise RuntimeError("ABC invocation failed.")
+
+            with open(verilogfile.name, "r") as synthesized_verilog:
+                assigns = [
+                    (m.group(1), m.group(2), line)
+                    for line in synthesized_verilog.readlines()
+                    if (m := re.match(r"\s*assign\s+(\S+)\s*=(.*)", line))
+                ]
+
+        # Split assigns back to their regions by namespace. Internal nets that
+        # ABC introduces (e.g. 'new_n12_') carry none; each follows the
+        # region(s) whose assigns read it, directly or through other nets.
+        namespaced = re.compile(r"pla(\d+)__")
+        internal = {lhs: rhs for lhs, rhs, _ in assigns if not namespaced.match(lhs)}
+        regions: dict[str, set[int]] = {lhs: set() for lhs in internal}
+
+        def _claim(k: int, rhs: str) -> None:
+            for net in re.findall(r"[A-Za-z_][\w$]*", rhs):
+                if net in internal and k not in regions[net]:
+                    regions[net].add(k)
+                    _claim(k, internal[net])
+
+        for lhs, rhs, _ in assigns:
+            if m := namespaced.match(lhs):
+                k = int(m.group(1))
+                regions[lhs] = {k}
+                _claim(k, rhs)
+
+        # A net claimed by several regions would be emitted, and driven, in
+        # each; a region reading another's namespace would not stand alone.
+        tangled = set()
+        for lhs, rhs, _ in assigns:
+            owners = regions[lhs] | {int(k) for k in namespaced.findall(rhs)}
+            if len(owners) > 1:
+                tangled |= owners
+
+        per_region: list[list[str]] = [list() for _ in renderers]
+        for lhs, _, line in assigns:
+            for k in sorted(regions[lhs]):
+                per_region[k].append(line.replace(_prefix(k), ""))
+
+        return [
+            r._render_abc() if k in tangled else r._render_verilog(lines)
+            for k, (r, lines) in enumerate(zip(renderers, per_region))
+        ]
+
+    def inputs(self) -> list[str]:
+        return [orig for orig, _ in self._i_token_mappings]
+
+    def outputs(self) -> list[str]:
+        return [orig for orig, _ in self._o_token_mappings]
+
+    def terms(self) -> list[tuple[str, str]]:
+        return list(self._terms)
+
+    def _cache_key(self) -> str:
+        renderer = _renderer(self._backend)
+
+        h = hashlib.sha256()
+        h.update(
+            json.dumps(
+                {
+                    "renderer": renderer,
+                    "i": self._i_token_mappings,
+                    "o": self._o_token_mappings,
+                    "terms": sorted(set(self._terms)),
+                }
+            ).encode()
+        )
+        return h.hexdigest()
+
+    def _parse(self) -> None:
+        if self._parsed:
+            return
+        self._parsed = True
 
         for line in self._remove_encapsulation(self._pla_region):
             if line.startswith(".i"):
@@ -114,6 +370,7 @@ class PLARenderer:
             else:
                 pass
 
+    def _render_abc(self) -> list[str]:
         with (
             tempfile.NamedTemporaryFile(mode="w+", delete=False) as cmdfile,
             tempfile.NamedTemporaryFile(mode="w+", delete=False) as scriptfile,
@@ -135,10 +392,50 @@ class PLARenderer:
             with open(verilogfile.name, "r") as synthesized_verilog:
                 return self._render_verilog(synthesized_verilog)
 
+    def _render_espresso(self) -> list[str]:
+        from .espresso import cube_from_str, minimize
+
+        n = len(self._i_token_mappings)
+
+        out = list()
+        for j, (o_name, _) in enumerate(self._o_token_mappings):
+            on = [cube_from_str(i) for i, o in self._terms if o[j] == "1"]
+            dc = [cube_from_str(i) for i, o in self._terms if o[j] == "-"]
+            cover = minimize(on, n, dc)
+            out.append(f"assign {o_name} = {self._render_sop(cover)};\n")
+
+        return out
+
+    def _render_sop(self, cover: list[int]) -> str:
+        n = len(self._i_token_mappings)
+
+        if not cover:
+            return "1'b0"
+
+        terms = list()
+        for c in cover:
+            literals = list()
+            # Column j of the cube is input variable (n - 1 - j).
+            for j, (i_name, _) in enumerate(self._i_token_mappings):
+                field = (c >> (2 * (n - 1 - j))) & 3
+                if field == 0b10:
+                    literals.append(i_name)
+                elif field == 0b01:
+                    literals.append(f"~{i_name}")
+
+            if not literals:
+                return "1'b1"
+            elif len(literals) == 1:
+                terms.append(literals[0])
+            else:
+                terms.append("(" + " & ".join(literals) + ")")
+
+        return " | ".join(terms)
+
     def _render_verilog(self, synthesized_verilog) -> list[str]:
         out = list()
 
-        for line in synthesized_verilog.readlines():
+        for line in synthesized_verilog:
             if "assign" not in line:
                 continue
 
@@ -212,10 +509,11 @@ class PLARenderer:
         scriptfile.write(f"read_pla {cmdfilename}\n")
         scriptfile.write(f"write_verilog {verilogfilename}\n")
 
-    def _invoke_abc(self, scriptfilename) -> None:
-        import subprocess
+    def _invoke_abc(self, scriptfilename) -> bool:
+        from . import proc, trace
 
-        cp = subprocess.run([_ABC_EXE, "-f", scriptfilename])
+        with trace.span("abc"):
+            cp = proc.run([_ABC_EXE, "-f", scriptfilename])
         return cp.returncode == 0
 
 
@@ -230,15 +528,16 @@ def _compute_src_list(project: str) -> list[pathlib.Path]:
     return file_list
 
 
-def _render_pass_abc(i: typing.TextIO, o: typing.TextIO) -> None:
-    out_render = list()
+def _split_pla_regions(lines: list[str]) -> list[str | PLARenderer]:
+    # Split a source into verbatim lines and (unrendered) PLA regions.
+    segments: list[str | PLARenderer] = list()
     in_pla_region = False
-    pla_region = list()
+    pla_region: list[str] = list()
 
-    for line in i.readlines():
+    for line in lines:
 
         if re.search(r"PLA_END", line):
-            out_render.extend(PLARenderer(pla_region).render())
+            segments.append(PLARenderer(pla_region))
             in_pla_region = False
             pla_region = list()
 
@@ -249,9 +548,27 @@ def _render_pass_abc(i: typing.TextIO, o: typing.TextIO) -> None:
             in_pla_region = True
 
         else:
-            out_render.append(line)
+            segments.append(line)
 
-    o.write("".join(out_render))
+    return segments
+
+
+def _join_segments(segments: list[str | PLARenderer], rendered: dict) -> str:
+    out_render = list()
+    for segment in segments:
+        if isinstance(segment, PLARenderer):
+            out_render.extend(rendered[id(segment)])
+        else:
+            out_render.append(segment)
+    return "".join(out_render)
+
+
+def _render_pass_pla(i: typing.TextIO, o: typing.TextIO) -> None:
+    segments = _split_pla_regions(i.readlines())
+
+    rendered = {id(s): s.render() for s in segments if isinstance(s, PLARenderer)}
+
+    o.write(_join_segments(segments, rendered))
 
 
 def _render_pass(i: typing.TextIO, o: typing.TextIO) -> None:
@@ -263,41 +580,160 @@ def _render_pass(i: typing.TextIO, o: typing.TextIO) -> None:
     o.write("".join(out_render))
 
 
+def _write_atomic(dest: pathlib.Path, text: str) -> None:
+    # Write to a temporary file alongside the destination and move it into
+    # place, so that concurrent readers never observe a partial file.
+    with tempfile.NamedTemporaryFile(
+        mode="w", dir=dest.parent, prefix=f".{dest.name}.", delete=False
+    ) as o:
+        o.write(text)
+
+    os.chmod(o.name, 0o644)
+    os.replace(o.name, dest)
+
+
 def _render_one_file(src: pathlib.Path, dest: pathlib.Path) -> None:
-    with open(src, "r") as i, open(dest, "w") as o:
+    import io
 
-        if _ABC_EXE:
-            # Use ABC-based rendering pass
-            _render_pass_abc(i, o)
+    with open(src, "r") as i, io.StringIO() as o:
+
+        if _PLA_BACKEND != "none":
+            # Render embedded PLA regions (through ABC or in-process)
+            _render_pass_pla(i, o)
         else:
             # Otherwise, raw copy of source file
             _render_pass(i, o)
 
+        _write_atomic(dest, o.getvalue())
+
+
+def _render_files_abc_batch(pending: list[tuple[pathlib.Path, pathlib.Path]]) -> None:
+    # Collect every PLA region across all files, render the cache misses with
+    # a single ABC invocation, then emit each file.
+    files = list()
+    for src, dest in pending:
+        with open(src, "r") as i:
+            files.append((dest, _split_pla_regions(i.readlines())))
+
+    rendered = dict()
+    misses = list()
+    for _, segments in files:
+        for segment in segments:
+            if not isinstance(segment, PLARenderer):
+                continue
+            if (lines := segment.lookup()) is not None:
+                rendered[id(segment)] = lines
+            else:
+                misses.append(segment)
+
+    for segment, lines in zip(misses, PLARenderer.render_abc_batch(misses)):
+        segment.store(lines)
+        rendered[id(segment)] = lines
+
+    for dest, segments in files:
+        _write_atomic(dest, _join_segments(segments, rendered))
+
+
+@functools.cache
+def _espresso_digest() -> str:
+    # Covers minimized in-process are a function of the minimizer's source.
+    from . import espresso
+
+    with open(espresso.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _renderer(backend: str) -> list[str | None]:
+    # Identity of a PLA backend, for cache keys.
+    if backend == "abc":
+        return ["abc", _ABC_EXE]
+    if backend == "espresso":
+        return ["espresso", _espresso_digest()]
+    return [backend]
+
+
+def _render_key(src: pathlib.Path) -> str:
+    # A rendered file is a function of its source and the PLA renderer.
+    h = hashlib.sha256()
+    h.update(json.dumps([_renderer(_PLA_BACKEND), _ABC_BATCH]).encode())
+    with open(src, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+_MANIFEST = ".manifest.json"
+
 
 def _render_file_list(file_list: list[pathlib.Path], out_dir: pathlib.Path) -> list[pathlib.Path]:
+    import fcntl
+
     build_list = list()
 
     if not os.path.exists(out_dir):
         os.makedirs(out_dir, exist_ok=True)
 
-    for f in file_list:
-        dest_fn = (out_dir / f.name).resolve()
-        build_list.append(dest_fn)
-        _render_one_file(f, dest_fn)
+    # Serialize renders of the same tree across processes.
+    with open(out_dir / ".lock", "a") as lock:
+        fcntl.lockf(lock, fcntl.LOCK_EX)
+
+        try:
+            with open(out_dir / _MANIFEST, "r") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = dict()
+
+        pending = list()
+        for src in file_list:
+            dest_fn = (out_dir / src.name).resolve()
+            build_list.append(dest_fn)
+
+            # Skip files whose source and renderer are unchanged.
+            key = _render_key(src)
+            if manifest.get(src.name) == key and dest_fn.exists():
+                continue
+
+            pending.append((src, dest_fn))
+            manifest[src.name] = key
+
+        if _PLA_BACKEND == "abc" and _ABC_BATCH:
+            _render_files_abc_batch(pending)
+        else:
+            for src, dest_fn in pending:
+                _render_one_file(src, dest_fn)
+
+        if pending:
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=out_dir, prefix=f"{_MANIFEST}.", delete=False
+            ) as tmp:
+                json.dump(manifest, tmp, indent=2, sort_keys=True)
+            os.chmod(tmp.name, 0o644)
+            os.replace(tmp.name, out_dir / _MANIFEST)
+
+        fcntl.lockf(lock, fcntl.LOCK_UN)
 
     return build_list
 
 
 def render_rtl(
-    design: str, out_dir: pathlib.Path
+    design: str, out_dir: pathlib.Path | None = None
 ) -> tuple[list[pathlib.Path], list[pathlib.Path]]:
 
     if design not in _PROJECTS:
         raise ValueError(f"Unknown project '{design}'")
 
+    if out_dir is None:
+        # Rendering is independent of parameterization; share one tree.
+        out_dir = _RENDER_ROOT / design
+
+    # Tools run with their own cwd; hand them absolute paths only.
+    out_dir = out_dir.resolve()
+
+    from . import trace
+
     file_list = _compute_src_list(design)
 
-    build_list = _render_file_list(file_list, out_dir)
+    with trace.span("render_rtl", design=design):
+        build_list = _render_file_list(file_list, out_dir)
 
     include_dirs = set()
     include_dirs.add(out_dir)
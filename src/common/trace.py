@@ -0,0 +1,225 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Flow tracing.
+#
+# Enabled by setting FLOW_TRACE to a directory (synthesize --trace does so for
+# the whole sweep). Each process appends Chrome trace events for its spans to
+# its own JSONL file there; the files are merged into a Chrome/Perfetto
+# trace.json with a per-span summary by:
+#
+#   python -m common.trace DIR
+#
+# Spans record wall time and, for the tool processes spawned through
+# common.proc within them, child CPU time, peak RSS and exit code.
+
+import contextlib
+import json
+import os
+import pathlib
+import socket
+import threading
+import time
+
+# Directory of per-process event files; tracing is disabled when unset.
+TRACE_ENV = "FLOW_TRACE"
+
+_FILE = None
+_FILE_PID = None
+_LOCK = threading.Lock()
+
+
+def trace_dir() -> pathlib.Path | None:
+    if not (d := os.environ.get(TRACE_ENV)):
+        return None
+    return pathlib.Path(d)
+
+
+def enabled() -> bool:
+    return trace_dir() is not None
+
+
+def now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def _emit(event: dict) -> None:
+    global _FILE, _FILE_PID
+
+    with _LOCK:
+        # One file per process; forked workers must not share the parent's.
+        if _FILE is None or _FILE_PID != os.getpid():
+            d = trace_dir()
+            assert d is not None
+            d.mkdir(parents=True, exist_ok=True)
+            _FILE_PID = os.getpid()
+            _FILE = open(d / f"trace-{socket.gethostname()}-{_FILE_PID}.jsonl", "a")
+            _FILE.write(
+                json.dumps(
+                    {
+                        "ph": "M",
+                        "name": "process_name",
+                        "pid": _FILE_PID,
+                        "args": {"name": f"{socket.gethostname()}:{_FILE_PID}"},
+                    }
+                )
+                + "\n"
+            )
+
+        _FILE.write(json.dumps(event, default=str) + "\n")
+        _FILE.flush()
+
+
+def event(name: str, start_us: int, end_us: int, cat: str = "flow", **args) -> None:
+    """Record a completed span from explicit timestamps (microseconds)."""
+    if not enabled():
+        return
+
+    _emit(
+        {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(end_us - start_us, 0),
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args,
+        }
+    )
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str = "flow", **args):
+    """Trace the enclosed block; yields a dict of extra args to record."""
+    if not enabled():
+        yield dict()
+        return
+
+    from . import proc
+
+    extra: dict = dict()
+    start = now_us()
+    error = None
+    with proc.meter() as m:
+        try:
+            yield extra
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            end = now_us()
+            usage = m.usage()
+            event(
+                name,
+                start,
+                end,
+                cat=cat,
+                **args,
+                **extra,
+                child_cpu_s=usage["cpu_s"],
+                peak_rss_mb=usage["peak_rss_mb"],
+                exit_code=usage["exit_code"],
+                error=error,
+            )
+
+
+def load(d: pathlib.Path) -> list[dict]:
+    events = list()
+    for path in sorted(pathlib.Path(d).glob("trace-*.jsonl")):
+        with open(path, "r") as f:
+            for line in f:
+                # Tolerate a partial last line from a killed process.
+                with contextlib.suppress(json.JSONDecodeError):
+                    events.append(json.loads(line))
+    return events
+
+
+def export(d: pathlib.Path, out: pathlib.Path | None = None) -> pathlib.Path:
+    """Merge the per-process event files of d into one Chrome trace."""
+    out = out or pathlib.Path(d) / "trace.json"
+    events = sorted(load(d), key=lambda e: (e["ph"] != "M", e.get("ts", 0)))
+    with open(out, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return out
+
+
+def summary(events: list[dict]) -> str:
+    """Per-span table: count, wall time, child CPU, peak RSS and failures."""
+    rows: dict[str, dict] = dict()
+    for e in events:
+        if e["ph"] != "X":
+            continue
+        r = rows.setdefault(
+            e["name"],
+            {"n": 0, "wall": 0.0, "max": 0.0, "cpu": 0.0, "rss": 0.0, "fail": 0},
+        )
+        dur_s = e["dur"] / 1e6
+        args = e.get("args", {})
+        r["n"] += 1
+        r["wall"] += dur_s
+        r["max"] = max(r["max"], dur_s)
+        r["cpu"] += args.get("child_cpu_s") or 0.0
+        r["rss"] = max(r["rss"], args.get("peak_rss_mb") or 0.0)
+        r["fail"] += bool(args.get("exit_code") or args.get("error"))
+
+    header = (
+        f"{'span':<32} {'count':>6} {'wall s':>10} {'mean s':>8} {'max s':>8} "
+        f"{'cpu s':>10} {'rss MiB':>8} {'fail':>5}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, r in sorted(rows.items(), key=lambda x: -x[1]["wall"]):
+        lines.append(
+            f"{name:<32} {r['n']:>6} {r['wall']:>10.2f} {r['wall'] / r['n']:>8.2f} "
+            f"{r['max']:>8.2f} {r['cpu']:>10.2f} {r['rss']:>8.1f} {r['fail']:>5}"
+        )
+    return "\n".join(lines)
+
+
+def main(args: list[str] | None = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="common.trace",
+        description="Merge flow trace events into a Chrome trace and summarize.",
+    )
+    parser.add_argument("dir", type=pathlib.Path, help="FLOW_TRACE directory.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="Trace JSON (default: DIR/trace.json).",
+    )
+    opts = parser.parse_args(args)
+
+    out = export(opts.dir, opts.output)
+    print(summary(load(opts.dir)))
+    print(f"Trace written to {out}")
+
+
+if __name__ == "__main__":
+    main()
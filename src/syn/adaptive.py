@@ -0,0 +1,127 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+from itertools import combinations
+
+# Per-result metrics whose curves drive refinement.
+METRICS = ("area", "f_max_mhz")
+
+
+def _metric(row: dict, metric: str) -> float | None:
+    if metric == "area":
+        return row["comb_area"] + row["sequential_area"]
+    return row.get(metric)
+
+
+def _spanned(ws: list[int], lo: int, hi: int) -> list[tuple[int, int]]:
+    # Intervals of the global grid ws that lie between lo and hi.
+    inner = [w for w in ws if lo <= w <= hi]
+    return list(zip(inner, inner[1:]))
+
+
+def interval_scores(series: dict[str, list[dict]]) -> dict[tuple[int, int], float]:
+    """Refinement score of each interval between adjacent sampled W.
+
+    Two signals are combined, each normalized to [0, 1]:
+
+    - interpolation error: for every interior sample of a series, its distance
+      from the line through its neighbours, relative to the metric's range
+      across all series. The error is charged to the intervals on both sides.
+
+    - ranking change: the fraction of design pairs whose order by the metric
+      differs between the two ends of the interval, i.e. where curves cross.
+
+    The score of an interval is the maximum over series and metrics.
+    """
+    ws = sorted({r["params"]["W"] for s in series.values() for r in s})
+    scores = {iv: 0.0 for iv in zip(ws, ws[1:])}
+
+    for metric in METRICS:
+        values = {
+            name: {
+                r["params"]["W"]: v
+                for r in rows
+                if (v := _metric(r, metric)) is not None
+            }
+            for name, rows in series.items()
+        }
+
+        flat = [v for pts in values.values() for v in pts.values()]
+        if len(flat) < 2 or (span := max(flat) - min(flat)) <= 0:
+            continue
+
+        # Interpolation error
+        for pts in values.values():
+            xs = sorted(pts)
+            for a, b, c in zip(xs, xs[1:], xs[2:]):
+                lerp = pts[a] + (pts[c] - pts[a]) * (b - a) / (c - a)
+                err = abs(pts[b] - lerp) / span
+                for iv in _spanned(ws, a, b) + _spanned(ws, b, c):
+                    scores[iv] = max(scores[iv], err)
+
+        # Ranking changes
+        for w0, w1 in zip(ws, ws[1:]):
+            names = [n for n, pts in values.items() if w0 in pts and w1 in pts]
+            pairs = list(combinations(names, 2))
+            if not pairs:
+                continue
+
+            discordant = sum(
+                1
+                for p, q in pairs
+                if (values[p][w0] - values[q][w0]) * (values[p][w1] - values[q][w1]) < 0
+            )
+            scores[(w0, w1)] = max(scores[(w0, w1)], discordant / len(pairs))
+
+    return scores
+
+
+def refine(
+    series: dict[str, list[dict]],
+    threshold: float,
+    max_points: int,
+    min_step: int = 1,
+    exclude: set[int] | None = None,
+) -> list[int]:
+    """Next W points to sample, at most max_points of them.
+
+    The midpoint of each interval scoring above threshold is a candidate;
+    intervals narrower than 2 * min_step are not split further and W already
+    attempted (exclude) are not proposed again. Candidates are taken in
+    decreasing order of score.
+    """
+    exclude = exclude or set()
+
+    candidates = list()
+    for (w0, w1), score in interval_scores(series).items():
+        if score <= threshold or (w1 - w0) < 2 * min_step:
+            continue
+        if (w := (w0 + w1) // 2) in exclude:
+            continue
+        candidates.append((-score, w))
+
+    return sorted(w for _, w in sorted(candidates)[: max(max_points, 0)])
@@ -0,0 +1,300 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Flow runtime benchmark.
+#
+# Runs a fixed set of (design, params) points through the synthesis flow a
+# number of times and reports the wall time of each stage. Every repetition
+# runs cold, in a freshly spawned interpreter with its own (empty) rendered
+# RTL tree and PLA cache and with the synthesis/STA result cache disabled, so
+# that the flow itself is measured. Repetitions are interleaved across points
+# to spread drift of the machine evenly.
+#
+# A report can be compared against a saved baseline: per stage, the geometric
+# mean over points of the ratio of median runtimes, with a bootstrap
+# confidence interval that decides the verdict.
+#
+#   synthesize-bench -r 5 -o build/bench.json
+#   synthesize-bench -r 5 --baseline bench-main.json
+
+import json
+import math
+import os
+import pathlib
+import random
+import statistics
+import tempfile
+import time
+
+# Fixed benchmark points: small and large widths of every architecture.
+BENCH_POINTS = [
+    ("n", {"W": 8}),
+    ("n", {"W": 32}),
+    ("r", {"W": 32}),
+    ("s", {"W": 32}),
+    ("e", {"W": 32, "RADIX_N": 4}),
+    ("e", {"W": 64, "RADIX_N": 4}),
+]
+
+# Bootstrap resamples and confidence level of the comparison.
+_BOOTSTRAP_N = 2000
+_CONFIDENCE = 0.95
+
+
+def _point_name(design: str, params: dict) -> str:
+    return f"{design}_" + "_".join(f"{k}{v}" for k, v in params.items())
+
+
+def _run_point(job: tuple[str, dict], flow_kwargs: dict, work_dir: str) -> dict:
+    # Runs in a spawned interpreter; see _measure.
+    from .cli import _setup_worker, compute_stages
+    from .engine import JobEngine
+
+    os.chdir(work_dir)
+    _setup_worker()
+
+    usage = dict()
+    [state] = JobEngine(
+        stages=compute_stages(cache_dir=None, **flow_kwargs),
+        max_workers=1,
+        on_stage=lambda job, stage, u: usage.update({stage: u}),
+    ).run([job])
+    if state is None:
+        raise RuntimeError(f"Benchmark point {job} failed.")
+    return usage
+
+
+def _measure(job: tuple[str, dict], flow_kwargs: dict) -> dict:
+    import concurrent.futures
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as work_dir:
+        # Rendering knobs are read at import; a spawned interpreter picks up
+        # the private tree and cache from its environment.
+        env = {
+            "RTL_RENDER_DIR": str(pathlib.Path(work_dir) / "rtl"),
+            "PLA_CACHE_DIR": str(pathlib.Path(work_dir) / "pla"),
+        }
+        saved = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return executor.submit(_run_point, job, flow_kwargs, work_dir).result()
+        finally:
+            for k, v in saved.items():
+                if v is None:
+                    os.environ.pop(k, None)
+                else:
+                    os.environ[k] = v
+
+
+def run_benchmark(repetitions: int, flow_kwargs: dict) -> dict:
+    """Benchmark report: stage wall times of every point and repetition."""
+    import platform
+    from .cli import _tool_versions
+
+    samples: dict[str, dict[str, list[float]]] = dict()
+    for rep in range(repetitions):
+        for design, params in BENCH_POINTS:
+            name = _point_name(design, params)
+            print(f"[{rep + 1}/{repetitions}] {name}")
+
+            usage = _measure((design, params), flow_kwargs)
+            for stage, u in usage.items():
+                samples.setdefault(stage, {}).setdefault(name, []).append(u["wall_s"])
+            total = sum(u["wall_s"] for u in usage.values())
+            samples.setdefault("total", {}).setdefault(name, []).append(total)
+
+    return {
+        "created": time.time(),
+        "host": platform.node(),
+        "cpus": os.cpu_count(),
+        "tools": _tool_versions(),
+        "flow": flow_kwargs,
+        "repetitions": repetitions,
+        "points": [_point_name(d, p) for d, p in BENCH_POINTS],
+        "samples": samples,
+        "medians": {
+            stage: {p: statistics.median(v) for p, v in points.items()}
+            for stage, points in samples.items()
+        },
+    }
+
+
+def _geomean_ratio(current: dict, baseline: dict, pick) -> float:
+    logs = [
+        math.log(pick(current[p]) / pick(baseline[p]))
+        for p in current
+        if p in baseline and pick(baseline[p]) > 0 and pick(current[p]) > 0
+    ]
+    return math.exp(sum(logs) / len(logs)) if logs else math.nan
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float = 0.02, seed: int = 0
+) -> dict:
+    """Per-stage runtime ratio of current over baseline, with a verdict.
+
+    The ratio is the geometric mean over points of the ratio of median wall
+    times. Its confidence interval comes from resampling the repetitions of
+    every point, in both reports, with replacement. A stage is 'faster' or
+    'slower' only if the interval excludes 1 and the ratio differs from 1 by
+    more than threshold; otherwise 'no change'.
+    """
+    rng = random.Random(seed)
+
+    def _resample(values: list[float]) -> float:
+        return statistics.median(rng.choices(values, k=len(values)))
+
+    verdicts = dict()
+    for stage, points in current["samples"].items():
+        base = baseline["samples"].get(stage)
+        if not base:
+            continue
+
+        ratio = _geomean_ratio(points, base, statistics.median)
+        boot = sorted(
+            _geomean_ratio(points, base, _resample) for _ in range(_BOOTSTRAP_N)
+        )
+        alpha = (1 - _CONFIDENCE) / 2
+        lo = boot[int(alpha * (len(boot) - 1))]
+        hi = boot[int((1 - alpha) * (len(boot) - 1))]
+
+        if hi < 1 and ratio < 1 - threshold:
+            verdict = "faster"
+        elif lo > 1 and ratio > 1 + threshold:
+            verdict = "slower"
+        else:
+            verdict = "no change"
+
+        verdicts[stage] = {"ratio": ratio, "ci": [lo, hi], "verdict": verdict}
+
+    return verdicts
+
+
+def _print_report(report: dict) -> None:
+    print(f"{'stage':<12} {'point':<16} {'median s':>10} {'min s':>10} {'max s':>10}")
+    for stage, points in report["samples"].items():
+        for p, v in points.items():
+            print(
+                f"{stage:<12} {p:<16} {statistics.median(v):>10.3f} "
+                f"{min(v):>10.3f} {max(v):>10.3f}"
+            )
+
+
+def _print_comparison(verdicts: dict) -> None:
+    level = int(_CONFIDENCE * 100)
+    print(f"{'stage':<12} {'ratio':>8} {f'{level}% CI':>18}  verdict")
+    for stage, v in verdicts.items():
+        (lo, hi) = v["ci"]
+        print(
+            f"{stage:<12} {v['ratio']:>8.3f} {f'[{lo:.3f}, {hi:.3f}]':>18}  "
+            f"{v['verdict']}"
+        )
+
+
+def main(args: list[str] | None = None):
+    import argparse
+    from .cli import F_MAX_MODES
+
+    parser = argparse.ArgumentParser(
+        prog="synthesize-bench",
+        description="Benchmark the runtime of the synthesis flow stages.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repetitions",
+        type=int,
+        default=5,
+        help="Cold runs of every benchmark point (default: 5).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=pathlib.Path("build") / "bench.json",
+        help="JSON report (default: build/bench.json).",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        help="Report of a previous run to compare against.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.02,
+        help="Smallest relative change reported as faster/slower (default: 0.02).",
+    )
+    parser.add_argument(
+        "--f-max",
+        dest="f_max_mode",
+        choices=F_MAX_MODES.keys(),
+        default="slack",
+        help="f_max search of the benchmarked flow.",
+    )
+    parser.add_argument(
+        "--sta-session",
+        action="store_true",
+        help="Benchmark the flow with a persistent OpenSTA session.",
+    )
+    opts = parser.parse_args(args)
+
+    try:
+        from .cli import _setup_worker
+
+        _setup_worker()
+    except EnvironmentError as e:
+        print(f"Environment setup error: {e}")
+        return
+
+    flow_kwargs = {"f_max_mode": opts.f_max_mode, "sta_session": opts.sta_session}
+    report = run_benchmark(opts.repetitions, flow_kwargs)
+
+    opts.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(opts.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    _print_report(report)
+    print(f"Report written to {opts.output}")
+
+    if opts.baseline is not None:
+        with open(opts.baseline, "r") as f:
+            baseline = json.load(f)
+
+        if baseline.get("flow") != report["flow"]:
+            print(f"Warning: baseline flow differs: {baseline.get('flow')}")
+        if baseline.get("tools") != report["tools"]:
+            print(f"Warning: baseline tools differ: {baseline.get('tools')}")
+
+        _print_comparison(compare(report, baseline, threshold=opts.threshold))
+
+
+if __name__ == "__main__":
+    main()
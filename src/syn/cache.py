@@ -0,0 +1,120 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import contextlib
+import fcntl
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+
+
+@functools.cache
+def _file_digest_cached(path: str, mtime_ns: int, size: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_digest(path: pathlib.Path | str) -> str:
+    """SHA-256 of a file's contents, memoized on (path, mtime, size)."""
+    st = os.stat(path)
+    return _file_digest_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def compute_key(*parts) -> str:
+    """Digest of an ordered sequence of JSON-serializable key parts."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(json.dumps(part, sort_keys=True, default=str).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed store of tool results.
+
+    Entries live at <root>/<namespace>/<key[:2]>/<key>/ and hold a 'meta.json'
+    alongside any files produced by the tool. Entries are published by
+    renaming a fully-written temporary directory into place, and computing an
+    entry can be serialized across processes (and hosts, where the filesystem
+    supports POSIX locks) with lock(), so the root may be a shared directory.
+    """
+
+    _META = "meta.json"
+
+    def __init__(self, root: pathlib.Path | str):
+        self._root = pathlib.Path(root).resolve()
+
+    def _entry_dir(self, namespace: str, key: str) -> pathlib.Path:
+        return self._root / namespace / key[:2] / key
+
+    @contextlib.contextmanager
+    def lock(self, namespace: str, key: str):
+        lock_path = self._entry_dir(namespace, key).with_suffix(".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(lock_path, "a") as f:
+            fcntl.lockf(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(f, fcntl.LOCK_UN)
+
+    def get(self, namespace: str, key: str) -> tuple[dict, pathlib.Path] | None:
+        entry = self._entry_dir(namespace, key)
+        try:
+            with open(entry / self._META, "r") as f:
+                return (json.load(f), entry)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        meta: dict,
+        files: dict[str, pathlib.Path] | None = None,
+    ) -> None:
+        entry = self._entry_dir(namespace, key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = pathlib.Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+        try:
+            for name, src in (files or {}).items():
+                shutil.copyfile(src, tmp / name)
+            with open(tmp / self._META, "w") as f:
+                json.dump(meta, f, indent=2)
+            os.rename(tmp, entry)
+        except OSError:
+            # Entry published concurrently (or unwritable); keep existing.
+            shutil.rmtree(tmp, ignore_errors=True)
@@ -43,11 +43,40 @@ W_SWEEP = range(8, 64 + 1, 8)
 
 RADIX_SWEEP = [4]
 
+# Radices considered by the radix exploration (--explore-radix) of 'e'
+RADIX_RANGE = range(2, 8 + 1)
+
+# Initial grid of the adaptive sweep (--adaptive); points are added between
+# these where the curves bend or cross.
+W_COARSE = [8, 16, 32, 64]
+
+# Adaptive sweep defaults: refinement threshold (normalized score) and the
+# narrowest interval, in bits, that is split further.
+ADAPTIVE_THRESHOLD = 0.05
+ADAPTIVE_MIN_STEP = 2
+
+# ABC delay targets (ps) of the timing-driven Pareto sweep (--pareto); each
+# maps every job once more, in addition to the area-oriented default.
+ABC_DELAY_SWEEP_PS = [10000, 7500, 5000, 4000, 3000, 2500, 2000, 1500]
+
+# ABC recipe portfolio (--recipes): recipes still mapping after this many
+# times the runtime of the first to finish are cut off.
+RACE_BUDGET = 3.0
+
 # F_SWEEP_MHZ = [10, 30, 60, 100]
 F_SWEEP_MHZ = range(10, 200, 10)
 
+# Reference clock for slack-derived f_max
+F_REF_MHZ = 100
+
 BUILD_ROOT = pathlib.Path("build")
 
+# Sweep results database
+STORE_PATH = BUILD_ROOT / "results.db"
+
+# Default location of the synthesis/STA result cache
+CACHE_ROOT = pathlib.Path(os.environ.get("SYN_CACHE_DIR", BUILD_ROOT / "cache"))
+
 def _compute_dir(design: str, params: plist) -> pathlib.Path:
     dir_name = design
     for param, value in params.items():
@@ -62,8 +91,8 @@ def _compute_build_dir(design: str, params: plist) -> pathlib.Path:
 
 def _width_parameterization():
 
-    def _iterate_widths():
-        for w in W_SWEEP:
+    def _iterate_widths(widths=W_SWEEP):
+        for w in widths:
             yield dict([("W", w)])
 
     return _iterate_widths
@@ -71,8 +100,8 @@ def _width_parameterization():
 
 def _width_and_radix_parameterization():
 
-    def _iterate_widths_and_radix():
-        for w in W_SWEEP:
+    def _iterate_widths_and_radix(widths=W_SWEEP):
+        for w in widths:
             for r in RADIX_SWEEP:
                 yield dict([("W", w), ("RADIX_N", r)])
 
@@ -91,7 +120,7 @@ projects = {
 }
 
 
-def compute_jobs() -> Generator[tuple[str, plist]]:
+def compute_jobs(widths: list[int] | None = None) -> Generator[tuple[str, plist]]:
 
     # Validate project list
     if not all(x in projects for x in runlist):
@@ -101,106 +130,1419 @@ def compute_jobs() -> Generator[tuple[str, plist]]:
     for run_project in runlist:
         runlist_params = projects[run_project]
 
-        for params in runlist_params():
+        for params in runlist_params(*([] if widths is None else [widths])):
             yield (run_project, params)
 
 
-def run_job(design: str, params: plist, echo: bool = False) -> tuple[int, int, int]:
-    rtl_dir = _compute_rtl_dir(design, params)
+def _setup_worker() -> None:
+    # Tool locations are resolved per process; workers spawned by the job
+    # engine must not rely on globals inherited from the parent.
+    from .sta import setup_environment as setup_sta_environment
+    from .yosys import setup_environment as setup_yosys_environment
 
-    # Render RTL to destination directory.
-    (filelist, includedirs) = common.render_rtl(design, rtl_dir)
+    setup_sta_environment()
+    setup_yosys_environment()
+
+
+def _stage_render(
+    job: tuple[str, plist], state: dict, unique_top: bool = False
+) -> dict:
+    (design, params) = job
+
+    # Render RTL into the design's shared tree; only changed sources are
+    # re-rendered.
+    pla_before = common.pla_cache_stats()
+    (filelist, includedirs) = common.render_rtl(design)
+    pla_after = common.pla_cache_stats()
 
     # Render top-level file
     from .top import render_top
 
-    (top_path, top_module) = render_top(rtl_dir, design, params=params)
+    # Batched synthesis elaborates every parameterization of a design in one
+    # session, so each needs a distinct top-level module name.
+    kwargs = dict()
+    if unique_top:
+        kwargs["module_name"] = f"top_{_canonical_run_name(design, params)}"
+
+    (top_path, top_module) = render_top(
+        _compute_rtl_dir(design, params), design, params=params, **kwargs
+    )
     filelist.append(top_path)
 
-    try:
-        from .yosys import SynligRunner
+    state.update(
+        filelist=filelist,
+        includedirs=includedirs,
+        top_module=top_module,
+        pla_cache={k: pla_after[k] - pla_before[k] for k in pla_after},
+    )
+    return state
 
-        build_dir = _compute_build_dir(design, params)
-        os.makedirs(build_dir, exist_ok=True)
 
-        syn_v = (build_dir / "top_syn.v").resolve()
+def _open_cache(cache_dir: pathlib.Path | None):
+    if cache_dir is None:
+        return None
+
+    from .cache import ResultCache
+
+    return ResultCache(cache_dir)
+
+
+def _synlig_runner(
+    job: tuple[str, plist],
+    state: dict,
+    echo: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    mapping: str = "liberty",
+    abc_delay_ps: int | None = None,
+    abc_buffering: bool = False,
+):
+    (design, params) = job
+
+    from .yosys import SynligRunner
+
+    build_dir = _compute_build_dir(design, params)
+    if mapping != "liberty":
+        build_dir = build_dir.with_name(f"syn_{mapping}")
+    elif abc_delay_ps is not None:
+        suffix = "_buf" if abc_buffering else ""
+        build_dir = build_dir.with_name(f"syn_D{abc_delay_ps}{suffix}")
+    os.makedirs(build_dir, exist_ok=True)
+
+    state.update(syn_v=(build_dir / "top_syn.v").resolve())
+    if mapping == "liberty":
+        state.update(syn_json=(build_dir / "top_syn.json").resolve())
+
+    return SynligRunner(
+        path=build_dir,
+        sources=state["filelist"],
+        include_paths=state["includedirs"],
+        top=state["top_module"],
+        syn_v=state["syn_v"],
+        syn_json=state.get("syn_json"),
+        params=params,
+        echo=echo,
+        cache=_open_cache(cache_dir),
+        mapping=mapping,
+        delay_ps=abc_delay_ps,
+        buffering=abc_buffering,
+    )
+
+
+def _synlig_results(job: tuple[str, plist], state: dict, synlig) -> dict:
+    (design, params) = job
+
+    if synlig.cached():
+        print(f"{design} {params}: synthesis restored from cache")
+    total_area, sequential_area = synlig.area()
+
+    state.update(
+        total_area=total_area,
+        sequential_area=sequential_area,
+        stats=synlig.stats(),
+    )
+
+    if state.get("syn_json") is not None:
+        from .env import STDCELL_LIB_PATH
+        from .estimate import estimate
+
+        # Milliseconds; kept with every result to calibrate against STA.
+        state.update(
+            estimate=estimate(state["syn_json"], STDCELL_LIB_PATH, state["top_module"])
+        )
+    return state
+
 
-        # Run synthesis on top-level
-        synlig = SynligRunner(
+def _stage_synthesize(
+    job: tuple[str, plist],
+    state: dict,
+    echo: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    mapping: str = "liberty",
+    abc_delay_ps: int | None = None,
+    abc_buffering: bool = False,
+) -> dict:
+    # Run synthesis on top-level
+    synlig = _synlig_runner(
+        job,
+        state,
+        echo=echo,
+        cache_dir=cache_dir,
+        mapping=mapping,
+        abc_delay_ps=abc_delay_ps,
+        abc_buffering=abc_buffering,
+    )
+    synlig.run()
+
+    return _synlig_results(job, state, synlig)
+
+
+def _stage_synthesize_batch(
+    jobs: list[tuple[str, plist]],
+    states: list[dict],
+    echo: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    mapping: str = "liberty",
+    abc_delay_ps: int | None = None,
+    abc_buffering: bool = False,
+) -> list[dict]:
+    from .yosys import SynligBatchRunner
+
+    (design, _) = jobs[0]
+
+    runners = [
+        _synlig_runner(
+            job,
+            state,
+            echo=echo,
+            cache_dir=cache_dir,
+            mapping=mapping,
+            abc_delay_ps=abc_delay_ps,
+            abc_buffering=abc_buffering,
+        )
+        for job, state in zip(jobs, states)
+    ]
+
+    # Run synthesis on all top-levels of the design in one session
+    SynligBatchRunner(
+        path=(BUILD_ROOT / f"{design}_batch").resolve(),
+        runners=runners,
+        echo=echo,
+    ).run()
+
+    return [
+        _synlig_results(job, state, synlig)
+        for job, state, synlig in zip(jobs, states, runners)
+    ]
+
+
+def _stage_synthesize_portfolio(
+    job: tuple[str, plist],
+    state: dict,
+    recipes: list[str],
+    echo: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    race_budget: float = RACE_BUDGET,
+) -> dict:
+    from .yosys import SynligPortfolioRunner, SynligRunner
+
+    (design, params) = job
+
+    portfolio_dir = _compute_build_dir(design, params).with_name("syn_portfolio")
+
+    runners = dict()
+    for recipe in recipes:
+        build_dir = portfolio_dir / recipe
+        os.makedirs(build_dir, exist_ok=True)
+        runners[recipe] = SynligRunner(
             path=build_dir,
-            sources=filelist,
-            include_paths=includedirs,
-            top=top_module,
-            syn_v=syn_v,
+            sources=state["filelist"],
+            include_paths=state["includedirs"],
+            top=state["top_module"],
+            syn_v=(build_dir / "top_syn.v").resolve(),
+            params=params,
             echo=echo,
+            cache=_open_cache(cache_dir),
+            recipe=recipe,
+        )
+
+    # Map with every recipe at once from a single elaboration
+    portfolio = SynligPortfolioRunner(
+        path=portfolio_dir, runners=runners, budget=race_budget, echo=echo
+    )
+    portfolio.run()
+
+    state.update(
+        recipes={
+            recipe: {
+                "status": status,
+                "runtime_s": portfolio.runtime()[recipe],
+                "syn_v": runners[recipe]._syn_v,
+                "stats": runners[recipe].stats(),
+            }
+            for recipe in recipes
+            if (status := portfolio.status().get(recipe)) is not None
+        }
+    )
+    return state
+
+
+def _sta_probe(design: str, params: plist, state: dict, f_mhz: float, **kwargs):
+    from .sta import OpenSTARunner
+
+    sta = OpenSTARunner(
+        path=state["syn_v"].parent,
+        frequency=f_mhz,
+        top=state["top_module"],
+        syn_v=state["syn_v"],
+        **kwargs,
+    )
+    sta.run()
+
+    # The worst path is structurally the same at any period; the report of
+    # the last probe (at f_max on success) is kept for path extraction.
+    state.update(sta_report=sta.report())
+    return sta
+
+
+def _f_max_scan(design: str, params: plist, state: dict, **kwargs) -> float | None:
+    for f_mhz in reversed(F_SWEEP_MHZ):
+        sta = _sta_probe(design, params, state, f_mhz, **kwargs)
+        if sta.passed():
+            print(f"{design} {params}: timing passed at {f_mhz} MHz")
+            return f_mhz
+
+    return None
+
+
+def _f_max_slack(design: str, params: plist, state: dict, **kwargs) -> float | None:
+    import math
+
+    # Single probe at the reference clock; the worst path's slack gives the
+    # minimum period directly.
+    sta = _sta_probe(design, params, state, F_REF_MHZ, **kwargs)
+    if (period_ns := sta.min_period()) is None or period_ns <= 0:
+        print(f"{design} {params}: no timing path reported, falling back to scan")
+        return _f_max_scan(design, params, state, **kwargs)
+
+    # Round up to the SDC resolution (1ps) so that the verification run sees
+    # exactly the period that was derived.
+    period_ns = math.ceil(period_ns * 1000) / 1000
+    f_max = 1000 / period_ns
+
+    # Confirm with one verification run at the derived frequency.
+    if not _sta_probe(design, params, state, f_max, **kwargs).passed():
+        print(f"{design} {params}: derived f_max {f_max:.2f} MHz failed "
+              "verification, falling back to scan")
+        return _f_max_scan(design, params, state, **kwargs)
+
+    print(f"{design} {params}: timing passed at {f_max:.2f} MHz")
+    return f_max
+
+
+F_MAX_MODES = {
+    "slack": _f_max_slack,
+    "scan": _f_max_scan,
+}
+
+
+def _corner_f_max(
+    design: str, params: plist, state: dict, corners: list[str], **kwargs
+) -> dict[str, float | None]:
+    import math
+    from .env import CORNERS
+    from .sta import OpenSTARunner
+
+    # All corners are timed in one OpenSTA run at the reference clock; each
+    # corner's slack gives its minimum period as for the primary f_max.
+    sta = OpenSTARunner(
+        path=state["syn_v"].parent,
+        frequency=F_REF_MHZ,
+        top=state["top_module"],
+        syn_v=state["syn_v"],
+        corners={name: CORNERS[name] for name in corners},
+        **kwargs,
+    )
+    sta.run()
+
+    f_max: dict[str, float | None] = dict()
+    for name in corners:
+        period_ns = sta.corner_min_periods().get(name)
+        if period_ns is None or period_ns <= 0:
+            f_max[name] = None
+            continue
+        f_max[name] = 1000 / (math.ceil(period_ns * 1000) / 1000)
+
+    summary = ", ".join(
+        f"{name} {'-' if f is None else f'{f:.2f}'}" for name, f in f_max.items()
+    )
+    print(f"{design} {params}: f_max by corner (MHz): {summary}")
+    return f_max
+
+
+def _stage_sta(
+    job: tuple[str, plist],
+    state: dict,
+    echo: bool = False,
+    f_max_mode: str = "slack",
+    sta_session: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    corners: list[str] | None = None,
+) -> dict:
+    (design, params) = job
+
+    sta_kwargs = dict(echo=echo, cache=_open_cache(cache_dir))
+    if sta_session:
+        from .sta import get_session
+
+        # One OpenSTA process per worker, shared by every probe it runs.
+        sta_kwargs.update(session=get_session())
+
+    # Run timing on top-level
+    f_max = F_MAX_MODES[f_max_mode](design, params, state, **sta_kwargs)
+
+    from .paths import critical_path
+
+    report = state.pop("sta_report", None)
+    path = None
+    if report is not None:
+        path = critical_path(report, state["syn_v"], state["filelist"])
+
+    state.update(f_max=f_max, critical_path=path)
+
+    if corners:
+        if sta_session:
+            from .env import CORNERS
+
+            sta_kwargs.update(
+                session=get_session({name: CORNERS[name] for name in corners})
+            )
+        state.update(
+            f_max_corners=_corner_f_max(design, params, state, corners, **sta_kwargs)
         )
-        synlig.run()
-        total_area, sequential_area = synlig.area()
-
-        # Run timing on top-level
-        from .sta import OpenSTARunner
-
-        f_max = None
-        for f_mhz in reversed(F_SWEEP_MHZ):
-            sta = OpenSTARunner(
-                path=build_dir,
-                frequency=f_mhz,
-                top=top_module,
-                syn_v=syn_v,
-                echo=echo,
+    return state
+
+
+def _stage_sta_portfolio(
+    job: tuple[str, plist],
+    state: dict,
+    objective: str = "area",
+    **kwargs,
+) -> dict:
+    (design, params) = job
+
+    # Time every mapped recipe as if it were the job's only netlist.
+    qor = list()
+    for recipe, r in state["recipes"].items():
+        entry = {"recipe": recipe, "status": r["status"], "runtime_s": r["runtime_s"]}
+        if r["status"] in ("done", "cached"):
+            print(f"{design} {params}: timing recipe {recipe}")
+            stats = r["stats"]
+            sub = _stage_sta(job, dict(state, syn_v=r["syn_v"]), **kwargs)
+            entry.update(
+                total_area=stats["total_area"],
+                sequential_area=stats["sequential_area"],
+                cell_count=stats["cell_count"],
+                f_max_mhz=sub["f_max"],
+                f_max_corners=sub.get("f_max_corners"),
+                critical_path=sub["critical_path"],
             )
-            sta.run()
-            if sta.passed():
-                print(f"Timing passed at {f_mhz} MHz")
-                f_max = f_mhz
-                break
+        qor.append(entry)
+
+    # Best by area (ties to f_max) or by f_max (ties to area); a recipe that
+    # met no clock loses to any that did.
+    def _rank(e: dict):
+        f_max = e["f_max_mhz"] or 0.0
+        if objective == "f_max":
+            return (-f_max, e["total_area"])
+        return (e["f_max_mhz"] is None, e["total_area"], -f_max)
+
+    mapped = [e for e in qor if "total_area" in e]
+    if not mapped:
+        raise RuntimeError(f"{design} {params}: no ABC recipe completed")
+    best = min(mapped, key=_rank)
+    print(f"{design} {params}: best recipe by {objective}: {best['recipe']}")
+
+    r = state["recipes"][best["recipe"]]
+    state.update(
+        syn_v=r["syn_v"],
+        stats=r["stats"],
+        total_area=r["stats"]["total_area"],
+        sequential_area=r["stats"]["sequential_area"],
+        f_max=best["f_max_mhz"],
+        f_max_corners=best["f_max_corners"],
+        critical_path=best.pop("critical_path"),
+        abc_recipe=best["recipe"],
+        abc_recipes=[{k: v for k, v in e.items() if k != "critical_path"} for e in qor],
+    )
+    return state
+
+
+def compute_stages(
+    echo: bool = False,
+    f_max_mode: str = "slack",
+    sta_session: bool = False,
+    cache_dir: pathlib.Path | None = None,
+    synlig_batch: bool = False,
+    mapping: str = "liberty",
+    corners: list[str] | None = None,
+    abc_delay_ps: int | None = None,
+    abc_buffering: bool = False,
+    recipes: list[str] | None = None,
+    recipe_objective: str = "area",
+    race_budget: float = RACE_BUDGET,
+    sta: bool = True,
+) -> list:
+    from functools import partial
+
+    sta_kwargs: dict = dict(
+        echo=echo,
+        f_max_mode=f_max_mode,
+        sta_session=sta_session,
+        cache_dir=cache_dir,
+        corners=corners,
+    )
+
+    if recipes:
+        # The portfolio races recipes on one job; STA picks the winner.
+        return [
+            ("render", _stage_render),
+            (
+                "synthesize",
+                partial(
+                    _stage_synthesize_portfolio,
+                    recipes=recipes,
+                    echo=echo,
+                    cache_dir=cache_dir,
+                    race_budget=race_budget,
+                ),
+            ),
+            (
+                "sta",
+                partial(_stage_sta_portfolio, objective=recipe_objective, **sta_kwargs),
+            ),
+        ]
+
+    synthesis_kwargs: dict = dict(
+        echo=echo,
+        cache_dir=cache_dir,
+        mapping=mapping,
+        abc_delay_ps=abc_delay_ps,
+        abc_buffering=abc_buffering,
+    )
+    synthesize: tuple
+    if synlig_batch:
+        # One grouped stage per design; the engine holds each job at the
+        # barrier until all parameterizations of its design are rendered.
+        synthesize = (
+            "synthesize",
+            partial(_stage_synthesize_batch, **synthesis_kwargs),
+            _job_design,
+        )
+    else:
+        synthesize = ("synthesize", partial(_stage_synthesize, **synthesis_kwargs))
+
+    stages = [
+        ("render", partial(_stage_render, unique_top=synlig_batch)),
+        synthesize,
+    ]
+
+    # Generic gates carry no timing; such flows stop after synthesis.
+    if mapping != "liberty" or not sta:
+        return stages
+
+    return stages + [("sta", partial(_stage_sta, **sta_kwargs))]
+
+
+def _job_design(job: tuple[str, plist]) -> str:
+    return job[0]
+
+
+def _run_stages(job: tuple[str, plist], **kwargs) -> dict:
+    # Run every stage of a single job in the calling process.
+    state: dict = dict()
+    for stage in compute_stages(**kwargs):
+        if len(stage) < 3:
+            state = stage[1](job, state)
+        else:
+            [state] = stage[1]([job], [state])
+    return state
+
+
+def run_job(design: str, params: plist, **kwargs) -> tuple[int, int, float]:
+    state = _run_stages((design, params), **kwargs)
+
+    return (state["total_area"], state["sequential_area"], state["f_max"])
+
+
+def _canonical_run_name(project: str, params: plist) -> str:
+    return f"{project}_" + "_".join(
+        f"{param}{value}" for param, value in params.items()
+    )
+
+
+def _collect(job: tuple[str, plist], state: dict) -> dict:
+    (project, params) = job
+
+    stats = state["stats"]
+    return {
+        "name": _canonical_run_name(project, params),
+        "design": project,
+        "params": params,
+        "comb_area": (state["total_area"] - state["sequential_area"]),
+        "sequential_area": state["sequential_area"],
+        "f_max_mhz": state["f_max"],
+        "cell_count": stats["cell_count"],
+        "wire_count": stats["wire_count"],
+        "cells": stats["cells"],
+        "critical_path": state.get("critical_path"),
+        "f_max_corners": state.get("f_max_corners"),
+        "abc_recipe": state.get("abc_recipe"),
+        "abc_recipes": state.get("abc_recipes"),
+        "estimate": state.get("estimate"),
+    }
+
+
+def _tool_versions() -> dict:
+    from .sta import opensta_version
+    from .yosys import synlig_version
+
+    return {"synlig": synlig_version(), "opensta": opensta_version()}
+
+
+def _flow_options(opts) -> dict:
+    from .env import STDCELL_LIB_PATH
+
+    flow = {"liberty": STDCELL_LIB_PATH.name, "f_max_mode": opts.f_max_mode}
+    if opts.f_max_mode == "slack":
+        flow.update(f_ref_mhz=F_REF_MHZ)
+    else:
+        flow.update(f_sweep_mhz=list(F_SWEEP_MHZ))
+    if corners := getattr(opts, "corners", None):
+        flow.update(corners=corners)
+    if recipes := getattr(opts, "recipes", None):
+        flow.update(
+            abc_recipes=recipes,
+            recipe_objective=opts.recipe_objective,
+            race_budget=opts.race_budget,
+        )
+    return flow
+
+
+def _explore_radix(opts, store, run, rows, tools: dict, flow: dict) -> None:
+    from .cache import compute_key
+    from .engine import JobEngine
+    from .explore import OBJECTIVES, pareto_front, successive_halving
+
+    design = "e"
+    objective = OBJECTIVES[opts.objective]
+
+    # Candidates are (W, RADIX_N) pairs competing within their W.
+    def _job(c: tuple[int, int]) -> tuple[str, plist]:
+        return (design, dict([("W", c[0]), ("RADIX_N", c[1])]))
+
+    def _key(params: plist) -> tuple[int, int]:
+        return (int(params["W"]), int(params["RADIX_N"]))
 
-        return (total_area, sequential_area, f_max)
+    def _generic_rung(candidates: list) -> dict:
+        # Cheap pass: map to generic gates only and rank by cell count.
+        counts = dict()
 
-    except:
-        pass
+        def _on_complete(job: tuple[str, plist], state: dict | None) -> None:
+            if state is not None:
+                counts[_key(job[1])] = state["stats"]["cell_count"]
 
+        JobEngine(
+            stages=compute_stages(
+                echo=opts.echo,
+                cache_dir=opts.cache_dir,
+                synlig_batch=opts.synlig_batch,
+                mapping="generic",
+            ),
+            max_workers=opts.jobs,
+            initializer=_setup_worker,
+            on_complete=_on_complete,
+        ).run([_job(c) for c in candidates])
+        return counts
+
+    def _estimate_rung(candidates: list) -> dict:
+        # Cheap pass: map to the liberty without STA; rank by the netlist
+        # estimate, calibrated against earlier STA results where available.
+        from .estimate import f_max
+
+        # Calibrated under this flow by --calibrate.
+        calibration = store.get_artifact(compute_key("estimator_calibration", flow))
+        scores = dict()
+
+        def _on_complete(job: tuple[str, plist], state: dict | None) -> None:
+            if state is None:
+                return
+            est = state["estimate"]
+            row = {
+                "comb_area": est["area"] - est["sequential_area"],
+                "sequential_area": est["sequential_area"],
+                "f_max_mhz": f_max(est["delay_ns"], calibration),
+            }
+            scores[_key(job[1])] = None if row["f_max_mhz"] is None else objective(row)
+
+        JobEngine(
+            stages=compute_stages(
+                echo=opts.echo,
+                cache_dir=opts.cache_dir,
+                synlig_batch=opts.synlig_batch,
+                sta=False,
+            ),
+            max_workers=opts.jobs,
+            initializer=_setup_worker,
+            on_complete=_on_complete,
+        ).run([_job(c) for c in candidates])
+        return scores
+
+    def _full_rung(candidates: list) -> dict:
+        # Full synthesis and f_max search; results go to the sweep store.
+        jobs = [_job(c) for c in candidates]
+        run(jobs)
+        return {
+            _key(r["params"]): None if r["f_max_mhz"] is None else objective(r)
+            for r in rows(jobs)
+        }
+
+    first_pass = {"generic": _generic_rung, "estimate": _estimate_rung}
+
+    widths = list(W_SWEEP)
+    (survivors, history) = successive_halving(
+        {w: [(w, r) for r in RADIX_RANGE] for w in widths},
+        [(opts.first_pass, first_pass[opts.first_pass]), ("full", _full_rung)],
+        eta=opts.eta,
+    )
+
+    full = rows([_job(c) for cs in survivors.values() for c in cs])
+
+    def _point(r: dict) -> dict:
+        return {
+            "RADIX_N": r["params"]["RADIX_N"],
+            "area": r["comb_area"] + r["sequential_area"],
+            "f_max_mhz": r["f_max_mhz"],
+        }
+
+    summary = {
+        "design": design,
+        "objective": opts.objective,
+        "eta": opts.eta,
+        "radices": list(RADIX_RANGE),
+        "best": [
+            {"W": w, "RADIX_N": cs[0][1]} for w, cs in survivors.items() if cs
+        ],
+        "pareto": [
+            {
+                "W": w,
+                "front": [
+                    _point(r)
+                    for r in pareto_front([r for r in full if r["params"]["W"] == w])
+                ],
+            }
+            for w in widths
+        ],
+        "rungs": {
+            name: [
+                {"W": w, "RADIX_N": radix, "score": score}
+                for (w, radix), score in sorted(scores.items())
+            ]
+            for name, scores in history.items()
+        },
+    }
+
+    key = compute_key(
+        "radix_exploration",
+        design,
+        widths,
+        summary["radices"],
+        opts.eta,
+        opts.objective,
+        tools,
+        flow,
+    )
+    store.put_artifact(key, "radix_exploration", summary)
+
+    print(f"Best radix per W by {opts.objective} (Pareto front radices):")
+    best = {entry["W"]: entry["RADIX_N"] for entry in summary["best"]}
+    for entry in summary["pareto"]:
+        radices = ", ".join(str(p["RADIX_N"]) for p in entry["front"])
+        print(f"  W={entry['W']:<4} RADIX_N={best.get(entry['W'], '-'):<3} ({radices})")
+
+
+def _timing_pareto(opts, store, sweep, tools: dict, flow: dict) -> None:
+    from .cache import compute_key
+    from .explore import pareto_front
+
+    jobs = list(compute_jobs())
+
+    # One sweep per delay target; None is the unconstrained (area) mapping.
+    points = defaultdict(list)
+    for delay_ps in [None] + list(ABC_DELAY_SWEEP_PS):
+        if delay_ps is None:
+            (run, rows) = sweep(flow)
+        else:
+            target = dict(abc_delay_ps=delay_ps, abc_buffering=opts.buffering)
+            (run, rows) = sweep(dict(flow, **target), **target)
+
+        print(f"Timing-driven sweep: ABC delay target {delay_ps or '-'} ps")
+        run(jobs)
+        for r in rows(jobs):
+            points[r["name"]].append(dict(r, delay_ps=delay_ps))
+
+    def _point(r: dict) -> dict:
+        return {
+            "delay_ps": r["delay_ps"],
+            "area": r["comb_area"] + r["sequential_area"],
+            "f_max_mhz": r["f_max_mhz"],
+        }
+
+    summary = {
+        "delay_targets_ps": list(ABC_DELAY_SWEEP_PS),
+        "buffering": opts.buffering,
+        "curves": [
+            {
+                "name": name,
+                "design": rs[0]["design"],
+                "params": rs[0]["params"],
+                "points": [_point(r) for r in rs],
+                "front": [_point(r) for r in pareto_front(rs)],
+            }
+            for name, rs in points.items()
+        ],
+    }
+
+    key = compute_key(
+        "timing_pareto",
+        [list(job) for job in jobs],
+        summary["delay_targets_ps"],
+        opts.buffering,
+        tools,
+        flow,
+    )
+    store.put_artifact(key, "timing_pareto", summary)
+
+    print("Area-delay Pareto fronts (area um^2 @ f_max MHz):")
+    for curve in summary["curves"]:
+        front = ", ".join(
+            f"{p['area']:.0f}@{p['f_max_mhz']:.0f}" for p in curve["front"]
+        )
+        print(f"  {curve['name']:<16} {front}")
+
+    from .plot import plot_pareto
+
+    plotpath = opts.plot.with_name(f"{opts.plot.stem}_pareto{opts.plot.suffix}")
+    plot_pareto(plotpath, summary["curves"])
+    print(f"Pareto curves written to {plotpath}")
+
+
+def _calibrate(opts, store) -> None:
+    from .cache import compute_key
+    from .estimate import calibrate
+
+    flow = _flow_options(opts)
+    calibration = calibrate(store.query(flow=flow))
+    if calibration is None:
+        print("Not enough results with both an estimate and an STA f_max.")
+        return
+
+    store.put_artifact(
+        compute_key("estimator_calibration", flow), "estimator_calibration", calibration
+    )
+    print(
+        f"Estimator calibration over {calibration['points']} results: "
+        f"period = {calibration['scale']:.3f} * delay + "
+        f"{calibration['offset']:.3f} ns; f_max error mean "
+        f"{calibration['mean_error']:.1%}, max {calibration['max_error']:.1%}"
+    )
+
+
+def _publish(opts) -> None:
+    from .workqueue import WorkQueue
+
+    queue = WorkQueue(opts.queue, lease_s=opts.lease)
+    added = queue.publish(list(compute_jobs()), _flow_options(opts))
+    print(f"Published {added} new jobs to {opts.queue}: {queue.counts()}")
+    queue.close()
+
+
+def _work(opts) -> None:
+    import argparse
+    import socket
+    import traceback
+    from .workqueue import WorkQueue
+
+    _setup_worker()
+    tools = _tool_versions()
+
+    queue = WorkQueue(opts.queue, lease_s=opts.lease)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+
+    # Jobs this worker cannot run as published, left for other workers.
+    skipped: set[int] = set()
+
+    while (claim := queue.claim(worker, exclude=skipped)) is not None:
+        (job_id, design, params, flow) = claim
+        job = (design, params)
+
+        # The flow was fixed by the publisher; a worker that would produce
+        # something else (e.g. another liberty) must not answer for it.
+        worker_opts = argparse.Namespace(
+            f_max_mode=flow["f_max_mode"],
+            corners=flow.get("corners"),
+            recipes=flow.get("abc_recipes"),
+            recipe_objective=flow.get("recipe_objective"),
+            race_budget=flow.get("race_budget"),
+        )
+        if _flow_options(worker_opts) != flow:
+            print(f"{worker}: flow of job {job_id} differs from this worker's")
+            queue.release(job_id, worker)
+            skipped.add(job_id)
+            continue
+
+        print(f"{worker}: running job: project={design}, params={params}")
+        try:
+            with queue.heartbeat(job_id, worker) as heartbeat:
+                state = _run_stages(
+                    job,
+                    echo=opts.echo,
+                    f_max_mode=worker_opts.f_max_mode,
+                    sta_session=opts.sta_session,
+                    cache_dir=opts.cache_dir,
+                    corners=worker_opts.corners,
+                    recipes=worker_opts.recipes,
+                    recipe_objective=worker_opts.recipe_objective,
+                    race_budget=worker_opts.race_budget,
+                )
+            result = _collect(job, state)
+        except Exception as e:
+            traceback.print_exc()
+            queue.fail(job_id, worker, f"{type(e).__name__}: {e}")
+            continue
+
+        payload = {"tools": tools, "result": result}
+        if heartbeat.lost or not queue.complete(job_id, worker, payload):
+            print(f"{worker}: lease on job {job_id} lost; result discarded")
+
+    queue.close()
+
+
+def _work_pool(opts) -> None:
+    import multiprocessing
+
+    # Several workers on this host; each claims jobs independently.
+    workers = [
+        multiprocessing.Process(target=_work, args=(opts,))
+        for _ in range(max(opts.jobs, 1))
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+
+def _collect_queue(opts, store) -> None:
+    from .store import compute_result_key
+    from .workqueue import WorkQueue
+
+    queue = WorkQueue(opts.queue, lease_s=opts.lease)
+
+    rows = list()
+    for design, params, flow, payload in queue.results():
+        tools = payload["tools"]
+        result = payload["result"]
+        store.put(
+            compute_result_key(design, params, tools, flow),
+            design,
+            params,
+            tools,
+            flow,
+            result,
+        )
+        rows.append(result)
+
+    print(f"Collected {len(rows)} results from {opts.queue}: {queue.counts()}")
+    queue.close()
+
+    if rows:
+        _plot(opts.plot, rows)
+
+
+def _parse_size(size: str) -> float:
+    # Memory size in MiB from e.g. '512M', '16G' or a bare MiB count.
+    units = {"K": 1 / 1024, "M": 1, "G": 1024, "T": 1024 * 1024}
+    size = size.strip().upper().removesuffix("B").removesuffix("I")
+    if size and size[-1] in units:
+        return float(size[:-1]) * units[size[-1]]
+    return float(size)
+
+
+def _parse_corners(corners: str) -> list[str]:
+    import argparse
+    from .env import CORNERS
+
+    names = [c.strip() for c in corners.split(",") if c.strip()]
+    if unknown := [c for c in names if c not in CORNERS]:
+        raise argparse.ArgumentTypeError(
+            f"unknown corners {unknown}; choose from {list(CORNERS)}"
+        )
+    return names
+
+
+def _parse_recipes(recipes: str) -> list[str]:
+    import argparse
+    from .yosys import ABC_RECIPES
+
+    if recipes == "all":
+        return list(ABC_RECIPES)
+
+    names = [r.strip() for r in recipes.split(",") if r.strip()]
+    if unknown := [r for r in names if r not in ABC_RECIPES]:
+        raise argparse.ArgumentTypeError(
+            f"unknown recipes {unknown}; choose from {list(ABC_RECIPES)}"
+        )
+    return names
+
+
+def _parse_args(args: list[str] | None):
+    import argparse
+    from .workqueue import LEASE_S
+
+    parser = argparse.ArgumentParser(
+        prog="synthesize", description="Run the synthesis/STA sweep."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of concurrent flow stages (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--echo", action="store_true", help="Echo tool output to stdout."
+    )
+    parser.add_argument(
+        "--f-max",
+        dest="f_max_mode",
+        choices=F_MAX_MODES.keys(),
+        default="slack",
+        help="f_max search: derive from one slack report (slack) or scan "
+        "F_SWEEP_MHZ from the top (scan).",
+    )
+    parser.add_argument(
+        "--sta-session",
+        action="store_true",
+        help="Keep one OpenSTA process per worker alive across probes and "
+        "jobs instead of spawning one per probe.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=pathlib.Path,
+        help="Trace every flow stage and tool run into this directory, then "
+        "write a Chrome trace (trace.json) and a per-stage summary "
+        "(default: $FLOW_TRACE).",
+    )
+    parser.add_argument(
+        "--mem-budget",
+        type=_parse_size,
+        help="Admit stages only while their predicted peak memory, from the "
+        "run history, fits this budget (e.g. 24G).",
+    )
+    parser.add_argument(
+        "--corners",
+        type=_parse_corners,
+        help="Also time every netlist at these liberty corners "
+        "(comma-separated, from syn.env.CORNERS) and report f_max per corner.",
+    )
+    parser.add_argument(
+        "--synlig-batch",
+        action="store_true",
+        help="Synthesize all parameterizations of a design in one Synlig "
+        "session, elaborating the shared sources once.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        default=CACHE_ROOT,
+        help="Synthesis/STA result cache; may be a shared directory "
+        "(default: $SYN_CACHE_DIR or build/cache).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_dir",
+        action="store_const",
+        const=None,
+        help="Disable the synthesis/STA result cache.",
+    )
+
+    adaptive = parser.add_argument_group("adaptive sweep")
+    adaptive.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Start from a coarse W grid and add points only where area or "
+        "f_max curves bend or designs change rank.",
+    )
+    adaptive.add_argument(
+        "--threshold",
+        type=float,
+        default=ADAPTIVE_THRESHOLD,
+        help="Normalized interpolation error / rank change above which an "
+        f"interval is split (default: {ADAPTIVE_THRESHOLD}).",
+    )
+    adaptive.add_argument(
+        "--budget",
+        type=int,
+        help="Maximum number of jobs in the adaptive sweep (default: the "
+        "number of jobs in the fixed W_SWEEP grid).",
+    )
+
+    explore = parser.add_argument_group("radix exploration")
+    explore.add_argument(
+        "--explore-radix",
+        action="store_true",
+        help="Find the best RADIX_N of 'e' for each W by successive halving: "
+        "rank all radices by generic-gate synthesis, then run the full flow "
+        "on the survivors only.",
+    )
+    explore.add_argument(
+        "--eta",
+        type=int,
+        default=2,
+        help="Keep the best 1/eta of the radices after the cheap pass "
+        "(default: 2).",
+    )
+    explore.add_argument(
+        "--objective",
+        choices=["area", "f_max", "adp"],
+        default="adp",
+        help="Selects the best radix among the survivors: area, f_max or "
+        "area-delay product (default: adp).",
+    )
+    explore.add_argument(
+        "--first-pass",
+        choices=["generic", "estimate"],
+        default="generic",
+        help="Cheap pass of the exploration: generic-gate cell count "
+        "(generic) or liberty mapping timed by the netlist estimator "
+        "(estimate) (default: generic).",
+    )
+
+    pareto = parser.add_argument_group("timing-driven mapping")
+    pareto.add_argument(
+        "--pareto",
+        action="store_true",
+        help="Map every job once per ABC delay target (ABC_DELAY_SWEEP_PS), "
+        "time each netlist and plot area against f_max per design and W.",
+    )
+    pareto.add_argument(
+        "--buffering",
+        action="store_true",
+        help="With --pareto: let ABC insert buffers and resize gates against "
+        "the driving cell and output load in syn.env.",
+    )
+
+    portfolio = parser.add_argument_group("ABC recipe portfolio")
+    portfolio.add_argument(
+        "--recipes",
+        type=_parse_recipes,
+        help="Map each job with these ABC recipes in parallel (comma-separated "
+        "names from syn.yosys.ABC_RECIPES, or 'all'), time every netlist and "
+        "keep the best.",
+    )
+    portfolio.add_argument(
+        "--recipe-objective",
+        choices=["area", "f_max"],
+        default="area",
+        help="With --recipes: selects the best recipe (default: area).",
+    )
+    portfolio.add_argument(
+        "--race-budget",
+        type=float,
+        default=RACE_BUDGET,
+        help="With --recipes: cut off recipes still mapping after this many "
+        f"times the runtime of the first to finish (default: {RACE_BUDGET}).",
+    )
+
+    queue = parser.add_argument_group("work queue")
+    queue.add_argument(
+        "--queue",
+        type=pathlib.Path,
+        help="Shared SQLite work queue, for sweeps spread over several hosts.",
+    )
+    action = queue.add_mutually_exclusive_group()
+    action.add_argument(
+        "--publish",
+        action="store_true",
+        help="Add the sweep's jobs to the queue.",
+    )
+    action.add_argument(
+        "--work",
+        action="store_true",
+        help="Run queued jobs until the queue is drained, with -j workers.",
+    )
+    action.add_argument(
+        "--collect",
+        action="store_true",
+        help="Import completed results from the queue into the store and plot.",
+    )
+    queue.add_argument(
+        "--lease",
+        type=float,
+        default=LEASE_S,
+        help="Seconds a claimed job may go without a heartbeat before it is "
+        f"re-queued (default: {LEASE_S}).",
+    )
+
+    store = parser.add_argument_group("results store")
+    store.add_argument(
+        "--store",
+        type=pathlib.Path,
+        default=STORE_PATH,
+        help=f"Sweep results database (default: {STORE_PATH}).",
+    )
+    store.add_argument(
+        "--rerun",
+        action="store_true",
+        help="Re-run jobs that already have a result in the store.",
+    )
+    store.add_argument(
+        "--plot-only",
+        action="store_true",
+        help="Plot results from the store without running any jobs.",
+    )
+    store.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Fit the netlist estimator to the STA results in the store and "
+        "report its error, without running any jobs.",
+    )
+    store.add_argument(
+        "--plot",
+        type=pathlib.Path,
+        default=common.PROJECT_ROOT / "docs" / "sweep.png",
+        help="Output plot path.",
+    )
+    store.add_argument(
+        "--design",
+        dest="designs",
+        action="append",
+        help="With --plot-only: only plot this design (repeatable).",
+    )
+    store.add_argument("--w-min", type=int, help="With --plot-only: minimum W.")
+    store.add_argument("--w-max", type=int, help="With --plot-only: maximum W.")
+    store.add_argument(
+        "--radix",
+        type=int,
+        help="With --plot-only: only RADIX_N for designs parameterized by it.",
+    )
+    store.add_argument(
+        "--any-flow",
+        action="store_true",
+        help="With --plot-only: plot the latest result of every point from any "
+        "flow, not only from the flow the other options select.",
+    )
+    opts = parser.parse_args(args)
+    if opts.queue is not None and not (opts.publish or opts.work or opts.collect):
+        parser.error("--queue requires one of --publish, --work or --collect")
+    return opts
+
+
+def _plot(plotpath: pathlib.Path, rows: list[dict]) -> None:
+    from .plot import plot_results
+    from .store import group_results
+
+    results = group_results(rows)
+    w_sweep = sorted({r["params"]["W"] for r in rows})
+    plot_results(plotpath, w_sweep, results)
+
+
+def main(args: list[str] | None = None):
+    opts = _parse_args(args)
+
+    from common import trace
+
+    if opts.trace is not None:
+        # Inherited by the workers.
+        os.environ[trace.TRACE_ENV] = str(opts.trace.resolve())
 
-def main(args: list[str] = None):
     try:
-        # Try to setup Synlig and OpenSTA environments
-        from .sta import setup_environment as setup_sta_environment
+        _main(opts)
+    finally:
+        if (trace_dir := trace.trace_dir()) is not None:
+            out = trace.export(trace_dir)
+            print(trace.summary(trace.load(trace_dir)))
+            print(f"Trace written to {out}")
+
 
-        setup_sta_environment()
+def _main(opts) -> None:
+    from .store import ResultsStore, compute_result_key
 
-        from .yosys import setup_environment as setup_yosys_environment
+    store = ResultsStore(opts.store)
+
+    if opts.plot_only:
+        # Results of other flows time other netlists; only mix them on request.
+        rows = store.query(
+            designs=opts.designs,
+            w_min=opts.w_min,
+            w_max=opts.w_max,
+            radix=opts.radix,
+            flow=None if opts.any_flow else _flow_options(opts),
+        )
+        if not rows:
+            print("No results in store match the filters.")
+            return
+        _plot(opts.plot, rows)
+        return
+
+    if opts.calibrate:
+        _calibrate(opts, store)
+        return
+
+    if opts.queue is not None:
+        if opts.publish:
+            _publish(opts)
+        elif opts.collect:
+            _collect_queue(opts, store)
+        else:
+            try:
+                _setup_worker()
+            except EnvironmentError as e:
+                print(f"Environment setup error: {e}")
+                return
+            _work_pool(opts)
+        return
 
-        setup_yosys_environment()
+    try:
+        # Try to setup Synlig and OpenSTA environments
+        _setup_worker()
 
     except EnvironmentError as e:
         # Oops! Environment not setup correctly
         print(f"Environment setup error: {e}")
         return
 
-    results = defaultdict(list)
+    from functools import partial
+    from .engine import JobEngine
+    from .history import History
+
+    tools = _tool_versions()
+    flow = _flow_options(opts)
+
+    pla_cache: defaultdict[str, int] = defaultdict(int)
 
-    for job in compute_jobs():
-        (project, params) = job
-        print(f"Running job: project={project}, params={params}")
+    # Stage runtimes and peak memory are kept alongside the results and
+    # predict the cost of upcoming jobs.
+    history = History(opts.store)
 
-        # Run synthesis and STA on current parameterization
-        (total_area, sequential_area, f_max) = run_job(project, params)
+    def _sweep(flow: dict, **stage_kwargs):
+        # Runner and result lookup for the sweep's jobs under one flow.
+        def _on_complete(job: tuple[str, plist], state: dict | None) -> None:
+            if state is None:
+                return
 
-        def _canonical_run_name(project: str, params: plist) -> str:
-            return f"{project}_" + "_".join(
-                f"{param}{value}" for param, value in params.items()
+            # Persist as each job completes so that a crash loses nothing.
+            (project, params) = job
+            store.put(
+                compute_result_key(project, params, tools, flow),
+                project,
+                params,
+                tools,
+                flow,
+                _collect(job, state),
             )
+            for k, v in state.get("pla_cache", {}).items():
+                pla_cache[k] += v
 
-        results[project].append({
-            "name": _canonical_run_name(project, params),
-            "params": params,
-            "comb_area": (total_area - sequential_area),
-            "sequential_area": sequential_area,
-            "f_max_mhz": f_max,
-        })
+        stages = compute_stages(
+            echo=opts.echo,
+            f_max_mode=opts.f_max_mode,
+            sta_session=opts.sta_session,
+            cache_dir=opts.cache_dir,
+            synlig_batch=opts.synlig_batch,
+            corners=opts.corners,
+            recipes=opts.recipes,
+            recipe_objective=opts.recipe_objective,
+            race_budget=opts.race_budget,
+            **stage_kwargs,
+        )
 
-    from .plot import plot_results
-    plot_results(common.PROJECT_ROOT / "docs" / "sweep.png", W_SWEEP, results)
+        def _on_stage(job: tuple[str, plist], stage: str, usage: dict) -> None:
+            (project, params) = job
+            history.record(project, params, stage, usage)
+
+        def _predict(job: tuple[str, plist], stage: int, metric: str) -> float:
+            (project, params) = job
+            p = history.predict(project, params, stages[stage][0])
+            return 0.0 if p is None else p[metric]
+
+        def _priority(job: tuple[str, plist], stage: int) -> float:
+            # Longest remaining work first.
+            return sum(_predict(job, s, "wall_s") for s in range(stage, len(stages)))
+
+        def _memory(job: tuple[str, plist], stage: int) -> float:
+            # Peak RSS is recorded per child; a portfolio maps its recipes in
+            # concurrent Synlig processes.
+            p = _predict(job, stage, "peak_rss_mb")
+            if opts.recipes and stages[stage][0] == "synthesize":
+                p *= len(opts.recipes)
+            return p
+
+        engine = JobEngine(
+            stages=stages,
+            max_workers=opts.jobs,
+            initializer=_setup_worker,
+            on_complete=_on_complete,
+            on_stage=_on_stage,
+            priority=_priority,
+            memory=_memory,
+            mem_budget=opts.mem_budget,
+        )
+
+        def _run(jobs: list[tuple[str, plist]]) -> None:
+            # Resume: skip jobs whose result is already stored.
+            pending = list()
+            for project, params in jobs:
+                key = compute_result_key(project, params, tools, flow)
+                if not opts.rerun and store.has(key):
+                    print(f"Skipping completed job: project={project}, params={params}")
+                    continue
+                print(f"Queueing job: project={project}, params={params}")
+                pending.append((project, params))
+
+            engine.run(pending)
+
+        def _rows(jobs: list[tuple[str, plist]]) -> list[dict]:
+            keys = [compute_result_key(p, params, tools, flow) for p, params in jobs]
+            return [r for k in keys if (r := store.get(k)) is not None]
+
+        return (_run, _rows)
+
+    (_run, _rows) = _sweep(flow)
+
+    if opts.pareto:
+        _timing_pareto(opts, store, _sweep, tools, flow)
+        return
+
+    if opts.explore_radix:
+        _explore_radix(opts, store, _run, _rows, tools, flow)
+        return
+
+    widths = list(W_COARSE if opts.adaptive else W_SWEEP)
+    jobs = list(compute_jobs(widths))
+    _run(jobs)
+
+    if opts.adaptive:
+        from .adaptive import refine
+        from .store import group_results
+
+        budget = opts.budget
+        if budget is None:
+            budget = len(list(compute_jobs()))
+        jobs_per_w = len(list(compute_jobs(widths[:1])))
+
+        while True:
+            new_widths = refine(
+                group_results(_rows(jobs)),
+                opts.threshold,
+                (budget - len(jobs)) // jobs_per_w,
+                min_step=ADAPTIVE_MIN_STEP,
+                exclude=set(widths),
+            )
+            if not new_widths:
+                break
+
+            print(f"Adaptive sweep: adding W={new_widths}")
+            widths += new_widths
+            new_jobs = list(compute_jobs(new_widths))
+            jobs += new_jobs
+            _run(new_jobs)
+
+        print(f"Adaptive sweep: {len(jobs)} jobs over W={sorted(widths)}")
+
+    print(f"PLA cache: {pla_cache['hits']} hits, {pla_cache['misses']} misses")
+
+    # Plot this sweep's results in job order.
+    _plot(opts.plot, _rows(jobs))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,269 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import concurrent.futures
+import heapq
+import os
+import traceback
+from collections.abc import Callable, Iterable
+from typing import Any, TypeAlias
+
+# A stage is a named callable taking (job, state) and returning the updated
+# state that is handed to the next stage of the same job.
+#
+# A grouped stage additionally carries a key function; jobs whose keys match
+# are held at the stage until every surviving member of the group has arrived,
+# then dispatched together as a single call taking (jobs, states) and
+# returning the list of updated states in the same order.
+Stage: TypeAlias = (
+    tuple[str, Callable[[Any, dict], dict]]
+    | tuple[str, Callable[[list, list[dict]], list[dict]], Callable[[Any], Any]]
+)
+
+
+def _measured(name: str, fn: Callable, *args) -> tuple[Any, dict]:
+    # Runs in the worker: the stage's result and the resources of the tool
+    # processes it spawned.
+    from common import proc, trace
+
+    with trace.span(f"stage:{name}", cat="stage", job=args[0]), proc.meter() as m:
+        result = fn(*args)
+    return (result, m.usage())
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs every submission in the calling process.
+
+    Used when the engine is limited to a single worker so that the flow
+    remains debuggable (breakpoints, tracebacks) without a process pool.
+    """
+
+    def __init__(self, initializer: Callable | None = None):
+        if initializer is not None:
+            initializer()
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        pass
+
+
+class JobEngine:
+    """Run a fixed pipeline of stages across many jobs in a process pool.
+
+    Each job is an independent chain of stages (render -> synthesize -> STA
+    ...), so the pipeline forms a DAG in which stage N of a job depends only on
+    stage N-1 of the same job. Ready stages are dispatched to a bounded pool;
+    stages further down the pipeline are preferred so that jobs drain to
+    completion rather than all jobs sitting part-way through the flow. Results
+    are returned in job order regardless of completion order.
+
+    Grouped stages act as a barrier over the jobs sharing a key. A job that
+    fails before reaching the barrier is dropped from its group so that the
+    remaining members are not held back.
+
+    Scheduling can be steered by predictions: 'priority(job, stage)' orders
+    ready stages before the depth rule (e.g. longest remaining work first),
+    and with a 'mem_budget' a stage is only admitted while the sum of the
+    'memory(job, stage)' predictions of the stages in flight fits the budget;
+    smaller stages are backfilled past one that does not fit. A stage is
+    always admitted onto an idle pool. 'on_stage(job, name, usage)' receives
+    the measured wall time, child CPU time and peak child RSS of every
+    completed stage.
+    """
+
+    def __init__(self, **kwargs):
+        # Required arguments:
+        self._stages: list[Stage] = kwargs.get("stages", [])
+
+        # Optional arguments:
+        self._max_workers = kwargs.get("max_workers") or os.cpu_count() or 1
+        self._initializer = kwargs.get("initializer")
+        self._on_complete = kwargs.get("on_complete")
+        self._on_stage = kwargs.get("on_stage")
+        self._priority = kwargs.get("priority")
+        self._memory = kwargs.get("memory")
+        self._mem_budget = kwargs.get("mem_budget")
+
+    def run(self, jobs: Iterable) -> list[dict | None]:
+        jobs = list(jobs)
+        states: list[dict | None] = [None] * len(jobs)
+
+        if not jobs or not self._stages:
+            return states
+
+        # Group membership of each job at every grouped stage, and the
+        # number of members yet to arrive at each barrier.
+        group_of: dict[tuple[int, int], tuple] = dict()
+        outstanding: dict[tuple, int] = dict()
+        for stage, stage_def in enumerate(self._stages):
+            if len(stage_def) < 3:
+                continue
+            for i, job in enumerate(jobs):
+                group = (stage, stage_def[2](job))
+                group_of[(stage, i)] = group
+                outstanding[group] = outstanding.get(group, 0) + 1
+        arrived: dict[tuple, list[tuple[int, dict]]] = dict()
+
+        # Heap of ready dispatches keyed so that higher priority, then deeper
+        # stages (and earlier jobs within a stage) are dispatched first. Each
+        # entry carries the (job index, state) pairs dispatched together.
+        ready: list[tuple] = list()
+
+        def push(stage: int, members: list[tuple[int, dict]]):
+            priority = 0.0
+            if self._priority is not None:
+                # A group runs its members' work back to back.
+                priority = sum(self._priority(jobs[i], stage) for i, _ in members)
+            heapq.heappush(ready, (-priority, -stage, members[0][0], members))
+
+        for i in range(len(jobs)):
+            push(0, [(i, {})])
+
+        def advance(stage: int, i: int, state: dict):
+            if stage >= len(self._stages):
+                states[i] = state
+                self._complete(jobs[i], state)
+                return
+
+            if (group := group_of.get((stage, i))) is None:
+                push(stage, [(i, state)])
+                return
+
+            arrived.setdefault(group, []).append((i, state))
+            outstanding[group] -= 1
+            release(group)
+
+        def release(group):
+            if outstanding[group] == 0 and (members := arrived.pop(group, None)):
+                members.sort(key=lambda x: x[0])
+                push(group[0], members)
+
+        def fail(stage: int, i: int):
+            # Withdraw the job from any barrier it would have reached.
+            for later in range(stage + 1, len(self._stages)):
+                if (group := group_of.get((later, i))) is not None:
+                    outstanding[group] -= 1
+                    release(group)
+            self._complete(jobs[i], None)
+
+        def memory(stage: int, members: list[tuple[int, dict]]) -> float:
+            if self._memory is None:
+                return 0.0
+            # Members of a group share one tool process.
+            return max((self._memory(jobs[i], stage) or 0.0) for i, _ in members)
+
+        in_flight: dict[concurrent.futures.Future, tuple] = dict()
+        committed = 0.0
+
+        executor = self._executor()
+        try:
+            while ready or in_flight:
+
+                deferred = list()
+                while ready and len(in_flight) < self._max_workers:
+                    entry = heapq.heappop(ready)
+                    (_, neg_stage, _, members) = entry
+                    stage = -neg_stage
+
+                    mem = memory(stage, members)
+                    if (
+                        self._mem_budget is not None
+                        and in_flight
+                        and committed + mem > self._mem_budget
+                    ):
+                        deferred.append(entry)
+                        continue
+
+                    fn = self._stages[stage][1]
+                    if len(self._stages[stage]) < 3:
+                        [(i, state)] = members
+                        args = (jobs[i], state)
+                    else:
+                        args = ([jobs[i] for i, _ in members], [s for _, s in members])
+                    name = self._stages[stage][0]
+                    future = executor.submit(_measured, name, fn, *args)
+                    in_flight[future] = (stage, [i for i, _ in members], mem)
+                    committed += mem
+
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    (stage, indices, mem) = in_flight.pop(future)
+                    committed -= mem
+                    name = self._stages[stage][0]
+
+                    if (e := future.exception()) is not None:
+                        job_desc = ", ".join(str(jobs[i]) for i in indices)
+                        print(f"Job {job_desc} failed in stage '{name}': {e}")
+                        traceback.print_exception(e)
+                        for i in indices:
+                            fail(stage, i)
+                        continue
+
+                    (result, usage) = future.result()
+                    if len(self._stages[stage]) < 3:
+                        result = [result]
+                    else:
+                        # Apportion the group's time across its members.
+                        n = len(indices)
+                        usage = dict(
+                            usage, wall_s=usage["wall_s"] / n, cpu_s=usage["cpu_s"] / n
+                        )
+                    for i, state in zip(indices, result):
+                        if self._on_stage is not None:
+                            self._on_stage(jobs[i], name, usage)
+                        advance(stage + 1, i, state)
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return states
+
+    def _complete(self, job, state: dict | None) -> None:
+        # Runs in the calling process as each job finishes (or fails).
+        if self._on_complete is not None:
+            self._on_complete(job, state)
+
+    def _executor(self):
+        if self._max_workers <= 1:
+            return _InlineExecutor(initializer=self._initializer)
+
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._max_workers, initializer=self._initializer
+        )
@@ -29,7 +29,27 @@ import pathlib
 
 _tech = 'sky130_fd_sc_hd'
 
-_corner = 'sky130_fd_sc_hd__ss_100C_1v60.lib'
+_lib_dir = pathlib.Path.home() / '.volare/sky130A/libs.ref' / _tech / 'lib'
 
-STDCELL_LIB_PATH = \
-  pathlib.Path.home() / '.volare/sky130A/libs.ref' / _tech / 'lib' / _corner
+# Liberty corners available to timing analysis (--corners), by name.
+CORNERS = {
+  'ss_100C_1v60': _lib_dir / f'{_tech}__ss_100C_1v60.lib',
+  'ss_n40C_1v60': _lib_dir / f'{_tech}__ss_n40C_1v60.lib',
+  'tt_025C_1v80': _lib_dir / f'{_tech}__tt_025C_1v80.lib',
+  'ff_100C_1v95': _lib_dir / f'{_tech}__ff_100C_1v95.lib',
+  'ff_n40C_1v95': _lib_dir / f'{_tech}__ff_n40C_1v95.lib',
+}
+
+# Corner used for mapping and for the primary (verified) f_max.
+_corner = 'ss_100C_1v60'
+
+STDCELL_LIB_PATH = CORNERS[_corner]
+
+# Load on every primary output, in liberty capacitance units (pF for sky130).
+OUTPUT_LOAD = 0.0175
+
+# Constraints for ABC buffering and sizing (abc -constr): the cell assumed to
+# drive every input and the load on every output. ABC reads set_load in fF.
+ABC_DRIVING_CELL = f'{_tech}__buf_1'
+
+ABC_OUTPUT_LOAD = OUTPUT_LOAD * 1000.0
@@ -0,0 +1,232 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import json
+import pathlib
+import time
+
+# Wire load model: capacitance added per sink of a net, in liberty capacitance
+# units (pF for sky130).
+WIRE_CAP_PER_SINK = 0.002
+
+
+def _module(netlist: dict, top: str | None) -> dict:
+    modules = netlist["modules"]
+    if top is not None:
+        return modules[top]
+    # Flattened netlists hold the top-level alone.
+    return next(m for m in modules.values() if m.get("attributes", {}).get("top"))
+
+
+def _direction(inst: dict, model: dict | None, pin: str) -> str | None:
+    # Liberty cells are black boxes to yosys, which then omits their port
+    # directions from the netlist.
+    if model is not None and pin in model["pins"]:
+        return model["pins"][pin]["direction"]
+    return inst.get("port_directions", {}).get(pin)
+
+
+def estimate(
+    syn_json: pathlib.Path, liberty: pathlib.Path, top: str | None = None
+) -> dict:
+    """Area, logic depth and register-to-register delay of a mapped netlist.
+
+    Reads a flattened netlist written by 'write_json' and times it with the
+    linear delay model of liberty.read_timing: each register output launches
+    at its clock-to-Q delay, cells are traversed in topological order and each
+    register input must settle by its setup time. Paths from input ports are
+    unconstrained, as they are in STA.
+    """
+    from .env import OUTPUT_LOAD
+    from .liberty import read_timing
+
+    cells = read_timing(liberty)
+    with open(syn_json, "r") as f:
+        module = _module(json.load(f), top)
+
+    start = time.perf_counter()
+
+    # Net bits (ints; strings are constants) to their sinks and load
+    sinks: dict[int | str, list[str]] = dict()
+    load: dict[int | str, float] = dict()
+    for port in module["ports"].values():
+        if port["direction"] == "output":
+            for bit in port["bits"]:
+                load[bit] = load.get(bit, 0.0) + OUTPUT_LOAD
+
+    instances = module["cells"]
+    for name, inst in instances.items():
+        model = cells.get(inst["type"])
+        for pin, bits in inst["connections"].items():
+            if _direction(inst, model, pin) != "input":
+                continue
+            cap = model["pins"][pin]["capacitance"] if model else 0.0
+            for bit in bits:
+                sinks.setdefault(bit, []).append(name)
+                load[bit] = load.get(bit, 0.0) + cap + WIRE_CAP_PER_SINK
+
+    area = 0.0
+    sequential_area = 0.0
+    unknown = set()
+    # Arrival time and depth of each driven bit
+    arrival: dict[int | str, float] = dict()
+    depth: dict[int | str, int] = dict()
+    pending = dict()
+    ready = list()
+    for name, inst in instances.items():
+        model = cells.get(inst["type"])
+        if model is None:
+            unknown.add(inst["type"])
+            continue
+        area += model["area"]
+        if model["sequential"]:
+            sequential_area += model["area"]
+            # Launch: clock-to-Q at the output's load
+            for arc in model["arcs"]:
+                for bit in inst["connections"].get(arc["to"], []):
+                    t = arc["intrinsic"] + arc["slope"] * load.get(bit, 0.0)
+                    arrival[bit] = max(arrival.get(bit, 0.0), t)
+                    depth[bit] = 0
+            continue
+
+        # Inputs driven by other combinational cells must be timed first.
+        pending[name] = 0
+        ready.append(name)
+
+    drivers = dict()
+    for name in pending:
+        inst = instances[name]
+        model = cells[inst["type"]]
+        for pin, bits in inst["connections"].items():
+            if _direction(inst, model, pin) == "output":
+                for bit in bits:
+                    drivers[bit] = name
+    for name in pending:
+        inst = instances[name]
+        model = cells[inst["type"]]
+        for pin, bits in inst["connections"].items():
+            if _direction(inst, model, pin) == "input":
+                pending[name] += sum(1 for bit in bits if bit in drivers)
+    ready = [name for name in ready if pending[name] == 0]
+
+    while ready:
+        name = ready.pop()
+        inst = instances[name]
+        model = cells[inst["type"]]
+        for arc in model["arcs"]:
+            for src, dst in zip(
+                inst["connections"].get(arc["from"], []),
+                inst["connections"].get(arc["to"], []),
+            ):
+                if src not in arrival:
+                    continue
+                t = arrival[src] + arc["intrinsic"] + arc["slope"] * load.get(dst, 0.0)
+                if t >= arrival.get(dst, 0.0):
+                    arrival[dst] = t
+                depth[dst] = max(depth.get(dst, 0), depth[src] + 1)
+
+        for pin, bits in inst["connections"].items():
+            if _direction(inst, model, pin) != "output":
+                continue
+            for bit in bits:
+                for sink in sinks.get(bit, []):
+                    if sink in pending:
+                        pending[sink] -= 1
+                        if pending[sink] == 0:
+                            ready.append(sink)
+
+    # Capture: register data inputs
+    delay = None
+    logic_depth = 0
+    for inst in instances.values():
+        model = cells.get(inst["type"])
+        if model is None or not model["sequential"]:
+            continue
+        for pin, setup in model["setup"].items():
+            for bit in inst["connections"].get(pin, []):
+                if bit in arrival:
+                    t = arrival[bit] + setup
+                    delay = t if delay is None else max(delay, t)
+                    logic_depth = max(logic_depth, depth[bit])
+
+    return {
+        "area": area,
+        "sequential_area": sequential_area,
+        "cell_count": len(instances),
+        "logic_depth": logic_depth,
+        "delay_ns": delay,
+        "f_max_mhz": None if not delay else 1000 / delay,
+        "unknown_cells": sorted(unknown),
+        "runtime_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def calibrate(rows: list[dict]) -> dict | None:
+    """Fit STA's minimum period to the estimated delay over sweep results.
+
+    Rows are results holding both an 'estimate' and an STA 'f_max_mhz'. The
+    fit is period = scale * delay + offset by least squares; its error is
+    reported as the mean and worst relative error of the calibrated f_max.
+    """
+    points = [
+        (r["estimate"]["delay_ns"], 1000 / r["f_max_mhz"])
+        for r in rows
+        if r.get("estimate") and r["estimate"].get("delay_ns") and r.get("f_max_mhz")
+    ]
+    if len(points) < 2:
+        return None
+
+    n = len(points)
+    mx = sum(x for x, _ in points) / n
+    my = sum(y for _, y in points) / n
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    sxy = sum((x - mx) * (y - my) for x, y in points)
+    scale = sxy / sxx if sxx else 0.0
+    if scale <= 0:
+        # Degenerate spread: a pure ratio is the best that can be said.
+        scale, offset = (my / mx, 0.0)
+    else:
+        offset = my - scale * mx
+
+    calibration = {"scale": scale, "offset": offset, "points": n}
+    errors = [abs(f_max(x, calibration) - 1000 / y) / (1000 / y) for x, y in points]
+    calibration.update(
+        mean_error=sum(errors) / n,
+        max_error=max(errors),
+    )
+    return calibration
+
+
+def f_max(delay_ns: float | None, calibration: dict | None = None) -> float | None:
+    """Estimated f_max (MHz) from an estimated delay, calibrated if possible."""
+    if not delay_ns:
+        return None
+    if calibration is not None:
+        period_ns = calibration["scale"] * delay_ns + calibration["offset"]
+    else:
+        period_ns = delay_ns
+    return 1000 / period_ns if period_ns > 0 else None
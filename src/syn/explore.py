@@ -0,0 +1,91 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import math
+from collections.abc import Callable, Hashable
+
+# A rung evaluates a list of candidates and returns a score for each (lower is
+# better); candidates that fail to evaluate are scored None and eliminated.
+Rung = tuple[str, Callable[[list], dict[Hashable, float | None]]]
+
+# Objectives for choosing among fully evaluated candidates, as a score to be
+# minimized from a result row.
+OBJECTIVES = {
+    "area": lambda r: _area(r),
+    "f_max": lambda r: -r["f_max_mhz"],
+    # Area-delay product
+    "adp": lambda r: _area(r) / r["f_max_mhz"],
+}
+
+
+def _area(r: dict) -> float:
+    return r["comb_area"] + r["sequential_area"]
+
+
+def successive_halving(
+    groups: dict[Hashable, list], rungs: list[Rung], eta: int = 2
+) -> tuple[dict[Hashable, list], dict[str, dict]]:
+    """Prune candidates over rungs of increasing evaluation cost.
+
+    Candidates compete within their group (e.g. the radices of one W). Every
+    surviving candidate of every group is evaluated at a rung in a single
+    call, so that a rung may run its evaluations concurrently; afterwards the
+    best ceil(n / eta) of each group advance. The final rung is not pruned.
+
+    Returns the survivors of each group ordered by their final-rung score,
+    and the scores of every rung keyed by rung name.
+    """
+    survivors = {g: list(c) for g, c in groups.items()}
+    history = dict()
+
+    for depth, (name, evaluate) in enumerate(rungs):
+        candidates = [c for cs in survivors.values() for c in cs]
+        scores = evaluate(candidates)
+        history[name] = scores
+
+        last = depth == len(rungs) - 1
+        for g, cs in survivors.items():
+            scored = [(s, c) for c in cs if (s := scores.get(c)) is not None]
+            ranked = [c for _, c in sorted(scored, key=lambda x: x[0])]
+            keep = len(ranked) if last else math.ceil(len(cs) / eta)
+            survivors[g] = ranked[:keep]
+
+    return survivors, history
+
+
+def pareto_front(rows: list[dict]) -> list[dict]:
+    """Rows not dominated in (area, f_max), ordered by increasing area."""
+    rows = sorted(
+        (r for r in rows if r["f_max_mhz"] is not None),
+        key=lambda r: (_area(r), -r["f_max_mhz"]),
+    )
+
+    front: list[dict] = list()
+    for r in rows:
+        if not front or r["f_max_mhz"] > front[-1]["f_max_mhz"]:
+            front.append(r)
+    return front
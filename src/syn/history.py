@@ -0,0 +1,181 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import json
+import math
+import pathlib
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stage_history (
+    design      TEXT NOT NULL,
+    variant     TEXT NOT NULL,
+    stage       TEXT NOT NULL,
+    w           INTEGER NOT NULL,
+    wall_s      REAL NOT NULL,
+    cpu_s       REAL NOT NULL,
+    peak_rss_mb REAL NOT NULL,
+    created     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stage_history_design
+    ON stage_history (stage, design, variant);
+"""
+
+# Predicted metrics, in stage_history column order.
+_METRICS = ("wall_s", "peak_rss_mb")
+
+# Most recent observations per (design, variant, stage) used in a fit.
+_HISTORY_DEPTH = 64
+
+# Bounds on the fitted exponent, guarding extrapolation from few points.
+_EXPONENT_RANGE = (0.0, 4.0)
+
+
+def _variant(params: dict) -> str:
+    return json.dumps({k: v for k, v in params.items() if k != "W"}, sort_keys=True)
+
+
+def fit_power_law(
+    points: list[tuple[float, float]],
+) -> tuple[float, float, float, int] | None:
+    """Least-squares fit of y = a * x^b in log-log space.
+
+    Returns (mean log x, mean log y, b, distinct x), from which
+    y = exp(my + b * (log x - mx)), or None without points. With a single
+    distinct x the exponent is undetermined and returned as 0.
+    """
+    points = [(x, y) for x, y in points if x > 0 and y > 0]
+    if not points:
+        return None
+
+    lx = [math.log(x) for x, _ in points]
+    ly = [math.log(y) for _, y in points]
+    mx = sum(lx) / len(lx)
+    my = sum(ly) / len(ly)
+
+    sxx = sum((x - mx) ** 2 for x in lx)
+    if sxx == 0:
+        return (mx, my, 0.0, 1)
+
+    b = sum((x - mx) * (y - my) for x, y in zip(lx, ly)) / sxx
+    b = min(max(b, _EXPONENT_RANGE[0]), _EXPONENT_RANGE[1])
+    return (mx, my, b, len(set(lx)))
+
+
+class History:
+    """Observed wall time and peak RSS of flow stages, and predictions.
+
+    Every completed stage of a job is recorded against its design, its non-W
+    parameters (the variant), the stage name and W. Predictions for a new job
+    fit a power law in W to the most specific history available: the same
+    design and variant, then the same design, then any design. Where the most
+    specific history covers a single W, the exponent is borrowed from the
+    first broader one that determines it.
+    """
+
+    def __init__(self, path: pathlib.Path | str):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(path, timeout=60)
+        self._db.executescript(_SCHEMA)
+        self._fits: dict[tuple, dict | None] = dict()
+
+    def close(self):
+        self._db.close()
+
+    def record(self, design: str, params: dict, stage: str, usage: dict) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT INTO stage_history VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    design,
+                    _variant(params),
+                    stage,
+                    params["W"],
+                    usage["wall_s"],
+                    usage["cpu_s"],
+                    usage["peak_rss_mb"],
+                    time.time(),
+                ),
+            )
+
+    def predict(self, design: str, params: dict, stage: str) -> dict | None:
+        """Predicted 'wall_s' and 'peak_rss_mb' of a stage, or None if the
+        stage has never been observed."""
+        scopes = [
+            (stage, design, _variant(params)),
+            (stage, design),
+            (stage,),
+        ]
+        fits = [fit for scope in scopes if (fit := self._fit(scope)) is not None]
+        if not fits:
+            return None
+
+        lw = math.log(params["W"])
+
+        prediction = dict()
+        for metric in _METRICS:
+            if (fit := fits[0][metric]) is None:
+                # Unfittable metrics (e.g. a stage spawning no children has
+                # no RSS) predict zero.
+                prediction[metric] = 0.0
+                continue
+
+            (mx, my, b, distinct) = fit
+            if distinct < 2:
+                broader = (f[metric] for f in fits[1:] if f[metric] is not None)
+                b = next((f[2] for f in broader if f[3] >= 2), b)
+            prediction[metric] = math.exp(my + b * (lw - mx))
+
+        return prediction
+
+    def _fit(self, scope: tuple) -> dict | None:
+        # Fits are computed once per scope; history recorded during this run
+        # informs the next one.
+        if scope in self._fits:
+            return self._fits[scope]
+
+        columns = ("stage", "design", "variant")[: len(scope)]
+        where = " AND ".join(f"{c} = ?" for c in columns)
+        cur = self._db.execute(
+            f"SELECT w, wall_s, peak_rss_mb FROM stage_history WHERE {where} "
+            "ORDER BY created DESC LIMIT ?",
+            (*scope, _HISTORY_DEPTH),
+        )
+        rows = cur.fetchall()
+
+        fit = None
+        if rows:
+            fit = {
+                metric: fit_power_law([(r[0], r[1 + k]) for r in rows])
+                for k, metric in enumerate(_METRICS)
+            }
+
+        self._fits[scope] = fit
+        return fit
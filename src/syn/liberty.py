@@ -0,0 +1,273 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import functools
+import pathlib
+import re
+
+
+@functools.cache
+def _read_cells(path: str) -> dict[str, dict]:
+    cells: dict[str, dict] = dict()
+    cell = None
+    depth = 0
+    cell_depth = 0
+
+    with open(path, "r") as f:
+        for line in f:
+            if m := re.match(r'\s*cell\s*\(\s*"?([\w\$]+)"?\s*\)', line):
+                cell = cells.setdefault(m.group(1), {"area": None, "sequential": False})
+                cell_depth = depth
+            elif cell is not None:
+                if m := re.match(r"\s*area\s*:\s*([\d\.eE+-]+)", line):
+                    if cell["area"] is None:
+                        cell["area"] = float(m.group(1))
+                elif re.match(r"\s*(ff|latch|ff_bank|latch_bank)\s*\(", line):
+                    cell["sequential"] = True
+
+            depth += line.count("{") - line.count("}")
+            if cell is not None and depth <= cell_depth:
+                cell = None
+
+    return cells
+
+
+def read_cells(path: pathlib.Path) -> dict[str, dict]:
+    """Per-cell area and sequential flag from a liberty file."""
+    return _read_cells(str(path))
+
+
+# Tokens of the liberty syntax: quoted strings, punctuation and bare words.
+# Comments and line continuations are removed beforehand.
+_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}();:,]|[^\s{}();:,"]+')
+_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.S)
+
+
+def _group(kind: str, names: list[str]) -> dict:
+    return {"type": kind, "names": names, "attrs": dict(), "groups": list()}
+
+
+def parse(text: str) -> dict:
+    """Parse liberty source into a tree of groups.
+
+    Each group is a dict with its 'type' (e.g. 'cell'), its 'names', its
+    'attrs' and its child 'groups'. Simple attributes map to their value;
+    complex attributes (e.g. 'values(...)') to the list of their arguments.
+    Quotes are stripped; the outermost group (the library) is returned.
+    """
+    text = _COMMENT_RE.sub(" ", text.replace("\\\n", " "))
+    tokens = _TOKEN_RE.findall(text)
+
+    def _unquote(tok: str) -> str:
+        return tok[1:-1] if tok.startswith('"') else tok
+
+    root = _group("", [])
+    stack = [root]
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok == "}":
+            stack.pop()
+            i += 1
+        elif tok == ";":
+            i += 1
+        elif i + 1 < len(tokens) and tokens[i + 1] == ":":
+            # Simple attribute: name : value ;
+            stack[-1]["attrs"][tok] = _unquote(tokens[i + 2])
+            i += 3
+        elif i + 1 < len(tokens) and tokens[i + 1] == "(":
+            args = list()
+            i += 2
+            while tokens[i] != ")":
+                if tokens[i] != ",":
+                    args.append(_unquote(tokens[i]))
+                i += 1
+            i += 1
+            if i < len(tokens) and tokens[i] == "{":
+                group = _group(tok, args)
+                stack[-1]["groups"].append(group)
+                stack.append(group)
+                i += 1
+            else:
+                stack[-1]["attrs"][tok] = args
+        else:
+            i += 1
+
+    return root["groups"][0] if root["groups"] else root
+
+
+def _children(group: dict, kind: str) -> list[dict]:
+    return [g for g in group["groups"] if g["type"] == kind]
+
+
+def _floats(values: list[str]) -> list[float]:
+    return [float(v) for s in values for v in s.replace(",", " ").split()]
+
+
+# Input transition at which delay tables are linearized, in library time units
+# (ns for sky130). Rows of a table nearest to it are used.
+NOMINAL_SLEW = 0.1
+
+
+def _table(group: dict, templates: dict) -> tuple[list, list, list[list]] | None:
+    # Table as (input transitions, output loads, rows by transition) with the
+    # template's index order resolved. Scalar tables have empty indices.
+    values = group["attrs"].get("values")
+    if values is None:
+        return None
+    template = templates.get(group["names"][0] if group["names"] else "", {})
+    attrs = dict(template, **group["attrs"])
+
+    index_1 = _floats(attrs.get("index_1", []))
+    index_2 = _floats(attrs.get("index_2", []))
+    rows = [_floats([row]) for row in values]
+    if not index_1:
+        return ([], [], rows)
+    if not index_2:
+        # One-dimensional; on whichever variable variable_1 names.
+        if "transition" in attrs.get("variable_1", "transition"):
+            return (index_1, [], [[v] for v in rows[0]])
+        return ([], index_1, rows)
+
+    if "transition" in attrs.get("variable_2", ""):
+        # Loads by row; transpose to rows by transition.
+        rows = [list(col) for col in zip(*rows)]
+        (index_1, index_2) = (index_2, index_1)
+    return (index_1, index_2, rows)
+
+
+def _nearest(index: list[float], x: float) -> int:
+    return min(range(len(index)), key=lambda i: abs(index[i] - x)) if index else 0
+
+
+def _linearize(table: tuple[list, list, list[list]]) -> tuple[float, float]:
+    # Delay as intrinsic + slope * load at the nominal input transition.
+    (slews, loads, rows) = table
+    row = rows[_nearest(slews, NOMINAL_SLEW)]
+    if len(row) < 2 or len(loads) != len(row):
+        return (max(row), 0.0)
+
+    n = len(row)
+    mx = sum(loads) / n
+    my = sum(row) / n
+    sxx = sum((x - mx) ** 2 for x in loads)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(loads, row))
+    slope = sxy / sxx if sxx else 0.0
+    return (my - slope * mx, slope)
+
+
+def _constraint(table: tuple[list, list, list[list]]) -> float:
+    # Setup time with both transitions nominal.
+    (slews, loads, rows) = table
+    row = rows[_nearest(slews, NOMINAL_SLEW)]
+    return row[_nearest(loads, NOMINAL_SLEW)] if loads else max(row)
+
+
+@functools.cache
+def _read_timing(path: str) -> dict[str, dict]:
+    with open(path, "r") as f:
+        library = parse(f.read())
+
+    templates = {
+        g["names"][0]: g["attrs"]
+        for g in _children(library, "lu_table_template")
+        if g["names"]
+    }
+
+    cells = dict()
+    for cell in _children(library, "cell"):
+        model: dict = {
+            "area": float(cell["attrs"].get("area", 0.0)),
+            "sequential": any(
+                _children(cell, kind) for kind in ("ff", "latch", "ff_bank")
+            ),
+            "pins": dict(),
+            "arcs": list(),
+            "setup": dict(),
+        }
+
+        for pin in _children(cell, "pin"):
+            for name in pin["names"]:
+                model["pins"][name] = {
+                    "direction": pin["attrs"].get("direction"),
+                    "capacitance": float(pin["attrs"].get("capacitance", 0.0)),
+                }
+
+            for timing in _children(pin, "timing"):
+                kind = timing["attrs"].get("timing_type", "combinational")
+                related = timing["attrs"].get("related_pin", "").split()
+
+                if kind.startswith("setup"):
+                    setup = [
+                        _constraint(t)
+                        for g in timing["groups"]
+                        if g["type"] in ("rise_constraint", "fall_constraint")
+                        and (t := _table(g, templates)) is not None
+                    ]
+                    for name in pin["names"]:
+                        model["setup"][name] = max(setup, default=0.0)
+                    continue
+                if kind not in ("combinational", "rising_edge", "falling_edge"):
+                    continue
+
+                # Worst of rise and fall, per coefficient.
+                fits = [
+                    _linearize(t)
+                    for g in timing["groups"]
+                    if g["type"] in ("cell_rise", "cell_fall")
+                    and (t := _table(g, templates)) is not None
+                ]
+                if not fits:
+                    continue
+                intrinsic = max(f[0] for f in fits)
+                slope = max(f[1] for f in fits)
+                for name in pin["names"]:
+                    for src in related:
+                        model["arcs"].append(
+                            {
+                                "from": src,
+                                "to": name,
+                                "type": kind,
+                                "intrinsic": intrinsic,
+                                "slope": slope,
+                            }
+                        )
+
+        cells[cell["names"][0]] = model
+
+    return cells
+
+
+def read_timing(path: pathlib.Path) -> dict[str, dict]:
+    """Per-cell area, pins and a linear delay model from a liberty file.
+
+    Each cell has its 'area', 'sequential' flag, 'pins' (direction and input
+    capacitance), 'arcs' and 'setup' times by data pin. An arc is the worst
+    of its rise and fall delay tables linearized in the output load at
+    NOMINAL_SLEW: delay = intrinsic + slope * load.
+    """
+    return _read_timing(str(path))
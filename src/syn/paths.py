@@ -0,0 +1,262 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Critical path extraction from OpenSTA 'report_checks' output.
+#
+# The report must be in the full (or full_clock_expanded) format with the
+# fanout, cap and slew fields. The data arrival section is parsed into the
+# pins along the path; consecutive pins of an instance form one cell, whose
+# delay contribution is the sum of the increments on its pins.
+#
+# Cells are attributed to RTL instances through net names: flattening keeps
+# the hierarchical names of nets declared inside submodules
+# ('u_uut.u_enc.idx'), so a cell belongs to the instance owning the first
+# named net at or after its output. Mapped cells are otherwise anonymous, so
+# the attribution is best effort.
+
+import pathlib
+import re
+
+_PIN_RE = re.compile(
+    r"^\s*((?:-?[\d.]+\s+)*?)(-?[\d.]+)\s+(-?[\d.]+)\s+([\^v])\s+"
+    r"(\S+)\s+\(([^)]+)\)\s*$"
+)
+_NET_RE = re.compile(r"^\s*(?:(\d+)\s+)?(?:(-?[\d.]+)\s+)?(\S+)\s+\(net\)\s*$")
+_POINT_RE = re.compile(r"^(Startpoint|Endpoint):\s+(\S+)\s+\((.*)\)\s*$")
+_TIME_RE = re.compile(r"^\s*(-?[\d.]+)\s+(data arrival time|data required time|slack)")
+
+# Anonymous names written for internal nets by yosys.
+_ANONYMOUS_RE = re.compile(r"^(_\d+_|\$.*)$")
+
+# Output register naming of the top-level wrapper (out_<port>_r -> <port>_o).
+_OUT_REG_RE = re.compile(r"^out_(\w+)_r$")
+
+
+def _unescape(name: str) -> str:
+    # Verilog escaped identifiers are reported with escaped hierarchy dots.
+    return name.replace("\\", "")
+
+
+def _base(net: str) -> str:
+    # Strip a bit select: 'u_uut.y[3]' -> 'u_uut.y'
+    return re.sub(r"\[\d+\]$", "", net)
+
+
+def parse_report(report: str) -> dict | None:
+    """Structured worst path of a report_checks report, or None."""
+    stages: list[dict] = list()
+    path: dict = {"stages": stages}
+
+    in_arrival = False
+    for line in report.splitlines():
+        if m := _POINT_RE.match(line):
+            path[m.group(1).lower()] = _unescape(m.group(2))
+            path[f"{m.group(1).lower()}_type"] = m.group(3)
+            continue
+
+        if m := _TIME_RE.match(line):
+            key = {
+                "data arrival time": "arrival",
+                "data required time": "required",
+                "slack": "slack",
+            }[m.group(2)]
+            # Arrival and required are repeated in the slack summary.
+            path.setdefault(key, float(m.group(1)))
+            if key == "arrival":
+                in_arrival = False
+            if key == "slack":
+                break
+            continue
+
+        if line.lstrip().startswith("Fanout") or line.lstrip().startswith("Cap"):
+            continue
+
+        if line.strip().startswith("---") and "arrival" not in path:
+            in_arrival = True
+            continue
+
+        if not in_arrival:
+            continue
+
+        if m := _PIN_RE.match(line):
+            leading = m.group(1).split()
+            pin = _unescape(m.group(5))
+            (instance, _, pin_name) = pin.rpartition("/")
+            stages.append(
+                {
+                    "pin": pin,
+                    "instance": instance or None,
+                    "port": pin_name if not instance else None,
+                    "cell": m.group(6),
+                    "edge": "rise" if m.group(4) == "^" else "fall",
+                    "slew": float(leading[-1]) if leading else None,
+                    "delay": float(m.group(2)),
+                    "time": float(m.group(3)),
+                }
+            )
+        elif (m := _NET_RE.match(line)) and stages:
+            stages[-1].update(
+                net=_unescape(m.group(3)),
+                fanout=int(m.group(1)) if m.group(1) else None,
+                cap=float(m.group(2)) if m.group(2) else None,
+            )
+
+    if "slack" not in path or not stages:
+        return None
+
+    path["cells"] = _cells(stages)
+
+    # Combinational depth: cells with an output on the path, less the
+    # launching register.
+    driving = [c for c in path["cells"] if c["net"] is not None]
+    launch = int(
+        bool(driving)
+        and driving[0]["instance"] == path.get("startpoint")
+        and "flip-flop" in path.get("startpoint_type", "")
+    )
+    path["logic_depth"] = len(driving) - launch
+
+    return path
+
+
+def _cells(stages: list[dict]) -> list[dict]:
+    cells = list()
+    for s in stages:
+        if s["instance"] is None:
+            # Port of the top-level.
+            cells.append(
+                {
+                    "instance": None,
+                    "cell": s["cell"],
+                    "pins": [s["port"]],
+                    "delay": s["delay"],
+                    "net": s.get("net"),
+                }
+            )
+            continue
+
+        if cells and cells[-1]["instance"] == s["instance"]:
+            c = cells[-1]
+            c["pins"].append(s["pin"].rpartition("/")[2])
+            c["delay"] += s["delay"]
+            c["net"] = s.get("net", c["net"])
+            c["fanout"] = s.get("fanout", c.get("fanout"))
+        else:
+            cells.append(
+                {
+                    "instance": s["instance"],
+                    "cell": s["cell"],
+                    "pins": [s["pin"].rpartition("/")[2]],
+                    "delay": s["delay"],
+                    "net": s.get("net"),
+                    "fanout": s.get("fanout"),
+                }
+            )
+    return cells
+
+
+def instance_modules(sources: list[pathlib.Path]) -> dict[str, str]:
+    """RTL instance name -> module, for names used for a single module."""
+    inst_re = re.compile(
+        r"^\s*(\w+)\s*(?:#\s*\((?:[^()]|\([^()]*\))*\))?\s*(u_\w+)\s*\(", re.M
+    )
+
+    seen: dict[str, set[str]] = dict()
+    for src in sources:
+        with open(src, "r") as f:
+            for m in inst_re.finditer(f.read()):
+                seen.setdefault(m.group(2), set()).add(m.group(1))
+
+    return {inst: next(iter(mods)) for inst, mods in seen.items() if len(mods) == 1}
+
+
+def _owner(net: str | None) -> str | None:
+    # Instance path owning a named net, '' for the top-level.
+    if net is None or _ANONYMOUS_RE.match(net):
+        return None
+    return _base(net).rpartition(".")[0]
+
+
+def attribute(path: dict, modules: dict[str, str]) -> list[dict]:
+    """Delay of the path per RTL instance, largest first.
+
+    Each cell is charged to the owner of the first named net at or after its
+    output; cells followed only by anonymous nets are unattributed (None).
+    """
+    owners: list[str | None] = [None] * len(path["cells"])
+    owner = None
+    for k in reversed(range(len(path["cells"]))):
+        if (o := _owner(path["cells"][k]["net"])) is not None:
+            owner = o
+        owners[k] = owner
+
+    blocks: dict[str | None, dict] = dict()
+    for cell, owner in zip(path["cells"], owners):
+        cell["rtl_instance"] = owner
+        b = blocks.setdefault(owner, {"instance": owner, "delay": 0.0, "cells": 0})
+        b["delay"] += cell["delay"]
+        b["cells"] += 1
+
+    for b in blocks.values():
+        # Generate blocks appear as 'gen_x[3]' components; the module is that
+        # of the innermost named instance.
+        leaves = [c for c in (b["instance"] or "").split(".") if c.startswith("u_")]
+        b["module"] = modules.get(leaves[-1]) if leaves else None
+
+    return sorted(blocks.values(), key=lambda b: -b["delay"])
+
+
+def endpoint_port(syn_v: pathlib.Path, instance: str) -> str | None:
+    """Top-level output port registered by the endpoint register, if any."""
+    with open(syn_v, "r") as f:
+        netlist = f.read()
+
+    name = re.escape(instance)
+    if not (m := re.search(rf"\s\\?{name}\s*\((.*?)\);", netlist, re.S)):
+        return None
+    if not (q := re.search(r"\.Q\(\s*\\?([^\s\[)]+)", m.group(1))):
+        return None
+
+    net = q.group(1)
+    if m := _OUT_REG_RE.match(net):
+        return f"{m.group(1)}_o"
+    return net
+
+
+def critical_path(report: str, syn_v: pathlib.Path, sources: list) -> dict | None:
+    """Worst path of report, attributed to the RTL and its output port."""
+    if (path := parse_report(report)) is None:
+        return None
+
+    path["blocks"] = attribute(path, instance_modules(sources))
+    path["output_port"] = None
+    if (endpoint := path.get("endpoint")) is not None:
+        path["output_port"] = endpoint_port(syn_v, endpoint)
+
+    # Stages are retained only through their per-cell summary.
+    del path["stages"]
+    return path
@@ -31,23 +31,25 @@ from collections import defaultdict
 
 def plot_results(plotpath: pathlib.Path, w_sweep: list[int], results: dict) -> None:
 
+    widths = defaultdict(list)
     area = defaultdict(list)
     frequency = defaultdict(list)
 
     for project, s1 in results.items():
+        widths[project] = [r["params"]["W"] for r in s1]
         area[project] = [r["comb_area"] for r in s1]
         frequency[project] = [r["f_max_mhz"] for r in s1]
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
 
     for label, areas in area.items():
-        ax1.plot(w_sweep, areas, marker='o', label=label)
+        ax1.plot(widths[label], areas, marker='o', label=label)
     ax1.set_ylabel('Cell Area (µm²)')
     ax1.grid(True, ls="--", alpha=0.7)
     ax1.legend(ncol=2)
 
     for label, f_maxs in frequency.items():
-        ax2.plot(w_sweep, f_maxs, marker='s', label=label)
+        ax2.plot(widths[label], f_maxs, marker='s', label=label)
     ax2.set_xlabel('Width (W)')
     ax2.set_ylabel('Max Frequency (MHz)')
     ax2.grid(True, ls="--", alpha=0.7)
@@ -59,3 +61,49 @@ def plot_results(plotpath: pathlib.Path, w_sweep: list[int], results: dict) -> N
     plt.tight_layout()
 
     plt.savefig(plotpath, dpi=300)
+
+
+def plot_pareto(plotpath: pathlib.Path, curves: list[dict]) -> None:
+    """Area against achieved f_max, one panel per W and one curve per design.
+
+    Each curve carries all of its mapped points and, joined by a line, the
+    Pareto-optimal subset ('front').
+    """
+
+    widths = sorted({c['params']['W'] for c in curves})
+    ncols = min(len(widths), 4)
+    nrows = -(-len(widths) // ncols)
+
+    fig, axes = plt.subplots(
+        nrows, ncols, figsize=(4 * ncols, 3.5 * nrows), squeeze=False
+    )
+
+    for ax, w in zip(axes.flat, widths):
+        for c in (c for c in curves if c['params']['W'] == w):
+            points = [p for p in c['points'] if p['f_max_mhz'] is not None]
+            (line,) = ax.plot(
+                [p['f_max_mhz'] for p in c['front']],
+                [p['area'] for p in c['front']],
+                marker='o',
+                label=c['design'],
+            )
+            ax.scatter(
+                [p['f_max_mhz'] for p in points],
+                [p['area'] for p in points],
+                color=line.get_color(),
+                alpha=0.3,
+                s=12,
+            )
+        ax.set_title(f'W={w}')
+        ax.set_xlabel('Max Frequency (MHz)')
+        ax.set_ylabel('Cell Area (µm²)')
+        ax.grid(True, ls="--", alpha=0.7)
+        ax.legend()
+
+    for ax in list(axes.flat)[len(widths):]:
+        ax.set_visible(False)
+
+    plt.suptitle('Area vs. Achieved Frequency by ABC Delay Target (Sky130 HD)')
+    plt.tight_layout()
+
+    plt.savefig(plotpath, dpi=300)
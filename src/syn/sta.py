@@ -25,9 +25,62 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
+import functools
 import os
 import pathlib
 
+# Timing report used by both one-shot and session-based runs
+_REPORT_CHECKS = (
+    "report_checks -path_delay max -format full_clock_expanded "
+    "-fields {fanout cap slew} -digits 4"
+)
+
+# Precedes each corner's report in multi-corner runs
+_CORNER_MARK = "__opensta_corner__"
+
+# Longest a session may take to answer one batch of commands (s) before it is
+# presumed hung, killed and restarted on next use.
+SESSION_TIMEOUT_S = 600
+
+
+def _liberty_cmds(corners: dict[str, pathlib.Path] | None) -> list[str]:
+    from .env import STDCELL_LIB_PATH
+
+    if not corners:
+        return [f"read_liberty {STDCELL_LIB_PATH}"]
+
+    # One analysis corner per liberty, all timed against the same netlist.
+    return [f"define_corners {' '.join(corners)}"] + [
+        f"read_liberty -corner {name} {lib}" for name, lib in corners.items()
+    ]
+
+
+def _report_cmds(corners: dict[str, pathlib.Path] | None) -> list[str]:
+    if not corners:
+        return [_REPORT_CHECKS]
+
+    cmds = list()
+    for name in corners:
+        cmds += [f"puts {{{_CORNER_MARK} {name}}}", f"{_REPORT_CHECKS} -corner {name}"]
+    return cmds
+
+
+def _split_corners(stdout: str) -> dict[str, str]:
+    # Report of each corner, keyed by name, from a multi-corner run.
+    sections = dict()
+    name = None
+    for line in stdout.splitlines(keepends=True):
+        if line.startswith(_CORNER_MARK):
+            name = line.split()[1]
+            sections[name] = ""
+        elif name is not None:
+            sections[name] += line
+    return sections
+
+
+# Set by setup_environment()
+OPENSTA_EXECUTABLE: str
+
 
 def setup_environment():
     global OPENSTA_EXECUTABLE
@@ -43,6 +96,158 @@ def setup_environment():
     OPENSTA_EXECUTABLE = str(opensta.resolve())
 
 
+@functools.cache
+def opensta_version() -> str:
+    from subprocess import run
+
+    cp = run([OPENSTA_EXECUTABLE, "-version"], capture_output=True, text=True)
+    return cp.stdout.strip()
+
+
+class OpenSTASession:
+    """Long-lived OpenSTA process with the standard-cell liberties preloaded.
+
+    Commands are written to the interpreter's stdin and the output of each
+    batch is delimited by echoing a sentinel, so the (expensive) liberty parse
+    is paid once for the lifetime of the session rather than once per probe.
+    """
+
+    _SENTINEL = "__opensta_session_done__"
+
+    def __init__(self, **kwargs):
+        self._corners = kwargs.get("corners")
+        self._echo = kwargs.get("echo", False)
+        self._timeout_s = kwargs.get("timeout_s", SESSION_TIMEOUT_S)
+
+        self._process = None
+        self._design = None
+
+    def start(self):
+        from subprocess import PIPE, STDOUT
+        from common.proc import Popen
+
+        self._process = Popen(
+            [OPENSTA_EXECUTABLE, "-no_splash", "-no_init"],
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        self.execute(_liberty_cmds(self._corners))
+
+    def close(self):
+        if self._process is None:
+            return
+
+        try:
+            self._process.stdin.write("exit\n")
+            self._process.stdin.flush()
+            self._process.wait(timeout=10)
+        except Exception:
+            self._process.kill()
+        self._process = None
+        self._design = None
+
+    def execute(self, cmds: list[str]) -> str:
+        if self._process is None:
+            self.start()
+
+        for cmd in cmds + [f"puts {self._SENTINEL}"]:
+            self._process.stdin.write(cmd + "\n")
+        self._process.stdin.flush()
+
+        stdout = self._read_until_sentinel()
+
+        # The session outlives any one job; charge its high-water mark to the
+        # job being metered.
+        from common import proc
+
+        proc.sample(self._process.pid)
+
+        if self._echo:
+            print(stdout)
+        return stdout
+
+    def _read_until_sentinel(self) -> str:
+        import select
+        import time
+
+        # Read the raw descriptor, never the buffered text stream, so that
+        # select() sees all pending output.
+        fd = self._process.stdout.fileno()
+        deadline = time.monotonic() + self._timeout_s
+
+        buf = b""
+        while True:
+            lines = buf.split(b"\n")
+            for i, line in enumerate(lines[:-1]):
+                if line.strip() == self._SENTINEL.encode():
+                    return b"".join(l + b"\n" for l in lines[:i]).decode(
+                        errors="replace"
+                    )
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._abort()
+                raise RuntimeError(
+                    f"OpenSTA session did not respond within {self._timeout_s}s."
+                )
+
+            (ready, _, _) = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+
+            if not (chunk := os.read(fd, 1 << 16)):
+                self._abort()
+                raise RuntimeError("OpenSTA session terminated unexpectedly.")
+            buf += chunk
+
+    def _abort(self):
+        # Kill a hung or dead session; the next command starts a fresh one.
+        self._process.kill()
+        self._process.wait()
+        self._process = None
+        self._design = None
+
+    def link(self, syn_v: pathlib.Path, top: str) -> str:
+        # Re-read only when the netlist changed since it was last linked.
+        design = (str(syn_v), os.stat(syn_v).st_mtime_ns, top)
+        if design == self._design:
+            return ""
+
+        stdout = self.execute([f"read_verilog {syn_v}", f"link_design {top}"])
+        self._design = design
+        return stdout
+
+    def report(self, frequency: float) -> str:
+        period_ns = 1000 / frequency
+        return self.execute(
+            [
+                f"create_clock -name clk -period {period_ns:.3f} [get_ports clk]",
+            ]
+            + _report_cmds(self._corners)
+        )
+
+
+_SESSIONS: dict[tuple, OpenSTASession] = dict()
+
+
+def get_session(corners: dict[str, pathlib.Path] | None = None) -> OpenSTASession:
+    """Return the per-process OpenSTA session for a set of corners, starting it
+    on first use."""
+    key = tuple(corners.items()) if corners else ()
+
+    if key not in _SESSIONS:
+        import atexit
+
+        session = OpenSTASession(corners=corners)
+        atexit.register(session.close)
+        _SESSIONS[key] = session
+
+    return _SESSIONS[key]
+
+
 class OpenSTARunner:
     def __init__(self, **kwargs):
         self._top = kwargs.get("top", "top")
@@ -53,24 +258,128 @@ class OpenSTARunner:
 
         # Optional arguments:
         self._echo = kwargs.get("echo", False)
+        self._session = kwargs.get("session")
+        self._cache = kwargs.get("cache")
+        self._corners = kwargs.get("corners")
 
         self._sdc_file = "design.sdc"
         self._opensta_file = "opensta.tcl"
         self._passed = False
+        self._slack = None
+        self._arrival = None
+        self._stdout = None
+        self._timing = dict()
 
     def run(self):
-        self._render_sdc()
-        self._render_opensta_script()
-        ec, stdout = self._run_opensta()
+        from common import trace
+
+        with trace.span(
+            "opensta",
+            top=self._top,
+            frequency=self._frequency,
+            session=self._session is not None,
+        ) as t:
+            (ec, cached) = self._run()
+            t.update(returncode=ec, cached=cached, slack=self._slack)
+
+    def _run(self) -> tuple[int, bool]:
+        cached = False
+        if self._cache is None:
+            ec, stdout = self._run_uncached()
+        else:
+            key = self._cache_key()
+            with self._cache.lock("opensta", key):
+                if (hit := self._cache.get("opensta", key)) is not None:
+                    (meta, _) = hit
+                    ec, stdout = meta["returncode"], meta["stdout"]
+                    cached = True
+                else:
+                    ec, stdout = self._run_uncached()
+                    # A crashed or killed run must not become a permanent hit.
+                    if ec == 0:
+                        self._cache.put(
+                            "opensta", key, meta={"returncode": ec, "stdout": stdout}
+                        )
         if self._echo:
             print(stdout)
         if ec != 0:
-            pass
+            # A partial report reads as a pass: no path is VIOLATED.
+            tail = "\n".join(stdout.splitlines()[-20:])
+            raise RuntimeError(f"OpenSTA failed (exit code {ec}):\n{tail}")
+        self._stdout = stdout
         self._passed = self._scan_opensta_output(stdout)
+        if self._corners:
+            self._timing = {
+                name: self._scan_opensta_timing(report)
+                for name, report in _split_corners(stdout).items()
+            }
+            # The worst corner stands for the run as a whole.
+            slacks = [t for t in self._timing.values() if t[0] is not None]
+            if slacks:
+                (self._slack, self._arrival) = min(slacks)
+        else:
+            self._slack, self._arrival = self._scan_opensta_timing(stdout)
+        return (ec, cached)
 
     def passed(self) -> bool:
         return self._passed
 
+    def slack(self) -> float | None:
+        """Worst setup slack (ns) of the reported path, if any."""
+        return self._slack
+
+    def arrival(self) -> float | None:
+        """Data arrival time (ns) of the worst reported path, if any."""
+        return self._arrival
+
+    def corner_min_periods(self) -> dict[str, float | None]:
+        """Minimum clock period (ns) of each analyzed corner."""
+        period_ns = 1000 / self._frequency
+        return {
+            name: None if slack is None else period_ns - slack
+            for name, (slack, _) in self._timing.items()
+        }
+
+    def report(self) -> str | None:
+        """Raw output of the timing report."""
+        return self._stdout
+
+    def min_period(self) -> float | None:
+        """Smallest clock period (ns) at which the worst path would pass.
+
+        All constrained paths in the design are register-to-register on the
+        single ideal clock, so slack scales one-for-one with the period.
+        """
+        if self._slack is None:
+            return None
+        return (1000 / self._frequency) - self._slack
+
+    def _run_uncached(self) -> tuple[int, str]:
+        if self._session is not None:
+            return self._run_opensta_session()
+
+        self._render_sdc()
+        self._render_opensta_script()
+        return self._run_opensta()
+
+    def _cache_key(self) -> str:
+        from .cache import compute_key, file_digest
+        from .env import STDCELL_LIB_PATH
+
+        if self._corners:
+            liberty = [f"{n}={file_digest(p)}" for n, p in self._corners.items()]
+        else:
+            liberty = [file_digest(STDCELL_LIB_PATH)]
+
+        return compute_key(
+            file_digest(self._syn_v),
+            self._top,
+            f"{1000 / self._frequency:.3f}",
+            _REPORT_CHECKS,
+            *liberty,
+            opensta_version(),
+        )
+
     def _render_sdc(self):
         with open(self._path / self._sdc_file, "w") as f:
             f.write(f"# SDC file\n")
@@ -79,22 +388,20 @@ class OpenSTARunner:
             f.write(f"create_clock -name clk -period {period_ns:.3f} [get_ports clk]\n")
 
     def _render_opensta_script(self):
-        from .env import STDCELL_LIB_PATH
-
         with open(self._path / self._opensta_file, "w") as f:
             f.write(f"# OpenSTA script\n")
             f.write(f"# Frequency: {self._frequency} MHz\n")
-            cmds = [
-                f"read_liberty {STDCELL_LIB_PATH}",
+            cmds = _liberty_cmds(self._corners) + [
                 f"read_verilog {self._syn_v}",
                 f"link_design {self._top}",
                 f"read_sdc {self._sdc_file}",
-                f"report_checks",
             ]
+            cmds += _report_cmds(self._corners)
             f.write("\n".join(cmds) + "\n")
 
-    def _run_opensta(self) -> int:
-        from subprocess import Popen, PIPE
+    def _run_opensta(self) -> tuple[int, str]:
+        from subprocess import PIPE
+        from common.proc import Popen
 
         p = Popen(
             [OPENSTA_EXECUTABLE, "-exit", self._opensta_file],
@@ -105,6 +412,20 @@ class OpenSTARunner:
         output, err = p.communicate()
         return p.returncode, output.decode()
 
+    def _run_opensta_session(self) -> tuple[int, str]:
+        import re
+
+        stdout = ""
+        try:
+            stdout += self._session.link(self._syn_v, self._top)
+            stdout += self._session.report(self._frequency)
+        except RuntimeError as e:
+            # The session was lost (and reset) part way through.
+            return (1, f"{stdout}{e}\n")
+
+        # The interpreter reports failed commands and carries on.
+        return (1 if re.search(r"^Error:", stdout, re.M) else 0, stdout)
+
     def _scan_opensta_output(self, stdout: str):
         import re
 
@@ -114,3 +435,21 @@ class OpenSTARunner:
                 passed = False
 
         return passed
+
+    def _scan_opensta_timing(self, stdout: str):
+        import re
+
+        slack = None
+        arrival = None
+
+        for line in stdout.splitlines():
+            if m := re.match(r"\s*(-?[\d\.]+)\s+slack \((MET|VIOLATED)\)", line):
+                if slack is None:
+                    slack = float(m.group(1))
+            elif m := re.match(r"\s*(-?[\d\.]+)\s+data arrival time", line):
+                # Reported once along the path and again (negated) in the
+                # slack summary; keep the first.
+                if arrival is None:
+                    arrival = float(m.group(1))
+
+        return (slack, arrival)
@@ -0,0 +1,198 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import json
+import pathlib
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key         TEXT PRIMARY KEY,
+    design      TEXT NOT NULL,
+    w           INTEGER,
+    radix       INTEGER,
+    params      TEXT NOT NULL,
+    tools       TEXT NOT NULL,
+    flow        TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    created     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_design_w ON results (design, w, radix);
+CREATE TABLE IF NOT EXISTS artifacts (
+    key         TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    created     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_kind ON artifacts (kind, created);
+"""
+
+
+def compute_result_key(design: str, params: dict, tools: dict, flow: dict) -> str:
+    from .cache import compute_key
+
+    return compute_key(design, params, tools, flow)
+
+
+class ResultsStore:
+    """Indexed SQLite store of completed sweep jobs.
+
+    Each row is one (design, params) result, keyed by a digest of the design,
+    its parameters, the tool versions and the flow options used to produce it.
+    W and RADIX_N are broken out into indexed columns for filtering.
+
+    Artifacts derived from many results (e.g. an exploration summary) are kept
+    alongside them as JSON documents of a named kind.
+    """
+
+    def __init__(self, path: pathlib.Path | str):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(path, timeout=60)
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def has(self, key: str) -> bool:
+        cur = self._db.execute("SELECT 1 FROM results WHERE key = ?", (key,))
+        return cur.fetchone() is not None
+
+    def get(self, key: str) -> dict | None:
+        cur = self._db.execute("SELECT result FROM results WHERE key = ?", (key,))
+        row = cur.fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(
+        self,
+        key: str,
+        design: str,
+        params: dict,
+        tools: dict,
+        flow: dict,
+        result: dict,
+    ) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    design,
+                    params.get("W"),
+                    params.get("RADIX_N"),
+                    json.dumps(params, sort_keys=True),
+                    json.dumps(tools, sort_keys=True),
+                    json.dumps(flow, sort_keys=True),
+                    json.dumps(result, default=str),
+                    time.time(),
+                ),
+            )
+
+    def query(
+        self,
+        designs: list[str] | None = None,
+        w_min: int | None = None,
+        w_max: int | None = None,
+        radix: int | None = None,
+        flow: dict | None = None,
+    ) -> list[dict]:
+        """Results matching the filters, ordered by design, W and radix.
+
+        The radix filter only applies to designs that are parameterized by
+        RADIX_N. Where a point was produced more than once (e.g. by different
+        tool versions), the most recent result is returned.
+        """
+        where: list[str] = ["1"]
+        args: list = []
+        if designs:
+            where.append(f"design IN ({', '.join('?' * len(designs))})")
+            args.extend(designs)
+        if w_min is not None:
+            where.append("w >= ?")
+            args.append(w_min)
+        if w_max is not None:
+            where.append("w <= ?")
+            args.append(w_max)
+        if radix is not None:
+            where.append("(radix IS NULL OR radix = ?)")
+            args.append(radix)
+        if flow is not None:
+            where.append("flow = ?")
+            args.append(json.dumps(flow, sort_keys=True))
+
+        cur = self._db.execute(
+            f"SELECT design, params, result FROM results WHERE {' AND '.join(where)} "
+            "ORDER BY design, w, radix, created",
+            args,
+        )
+
+        latest = dict()
+        for design, params, result in cur.fetchall():
+            latest[(design, params)] = json.loads(result)
+
+        return list(latest.values())
+
+    def put_artifact(self, key: str, kind: str, data: dict) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(data, default=str), time.time()),
+            )
+
+    def get_artifact(self, key: str) -> dict | None:
+        cur = self._db.execute("SELECT data FROM artifacts WHERE key = ?", (key,))
+        row = cur.fetchone()
+        return None if row is None else json.loads(row[0])
+
+
+def group_results(rows: list[dict]) -> dict[str, list[dict]]:
+    """Group results into plot series.
+
+    Series are named by design; designs present with more than one non-W
+    parameterization (e.g. several RADIX_N) get one series per variant.
+    """
+
+    def _variant(params: dict) -> tuple:
+        return tuple(sorted((k, v) for k, v in params.items() if k != "W"))
+
+    variants: dict[str, set[tuple]] = dict()
+    for r in rows:
+        variants.setdefault(r["design"], set()).add(_variant(r["params"]))
+
+    series: dict[str, list[dict]] = dict()
+    for r in rows:
+        name = r["design"]
+        if len(variants[name]) > 1:
+            name += "_" + "_".join(f"{k}{v}" for k, v in _variant(r["params"]))
+        series.setdefault(name, []).append(r)
+
+    for s in series.values():
+        s.sort(key=lambda r: r["params"]["W"])
+
+    return series
@@ -139,7 +139,10 @@ _TOP_MODULE = "top"
 
 
 def render_top(
-    out_dir: pathlib.Path, uut: str, params: None | dict = None
+    out_dir: pathlib.Path,
+    uut: str,
+    params: None | dict = None,
+    module_name: str = _TOP_MODULE,
 ) -> tuple[pathlib.Path, str]:
 
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -155,17 +158,17 @@ def render_top(
 
     template = jinja2.Template(_TOP_SV)
 
-    top_filename = f"{_TOP_MODULE}.sv"
+    top_filename = f"{module_name}.sv"
     out_path = out_dir / top_filename
 
     with open(out_path, "w") as f:
         f.write(
             template.render(
-                module_name=_TOP_MODULE, 
+                module_name=module_name,
                 uut=uut,
                 uut_parameters=uut_parameters,
                 W=params["W"],
             )
         )
 
-    return out_path.resolve(), _TOP_MODULE
+    return out_path.resolve(), module_name
@@ -0,0 +1,275 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    key         TEXT NOT NULL UNIQUE,
+    design      TEXT NOT NULL,
+    params      TEXT NOT NULL,
+    flow        TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    worker      TEXT,
+    lease       REAL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    result      TEXT,
+    error       TEXT,
+    updated     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, id);
+"""
+
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Seconds a claim stays valid without a heartbeat.
+LEASE_S = 120
+
+# Claims of a job before it is marked failed.
+MAX_ATTEMPTS = 3
+
+
+class WorkQueue:
+    """Sweep jobs shared between workers through a SQLite database.
+
+    The database may live on a filesystem shared by many hosts (provided it
+    honours POSIX locks). Workers claim jobs under an exclusive transaction,
+    so each job is handed to one worker at a time, and hold a lease on it
+    that they renew while running. A job whose lease expires, because its
+    worker died or lost the filesystem, is returned to the queue by the next
+    claim; after MAX_ATTEMPTS claims it is marked failed.
+    """
+
+    def __init__(self, path: pathlib.Path | str, lease_s: float = LEASE_S):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._path = path
+        self._lease_s = lease_s
+
+        # Transactions are managed explicitly (BEGIN IMMEDIATE).
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def publish(self, jobs: list[tuple[str, dict]], flow: dict) -> int:
+        """Queue jobs not already queued; returns the number added."""
+        from .cache import compute_key
+
+        now = time.time()
+        added = 0
+        with self._transaction():
+            for design, params in jobs:
+                cur = self._db.execute(
+                    "INSERT OR IGNORE INTO jobs (key, design, params, flow, state, "
+                    "updated) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        compute_key(design, params, flow),
+                        design,
+                        json.dumps(params),
+                        json.dumps(flow, sort_keys=True),
+                        PENDING,
+                        now,
+                    ),
+                )
+                added += cur.rowcount
+        return added
+
+    def claim(
+        self, worker: str, exclude: set[int] | None = None
+    ) -> tuple[int, str, dict, dict] | None:
+        """Lease the oldest pending job not in exclude: (id, design, params,
+        flow)."""
+        skip = sorted(exclude or ())
+
+        now = time.time()
+        with self._transaction():
+            self._expire(now)
+
+            row = self._db.execute(
+                "SELECT id, design, params, flow FROM jobs WHERE state = ? "
+                f"AND id NOT IN ({', '.join('?' * len(skip))}) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, *skip),
+            ).fetchone()
+            if row is None:
+                return None
+
+            (job_id, design, params, flow) = row
+            self._db.execute(
+                "UPDATE jobs SET state = ?, worker = ?, lease = ?, "
+                "attempts = attempts + 1, updated = ? WHERE id = ?",
+                (RUNNING, worker, now + self._lease_s, now, job_id),
+            )
+
+        return (job_id, design, json.loads(params), json.loads(flow))
+
+    def renew(self, job_id: int, worker: str) -> bool:
+        """Extend a lease; False if the job is no longer held by worker."""
+        now = time.time()
+        with self._transaction():
+            cur = self._db.execute(
+                "UPDATE jobs SET lease = ?, updated = ? "
+                "WHERE id = ? AND worker = ? AND state = ?",
+                (now + self._lease_s, now, job_id, worker, RUNNING),
+            )
+        return cur.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result: dict) -> bool:
+        """Record a result; False if the lease was lost in the meantime."""
+        with self._transaction():
+            cur = self._db.execute(
+                "UPDATE jobs SET state = ?, result = ?, lease = NULL, updated = ? "
+                "WHERE id = ? AND worker = ? AND state = ?",
+                (
+                    DONE,
+                    json.dumps(result, default=str),
+                    time.time(),
+                    job_id,
+                    worker,
+                    RUNNING,
+                ),
+            )
+        return cur.rowcount == 1
+
+    def release(self, job_id: int, worker: str) -> None:
+        """Return a claimed job to the queue without spending an attempt."""
+        with self._transaction():
+            self._db.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts - 1, worker = NULL, "
+                "lease = NULL, updated = ? WHERE id = ? AND worker = ? AND state = ?",
+                (PENDING, time.time(), job_id, worker, RUNNING),
+            )
+
+    def fail(self, job_id: int, worker: str, error: str) -> None:
+        with self._transaction():
+            self._db.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "error = ?, worker = NULL, lease = NULL, updated = ? "
+                "WHERE id = ? AND worker = ? AND state = ?",
+                (
+                    MAX_ATTEMPTS,
+                    FAILED,
+                    PENDING,
+                    error,
+                    time.time(),
+                    job_id,
+                    worker,
+                    RUNNING,
+                ),
+            )
+
+    def results(self) -> list[tuple[str, dict, dict, dict]]:
+        """Completed jobs as (design, params, flow, result), in queue order."""
+        cur = self._db.execute(
+            "SELECT design, params, flow, result FROM jobs WHERE state = ? "
+            "ORDER BY id",
+            (DONE,),
+        )
+        return [
+            (design, json.loads(params), json.loads(flow), json.loads(result))
+            for design, params, flow, result in cur.fetchall()
+        ]
+
+    def counts(self) -> dict[str, int]:
+        with self._transaction():
+            self._expire(time.time())
+        cur = self._db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state")
+        return dict(cur.fetchall())
+
+    def heartbeat(self, job_id: int, worker: str) -> "_Heartbeat":
+        """Context manager renewing the lease on job_id from a thread."""
+        return _Heartbeat(self._path, self._lease_s, job_id, worker)
+
+    def _expire(self, now: float) -> None:
+        # Re-queue (or give up on) jobs whose worker stopped renewing.
+        self._db.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "error = 'lease expired (worker ' || worker || ')', worker = NULL, "
+            "lease = NULL, updated = ? WHERE state = ? AND lease < ?",
+            (MAX_ATTEMPTS, FAILED, PENDING, now, RUNNING, now),
+        )
+
+    def _transaction(self):
+        import contextlib
+
+        @contextlib.contextmanager
+        def transaction():
+            # Take the write lock up front so that concurrent claims
+            # serialize instead of deadlocking on lock upgrade.
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+        return transaction()
+
+
+class _Heartbeat:
+    def __init__(self, path: pathlib.Path, lease_s: float, job_id: int, worker: str):
+        self._path = path
+        self._lease_s = lease_s
+        self._job_id = job_id
+        self._worker = worker
+
+        self._stop = threading.Event()
+        self._thread = None
+        self.lost = False
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        # SQLite connections are bound to their thread.
+        queue = WorkQueue(self._path, self._lease_s)
+        try:
+            while not self._stop.wait(self._lease_s / 3):
+                if not queue.renew(self._job_id, self._worker):
+                    self.lost = True
+                    return
+        finally:
+            queue.close()
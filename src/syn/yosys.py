@@ -25,11 +25,62 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
+import functools
 import os
 import pathlib
 
+# Technology mappings: 'liberty' maps to the standard cell library; 'generic'
+# maps to yosys' internal gate library only, which is much cheaper and gives
+# a cell count suitable for ranking candidates but no area or timing.
+MAPPINGS = ("liberty", "generic")
 
-def setup_environment():
+_GENERIC_GATES = "AND,NAND,OR,NOR,XOR,XNOR,ANDNOT,ORNOT,MUX"
+
+# ABC scripts of the mapping-recipe portfolio (abc -script). 'default' is
+# yosys' own liberty script; every other recipe ends in a liberty mapping.
+ABC_RECIPES = {
+    "default": None,
+    # Classic AIG rewriting, then delay-oriented mapping
+    "resyn2": [
+        "strash",
+        "balance; rewrite; refactor; balance; rewrite; rewrite -z",
+        "balance; refactor -z; rewrite -z; balance",
+        "map",
+    ],
+    # Structural choices, mapped for area or for delay
+    "dch_area": ["strash", "dch -f", "map -a"],
+    "dch": ["strash", "dch -f", "map"],
+    # LUT mapping with don't-care resynthesis, re-strashed for &nf
+    "if_mfs": [
+        "strash",
+        "&get -n",
+        "&st",
+        "&if -K 6",
+        "&mfs",
+        "&st",
+        "&dch -f",
+        "&nf",
+        "&put",
+    ],
+    # SOP balancing for delay
+    "sopb": [
+        "strash",
+        "&get -n",
+        "&st",
+        "&synch2",
+        "&if -g",
+        "&st",
+        "&dch -f",
+        "&nf",
+        "&put",
+    ],
+}
+
+# Set by setup_environment()
+SYNLIG_EXECUTABLE: str
+
+
+def setup_environment() -> str:
     global SYNLIG_EXECUTABLE
 
     synlig_root = os.environ.get("SYNLIG_ROOT")
@@ -41,6 +92,15 @@ def setup_environment():
         raise EnvironmentError(f"Synlig executable not found at: {synlig}")
 
     SYNLIG_EXECUTABLE = str(synlig.resolve())
+    return SYNLIG_EXECUTABLE
+
+
+@functools.cache
+def synlig_version() -> str:
+    from subprocess import run
+
+    cp = run([SYNLIG_EXECUTABLE, "-V"], capture_output=True, text=True)
+    return cp.stdout.strip()
 
 
 class SynligRunner:
@@ -52,85 +112,646 @@ class SynligRunner:
 
         # Optional arguments:
         self._syn_v = kwargs.get("syn_v", "syn.v")
+        # Optional JSON netlist (write_json), for netlist-level estimation
+        self._syn_json = kwargs.get("syn_json")
         self._script_tcl = kwargs.get("script_tcl", "synlig.tcl")
+        self._log = kwargs.get("log", "synlig.log")
+        self._stat_json = kwargs.get("stat_json", "stat.json")
         self._top = kwargs.get("top", "top")
+        self._params = kwargs.get("params", {})
         self._echo = kwargs.get("echo", False)
+        self._cache = kwargs.get("cache")
+        self._mapping = kwargs.get("mapping", "liberty")
+        # Timing-driven mapping: ABC delay target (ps) and, with buffering,
+        # buffer insertion and gate sizing against the constraints file.
+        self._delay_ps = kwargs.get("delay_ps")
+        self._buffering = kwargs.get("buffering", False)
+        self._constr = kwargs.get("constr", "abc.constr")
+        # ABC script from ABC_RECIPES; None keeps yosys' default.
+        self._recipe = kwargs.get("recipe")
+        self._abc_script = kwargs.get("abc_script", "abc.script")
+
+        if self._recipe is not None and self._recipe not in ABC_RECIPES:
+            raise ValueError(f"Unknown ABC recipe: {self._recipe}")
+
+        if self._mapping not in MAPPINGS:
+            raise ValueError(f"Unknown mapping: {self._mapping}")
 
         # Results
         self._total_area = None
         self._sequential_area = None
+        self._stats = None
+        self._cached = False
 
     def run(self):
+        from common import trace
+
+        with trace.span(
+            "synlig", top=self._top, mapping=self._mapping, delay_ps=self._delay_ps
+        ) as t:
+            self._run()
+            t.update(cached=self._cached)
+
+    def _run(self):
         self._render_synlig_script()
-        ec, stdout = self._run_synlig()
-        if self._echo:
-            print(stdout)
-        if ec:
-            raise RuntimeError("Synlig synthesis failed.")
-        self._total_area, self._sequential_area = self._scan_synlig_output(stdout)
+
+        if self._cache is None:
+            self._run_uncached()
+            return
+
+        key = self._cache_key()
+        with self._cache.lock("synlig", key):
+            if self._restore_cached(key):
+                return
+
+            self._run_uncached()
+            self._store_cached(key)
 
     def area(self) -> tuple[float, float]:
         return (self._total_area, self._sequential_area)
 
-    def _render_synlig_script(self):
+    def stats(self) -> dict:
+        """Cell statistics of the synthesized top-level.
+
+        Keys: 'total_area', 'sequential_area', 'cell_count', 'wire_count',
+        'wire_bits' and 'cells', a map of cell type to its 'count' and total
+        'area'.
+        """
+        return self._stats
+
+    def cached(self) -> bool:
+        return self._cached
+
+    def _run_uncached(self):
+        ec, log_areas = _stream_synlig(
+            self._script_tcl, self._path, self._path / self._log, self._echo
+        )
+        if ec:
+            raise RuntimeError("Synlig synthesis failed.")
+        # Fall back to the last module reported should the tool rename the top.
+        fallback = next(reversed(log_areas.values()), (None, None))
+        self._complete(log_areas.get(self._top, fallback))
+
+    def _complete(self, log_areas: tuple[float | None, float | None]):
+        self._stats = self._read_stats(log_areas)
+        self._total_area = self._stats["total_area"]
+        self._sequential_area = self._stats["sequential_area"]
+
+    def _restore_cached(self, key: str) -> bool:
+        import shutil
+
+        if (hit := self._cache.get("synlig", key)) is None:
+            return False
+
+        (meta, entry) = hit
+        shutil.copyfile(entry / "top_syn.v", self._syn_v)
+        if self._syn_json is not None:
+            shutil.copyfile(entry / "top_syn.json", self._syn_json)
+        self._stats = meta["stats"]
+        self._total_area = self._stats["total_area"]
+        self._sequential_area = self._stats["sequential_area"]
+        self._cached = True
+        return True
+
+    def _store_cached(self, key: str):
+        files = {"top_syn.v": self._syn_v}
+        if self._syn_json is not None:
+            files.update({"top_syn.json": self._syn_json})
+
+        self._cache.put("synlig", key, meta={"stats": self._stats}, files=files)
+
+    def _read_stats(self, log_areas: tuple[float | None, float | None]) -> dict:
+        import json
         from .env import STDCELL_LIB_PATH
+        from .liberty import read_cells
 
-        with open(self._path / self._script_tcl, "w") as f:
-            f.write(f"# Synlig script\n")
+        (total_area, sequential_area) = log_areas
 
-            cmds = []
+        with open(self._path / self._stat_json, "r") as f:
+            report = json.load(f)
 
-            include_files = [
-                f"-I{str(include_path)}" for include_path in self._include_paths
-            ]
+        # Single (flattened) module; the design summary covers it.
+        design = report.get("design") or next(iter(report["modules"].values()))
+
+        liberty = read_cells(STDCELL_LIB_PATH) if self._mapping == "liberty" else {}
+
+        cells = dict()
+        for cell_type, count in design.get("num_cells_by_type", {}).items():
+            area = (liberty.get(cell_type) or {}).get("area")
+            cells[cell_type] = {
+                "count": count,
+                "area": None if area is None else area * count,
+            }
+
+        if "area" in design:
+            total_area = design["area"]
+
+        if "sequential_area" in design:
+            sequential_area = design["sequential_area"]
+        elif sequential_area is None:
+            sequential_area = sum(
+                c["area"] or 0.0
+                for t, c in cells.items()
+                if (liberty.get(t) or {}).get("sequential")
+            )
+
+        return {
+            "total_area": total_area,
+            "sequential_area": sequential_area,
+            "cell_count": design.get("num_cells"),
+            "wire_count": design.get("num_wires"),
+            "wire_bits": design.get("num_wire_bits"),
+            "cells": cells,
+        }
 
-            for src in self._sources:
-                cmds.append(
-                    f'read_systemverilog {" ".join(include_files)} -defer {str(src)}'
-                )
-
-            cmds += [
-                "read_systemverilog -link",
-                f"hierarchy -check -top {self._top}",
-                "flatten",
-                "proc",
-                "opt",
-                "dfflegalize",
+    def _cache_key(self) -> str:
+        from .cache import compute_key, file_digest
+        from .env import STDCELL_LIB_PATH
+
+        # Absolute paths differ between checkouts and build dirs; substitute
+        # them so that only file contents and the flow itself form the key.
+        with open(self._path / self._script_tcl, "r") as f:
+            script = f.read()
+        substitutions = [(str(STDCELL_LIB_PATH), "<liberty>")]
+        substitutions += [(str(self._syn_v), "<syn_v>")]
+        if self._syn_json is not None:
+            substitutions += [(str(self._syn_json), "<syn_json>")]
+        substitutions += [(str(self._path / self._stat_json), "<stat_json>")]
+        substitutions += [(str(self._path / self._constr), "<constr>")]
+        substitutions += [(str(self._path / self._abc_script), "<abc_script>")]
+        substitutions += [(str(src), f"<src:{src.name}>") for src in self._sources]
+        substitutions += [
+            (str(inc), f"<inc:{i}>") for i, inc in enumerate(self._include_paths)
+        ]
+        for orig, repl in sorted(substitutions, key=lambda x: -len(x[0])):
+            script = script.replace(orig, repl)
+
+        headers = sorted(
+            (h.name, file_digest(h))
+            for inc in self._include_paths
+            for h in pathlib.Path(inc).glob("*.svh")
+        )
+
+        constraints = [self._abc_constraints()] if self._buffering else []
+        if (recipe := self._recipe_script()) is not None:
+            constraints.append(recipe)
+
+        return compute_key(
+            sorted((src.name, file_digest(src)) for src in self._sources),
+            headers,
+            self._params,
+            self._top,
+            script,
+            file_digest(STDCELL_LIB_PATH),
+            synlig_version(),
+            *constraints,
+        )
+
+    def _read_cmds(self) -> list[str]:
+        cmds = []
+
+        include_files = [
+            f"-I{str(include_path)}" for include_path in self._include_paths
+        ]
+
+        for src in self._sources:
+            cmds.append(
+                f'read_systemverilog {" ".join(include_files)} -defer {str(src)}'
+            )
+
+        cmds += [
+            "read_systemverilog -link",
+        ]
+        return cmds
+
+    def _elaboration_cmds(self) -> list[str]:
+        return [
+            f"hierarchy -check -top {self._top}",
+            "flatten",
+            "proc",
+            "opt",
+        ]
+
+    def _synthesis_cmds(self) -> list[str]:
+        stat_json = self._path / self._stat_json
+
+        cmds = self._elaboration_cmds()
+
+        if self._mapping == "generic":
+            return cmds + [
                 "techmap",
-                f"dfflibmap -liberty {STDCELL_LIB_PATH}",
-                f"abc -liberty {STDCELL_LIB_PATH}",
-                "opt",
+                "opt -fast",
+                f"abc -g {_GENERIC_GATES}",
                 "opt_clean -purge",
-                "check",
                 f"write_verilog -noattr -noexpr {str(self._syn_v)}",
-                f"stat -liberty {STDCELL_LIB_PATH}",
+                "stat",
+                f"tee -q -o {stat_json} stat -json",
             ]
+
+        return cmds + self._pre_abc_cmds() + self._map_cmds()
+
+    def _pre_abc_cmds(self) -> list[str]:
+        from .env import STDCELL_LIB_PATH
+
+        return [
+            "dfflegalize",
+            "techmap",
+            f"dfflibmap -liberty {STDCELL_LIB_PATH}",
+        ]
+
+    def _map_cmds(self) -> list[str]:
+        from .env import STDCELL_LIB_PATH
+
+        stat_json = self._path / self._stat_json
+
+        abc = f"abc -liberty {STDCELL_LIB_PATH}"
+        if self._delay_ps is not None:
+            abc += f" -D {self._delay_ps}"
+        if self._buffering:
+            abc += f" -constr {self._path / self._constr}"
+        if self._recipe_script() is not None:
+            abc += f" -script {self._path / self._abc_script}"
+
+        write_json = []
+        if self._syn_json is not None:
+            write_json = [f"write_json {str(self._syn_json)}"]
+
+        return [
+            abc,
+            "opt",
+            "opt_clean -purge",
+            "check",
+            f"write_verilog -noattr -noexpr {str(self._syn_v)}",
+            *write_json,
+            f"stat -liberty {STDCELL_LIB_PATH}",
+            f"tee -q -o {stat_json} stat -json -liberty {STDCELL_LIB_PATH}",
+        ]
+
+    def _abc_constraints(self) -> str:
+        from .env import ABC_DRIVING_CELL, ABC_OUTPUT_LOAD
+
+        return f"set_driving_cell {ABC_DRIVING_CELL}\nset_load {ABC_OUTPUT_LOAD}\n"
+
+    def _recipe_script(self) -> str | None:
+        if (recipe := ABC_RECIPES.get(self._recipe)) is None:
+            return None
+        return "\n".join(recipe) + "\n"
+
+    def _render_synlig_script(self):
+        if self._buffering:
+            with open(self._path / self._constr, "w") as f:
+                f.write(self._abc_constraints())
+
+        if (recipe := self._recipe_script()) is not None:
+            with open(self._path / self._abc_script, "w") as f:
+                f.write(recipe)
+
+        with open(self._path / self._script_tcl, "w") as f:
+            f.write(f"# Synlig script\n")
+
+            cmds = self._read_cmds() + self._synthesis_cmds()
             f.write("\n".join(cmds) + "\n")
 
-    def _run_synlig(self) -> int:
-        from subprocess import Popen, PIPE
 
-        p = Popen(
-            [SYNLIG_EXECUTABLE, "-s", self._script_tcl],
-            stdout=PIPE,
-            stderr=PIPE,
-            cwd=self._path,
+class SynligBatchRunner:
+    """Synthesize several parameterizations in a single Synlig session.
+
+    Each parameterization is described by a SynligRunner with its own top
+    module, netlist and stat report. The union of their sources is read and
+    elaborated once and saved with 'design -save'; every parameterization is
+    then mapped from a fresh 'design -load' of that snapshot. Results are
+    cached per parameterization under the same keys SynligRunner uses, so
+    hits are restored without joining the batch.
+    """
+
+    def __init__(self, **kwargs):
+        # Required arguments:
+        self._path = kwargs.get("path")
+        self._runners: list[SynligRunner] = kwargs.get("runners", [])
+
+        # Optional arguments:
+        self._script_tcl = kwargs.get("script_tcl", "synlig_batch.tcl")
+        self._log = kwargs.get("log", "synlig_batch.log")
+        self._echo = kwargs.get("echo", False)
+
+    def run(self):
+        from common import trace
+
+        with trace.span("synlig_batch", variants=len(self._runners)):
+            self._run()
+
+    def _run(self):
+        import contextlib
+
+        os.makedirs(self._path, exist_ok=True)
+
+        for runner in self._runners:
+            runner._render_synlig_script()
+
+        with contextlib.ExitStack() as stack:
+            pending = list()
+
+            keyed = [
+                (r, r._cache_key() if r._cache is not None else None)
+                for r in self._runners
+            ]
+            # Acquire locks in a global order to avoid deadlock between
+            # overlapping batches.
+            for runner, key in sorted(keyed, key=lambda x: x[1] or ""):
+                if key is not None:
+                    stack.enter_context(runner._cache.lock("synlig", key))
+                    if runner._restore_cached(key):
+                        continue
+                pending.append((runner, key))
+
+            if not pending:
+                return
+
+            self._render_synlig_script([r for r, _ in pending])
+            ec, log_areas = _stream_synlig(
+                self._script_tcl, self._path, self._path / self._log, self._echo
+            )
+            if ec:
+                raise RuntimeError("Synlig batch synthesis failed.")
+
+            for runner, key in pending:
+                runner._complete(log_areas.get(runner._top, (None, None)))
+                if key is not None:
+                    runner._store_cached(key)
+
+    def _render_synlig_script(self, runners: list[SynligRunner]):
+        cmds = list()
+        for runner in runners:
+            for cmd in runner._read_cmds():
+                if cmd not in cmds:
+                    cmds.append(cmd)
+
+        # Link must follow every deferred read.
+        cmds.remove("read_systemverilog -link")
+        cmds += ["read_systemverilog -link", "design -save elaborated"]
+
+        for runner in runners:
+            cmds += ["design -load elaborated"] + runner._synthesis_cmds()
+
+        with open(self._path / self._script_tcl, "w") as f:
+            f.write(f"# Synlig batch script\n")
+            f.write("\n".join(cmds) + "\n")
+
+
+class SynligPortfolioRunner:
+    """Map one design with several ABC recipes racing in parallel.
+
+    Each recipe is described by a SynligRunner with its own build directory
+    and 'recipe'. The design is elaborated and prepared for ABC once and
+    written as RTLIL; every recipe then maps that snapshot in its own Synlig
+    process. Once the first recipe finishes, any recipe still running after
+    'budget' times its runtime is killed. Results are cached per recipe under
+    the same keys SynligRunner uses.
+
+    The recipes run concurrently, so the peak memory of a portfolio is up to
+    that of one Synlig process times the number of recipes.
+    """
+
+    def __init__(self, **kwargs):
+        # Required arguments:
+        self._path = kwargs.get("path")
+        self._runners: dict[str, SynligRunner] = kwargs.get("runners", {})
+        self._budget = kwargs.get("budget")
+
+        # Optional arguments:
+        self._script_tcl = kwargs.get("script_tcl", "synlig_elaborate.tcl")
+        self._log = kwargs.get("log", "synlig_elaborate.log")
+        self._rtlil = kwargs.get("rtlil", "elaborated.il")
+        self._echo = kwargs.get("echo", False)
+
+        # Recipe name to 'done', 'cached', 'cut' or 'failed', and runtime (s)
+        self._status = dict()
+        self._runtime = dict()
+
+    def run(self):
+        from common import trace
+
+        with trace.span("synlig_portfolio", recipes=len(self._runners)) as t:
+            self._run()
+            t.update(status=self._status)
+
+    def status(self) -> dict[str, str]:
+        return self._status
+
+    def runtime(self) -> dict[str, float | None]:
+        return self._runtime
+
+    def _run(self):
+        import contextlib
+
+        os.makedirs(self._path, exist_ok=True)
+
+        for runner in self._runners.values():
+            runner._render_synlig_script()
+
+        with contextlib.ExitStack() as stack:
+            pending = dict()
+
+            keyed = [
+                (name, r._cache_key() if r._cache is not None else None)
+                for name, r in self._runners.items()
+            ]
+            for name, key in sorted(keyed, key=lambda x: x[1] or ""):
+                runner = self._runners[name]
+                if key is not None:
+                    stack.enter_context(runner._cache.lock("synlig", key))
+                    if runner._restore_cached(key):
+                        self._status[name] = "cached"
+                        self._runtime[name] = None
+                        continue
+                pending[name] = key
+
+            if not pending:
+                return
+
+            self._elaborate(next(iter(self._runners.values())))
+            self._race(list(pending))
+
+            for name, key in pending.items():
+                if key is not None and self._status[name] == "done":
+                    self._runners[name]._store_cached(key)
+
+    def _elaborate(self, runner: SynligRunner):
+        cmds = runner._read_cmds() + runner._elaboration_cmds()
+        cmds += runner._pre_abc_cmds()
+        cmds += [f"write_rtlil {self._path / self._rtlil}"]
+
+        with open(self._path / self._script_tcl, "w") as f:
+            f.write(f"# Synlig elaboration script\n")
+            f.write("\n".join(cmds) + "\n")
+
+        ec, _ = _stream_synlig(
+            self._script_tcl, self._path, self._path / self._log, self._echo
         )
-        output, err = p.communicate()
-        return (p.returncode, output.decode())
+        if ec:
+            raise RuntimeError("Synlig elaboration failed.")
+
+    def _race(self, names: list[str]):
+        import threading
+        import time
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        procs = dict()
+        lock = threading.Lock()
+        cut: set[str] = set()
+
+        def _map(name: str):
+            runner = self._runners[name]
+            script = runner._path / "synlig_map.tcl"
+            with open(script, "w") as f:
+                f.write(f"# Synlig mapping script ({name})\n")
+                cmds = [f"read_rtlil {self._path / self._rtlil}"]
+                f.write("\n".join(cmds + runner._map_cmds()) + "\n")
+
+            def _started(p):
+                with lock:
+                    procs[name] = p
+                    if name in cut:
+                        _kill(p)
+
+            start = time.monotonic()
+            ec, log_areas = _stream_synlig(
+                script.name,
+                runner._path,
+                runner._path / "synlig_map.log",
+                self._echo,
+                on_start=_started,
+            )
+            return (ec, log_areas, time.monotonic() - start)
+
+        start = time.monotonic()
+        deadline = None
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {executor.submit(_map, name): name for name in names}
+            running = set(futures)
+            while running:
+                # Once the cut is made, wait out the killed recipes.
+                timeout = None
+                if deadline is not None and not cut:
+                    timeout = max(deadline - time.monotonic(), 0.0)
+                (done, running) = wait(running, timeout, FIRST_COMPLETED)
+
+                for future in done:
+                    name = futures[future]
+                    try:
+                        (ec, log_areas, runtime) = future.result()
+                    except RuntimeError:
+                        (ec, runtime) = (1, None)
+                    self._runtime[name] = runtime
+
+                    # A recipe may finish before its kill lands.
+                    if ec and name in cut:
+                        self._status[name] = "cut"
+                    elif ec:
+                        self._status[name] = "failed"
+                    else:
+                        runner = self._runners[name]
+                        fallback = next(reversed(log_areas.values()), (None, None))
+                        runner._complete(log_areas.get(runner._top, fallback))
+                        self._status[name] = "done"
+
+                        if deadline is None:
+                            elapsed = time.monotonic() - start
+                            deadline = start + self._budget * elapsed
+
+                # Unpromising recipes: still mapping past the budget.
+                if deadline is not None and not cut and time.monotonic() >= deadline:
+                    with lock:
+                        for future in running:
+                            name = futures[future]
+                            cut.add(name)
+                            if name in procs:
+                                _kill(procs[name])
+
+
+def _kill(p) -> None:
+    # Synlig and the ABC processes it spawned share a process group.
+    import signal
+
+    try:
+        os.killpg(p.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _stream_synlig(
+    script_tcl: str,
+    cwd: pathlib.Path,
+    log_path: pathlib.Path,
+    echo: bool,
+    on_start=None,
+) -> tuple[int, dict[str, tuple[float | None, float | None]]]:
+    import re
+    from subprocess import PIPE, STDOUT
+    from common import trace
+    from common.proc import Popen
+
+    # Output is streamed to the log (and optionally stdout) line by line
+    # rather than buffered; fatal errors terminate the run immediately.
+    # Processes handed to 'on_start' lead their own process group, so that
+    # they can be killed together with their children.
+    p = Popen(
+        [SYNLIG_EXECUTABLE, "-s", script_tcl],
+        stdout=PIPE,
+        stderr=STDOUT,
+        cwd=cwd,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        start_new_session=on_start is not None,
+    )
+    if on_start is not None:
+        on_start(p)
+
+    # Areas reported by 'stat', per module; used where the JSON report lacks
+    # them.
+    areas: dict[str, tuple[float | None, float | None]] = dict()
+    module = None
+
+    # Top-level passes ('N. Executing X pass ...') delimit the phases traced
+    # within the session (Surelog parse, ABC mapping, ...).
+    tracing = trace.enabled()
+    phase = None
+
+    def _end_phase():
+        if phase is not None:
+            trace.event(f"synlig:{phase[0]}", phase[1], trace.now_us(), cat="synlig")
+
+    assert p.stdout is not None
+    with p, open(log_path, "w") as log:
+        # End the phase on every exit: the one that failed matters most.
+        try:
+            for line in p.stdout:
+                log.write(line)
+                if echo:
+                    print(line, end="")
 
-    def _scan_synlig_output(self, stdout: str):
-        import re
+                if tracing and (
+                    m := re.match(r"\d+\. Executing ([^:(]+?)[\s.]*(?:[:(]|$)", line)
+                ):
+                    _end_phase()
+                    phase = (m.group(1), trace.now_us())
 
-        total_area = None
-        sequential_area = None
+                if re.match(r"(ERROR:|\[FATAL:)", line):
+                    p.kill()
+                    raise RuntimeError(f"Synlig synthesis failed: {line.strip()}")
 
-        for line in stdout.splitlines():
-            if m := re.search(r"Chip area for module \'\\top\': ([\d\.]+)", line):
-                total_area = float(m.group(1))
-            elif m := re.search(
-                r"of which used for sequential elements: ([\d\.]+)", line
-            ):
-                sequential_area = float(m.group(1))
+                if m := re.search(
+                    r"Chip area for module \'\\([^\']+)\': ([\d\.]+)", line
+                ):
+                    module = m.group(1)
+                    areas[module] = (float(m.group(2)), None)
+                elif m := re.search(
+                    r"of which used for sequential elements: ([\d\.]+)", line
+                ):
+                    if module is not None:
+                        areas[module] = (areas[module][0], float(m.group(1)))
+        finally:
+            _end_phase()
 
-        return (total_area, sequential_area)
+    return (p.returncode, areas)
@@ -46,7 +46,8 @@ def main():
 
         from .tb import main as tb_main
 
-        tb_main()
+        if tb_main():
+            sys.exit(1)
 
         sys.exit(0)
 
@@ -0,0 +1,337 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import pathlib
+import re
+import time
+
+# Reference architecture; every other design is proven equivalent to it.
+GOLD = "n"
+
+# Widths proven by 'regress --formal' (override with --widths)
+FORMAL_WS = [8, 16, 32, 64]
+
+# Per-proof SAT solver timeout (s); 0 for none.
+PROOF_TIMEOUT_S = 600
+
+_BUILD_DIR = pathlib.Path("build_formal")
+
+# Wrapper proven in place of each design: outputs outside the specification
+# are masked so that they cannot distinguish the designs. y and y_enc are
+# only defined when any is set, and pos beyond W - 1 (non power-of-two W) is
+# not a valid input.
+_WRAPPER_SV = """\
+`include "common_defs.svh"
+
+module {{module_name}} (
+  input wire logic [{{W}} - 1:0]                 x_i
+, input wire logic [$clog2({{W}}) - 1:0]         pos_i
+
+//
+, output wire logic                              any_o
+, output wire logic [{{W}} - 1:0]                y_o
+, output wire logic [$clog2({{W}}) - 1:0]        y_enc_o
+);
+
+logic                           uut_any_o;
+logic [{{W}} - 1:0]             uut_y_o;
+logic [$clog2({{W}}) - 1:0]     uut_y_enc_o;
+
+{{uut}} #(.W({{W}})) u_uut (
+  //
+  .x_i                  (x_i)
+, .pos_i                (pos_i)
+//
+, .any_o                (uut_any_o)
+, .y_o                  (uut_y_o)
+, .y_enc_o              (uut_y_enc_o)
+);
+
+assign any_o = (pos_i < {{W}}) & uut_any_o;
+assign y_o = any_o ? uut_y_o : '0;
+assign y_enc_o = any_o ? uut_y_enc_o : '0;
+
+endmodule : {{module_name}}
+"""
+
+_SAT_RESULT = re.compile(r"SAT proof finished - (no model found|model found)")
+
+# Counterexample inputs, from the binary column of 'sat -show-inputs'.
+_SAT_INPUT = re.compile(r"^\s*\\in_(x_i|pos_i)\s+\S+\s+\S+\s+([01]+)\s*$", re.M)
+
+
+def _module_name(design: str) -> str:
+    return f"formal_{design}"
+
+
+class EquivalenceRunner:
+    """Prove a design equivalent to the reference for one W.
+
+    Both designs are elaborated (and cached as RTLIL) on their own, since
+    their shared library modules may differ, then compared with a miter of
+    the two wrappers and 'sat -prove'. Runners sharing a reference should be
+    handed its elaboration as 'gold_il'.
+    """
+
+    def __init__(self, **kwargs):
+        # Required arguments:
+        self._gate = kwargs.get("gate")
+        self._w = kwargs.get("w")
+        self._executable = kwargs.get("executable")
+
+        # Optional arguments:
+        self._gold = kwargs.get("gold", GOLD)
+        self._gold_il = kwargs.get("gold_il")
+        self._path = kwargs.get("path", _BUILD_DIR / f"w{self._w}")
+        self._timeout_s = kwargs.get("timeout_s", PROOF_TIMEOUT_S)
+        self._echo = kwargs.get("echo", False)
+
+        # Results
+        self._status = None
+        self._proof_s = None
+        self._counterexample = None
+
+    def run(self):
+        from common import trace
+
+        with trace.span("formal", gold=self._gold, gate=self._gate, w=self._w) as t:
+            gold_il = self._gold_il
+            if gold_il is None:
+                gold_il = self._elaborate(self._gold)
+            gate_il = self._elaborate(self._gate)
+            self._prove(gold_il, gate_il)
+            t.update(status=self._status)
+
+    def result(self) -> dict:
+        """Outcome of the proof.
+
+        'status' is 'proven', 'failed' (with the (x, pos) 'counterexample')
+        or 'timeout'; 'proof_s' is the wall time of the proof alone.
+        """
+        return {
+            "gold": self._gold,
+            "gate": self._gate,
+            "w": self._w,
+            "status": self._status,
+            "proof_s": self._proof_s,
+            "counterexample": self._counterexample,
+        }
+
+    def _elaborate(self, design: str) -> pathlib.Path:
+        return elaborate(design, self._w, self._path, self._executable, self._echo)
+
+    def _prove(self, gold_il: pathlib.Path, gate_il: pathlib.Path):
+        gold = _module_name(self._gold)
+        gate = _module_name(self._gate)
+
+        timeout = f" -timeout {self._timeout_s}" if self._timeout_s else ""
+
+        cmds = [
+            f"read_rtlil {gold_il.resolve()}",
+            f"read_rtlil {gate_il.resolve()}",
+            f"miter -equiv -flatten -make_outputs -ignore_gold_x {gold} {gate} miter",
+            "hierarchy -top miter",
+            f"sat -prove trigger 0 -show-inputs{timeout} miter",
+        ]
+
+        start = time.monotonic()
+        log = _run_yosys(
+            self._executable, cmds, self._path, f"{self._gate}_equiv", self._echo
+        )
+        self._proof_s = time.monotonic() - start
+
+        if (m := _SAT_RESULT.search(log)) is None:
+            if "TIMEOUT" in log:
+                self._status = "timeout"
+                return
+            raise RuntimeError(f"Equivalence check of {gate} did not complete.")
+
+        if m.group(1) == "no model found":
+            self._status = "proven"
+            return
+
+        self._status = "failed"
+        inputs = {name: int(bits, 2) for name, bits in _SAT_INPUT.findall(log)}
+        self._counterexample = (inputs["x_i"], inputs["pos_i"])
+
+
+def elaborate(
+    design: str, w: int, path: pathlib.Path, executable: str, echo: bool = False
+) -> pathlib.Path:
+    """Elaborate and flatten a design's wrapper for W into an RTLIL file.
+
+    The RTLIL is reused while the rendered sources and the wrapper are
+    unchanged. Callers in one process must not elaborate the same design and
+    W concurrently; the file lock only serializes processes.
+    """
+    import fcntl
+    import jinja2
+    import common
+    from syn.cache import compute_key, file_digest
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    module_name = _module_name(design)
+    il = path / f"{module_name}.il"
+    key_path = path / f"{module_name}.key"
+
+    with open(path / f"{module_name}.lock", "w") as lock:
+        fcntl.lockf(lock, fcntl.LOCK_EX)
+
+        (sources, include_dirs) = common.render_rtl(design)
+        wrapper_sv = jinja2.Template(_WRAPPER_SV).render(
+            module_name=module_name, uut=design, W=w
+        )
+        key = compute_key(wrapper_sv, [file_digest(src) for src in sources])
+
+        if il.exists() and key_path.exists() and key_path.read_text() == key:
+            return il
+
+        wrapper = path / f"{module_name}.sv"
+        with open(wrapper, "w") as f:
+            f.write(wrapper_sv)
+
+        include_files = " ".join(f"-I{pathlib.Path(d).resolve()}" for d in include_dirs)
+
+        cmds = [
+            f"read_systemverilog {include_files} -defer {src}"
+            for src in [*sources, wrapper.resolve()]
+        ]
+        cmds += [
+            "read_systemverilog -link",
+            f"hierarchy -check -top {module_name}",
+            "flatten",
+            "proc",
+            "opt",
+            # Drop the library modules, now unused, before writing.
+            f"hierarchy -top {module_name}",
+            f"write_rtlil {il.resolve()}.tmp",
+        ]
+
+        _run_yosys(executable, cmds, path, module_name, echo)
+        pathlib.Path(f"{il}.tmp").replace(il)
+        key_path.write_text(key)
+
+    return il
+
+
+def _run_yosys(
+    executable: str, cmds: list[str], path: pathlib.Path, name: str, echo: bool
+) -> str:
+    from common.proc import run
+
+    script = path / f"{name}.ys"
+    with open(script, "w") as f:
+        f.write("\n".join(cmds) + "\n")
+
+    cp = run(
+        [executable, "-s", str(script.resolve())],
+        capture_output=True,
+        cwd=path,
+        text=True,
+        errors="replace",
+    )
+
+    with open(path / f"{name}.log", "w") as f:
+        f.write(cp.stdout)
+    if echo:
+        print(cp.stdout, end="")
+
+    if cp.returncode:
+        raise RuntimeError(f"Yosys failed; see {path / f'{name}.log'}")
+
+    return cp.stdout
+
+
+def prove_all(
+    widths: list[int] | None = None,
+    designs: list[str] | None = None,
+    jobs: int | None = None,
+    timeout_s: int = PROOF_TIMEOUT_S,
+    replay: bool = False,
+) -> bool:
+    """Prove every design against the reference at every W, in parallel.
+
+    Counterexamples are reported as (x, pos) and, with 'replay', re-run in
+    the cocotb testbench against the reference model.
+    """
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+    import common
+    from syn import yosys
+
+    executable = yosys.setup_environment()
+
+    widths = FORMAL_WS if widths is None else widths
+    if designs is None:
+        designs = [d for d in common.ALL_PROJECTS if d != GOLD]
+
+    # The proofs run in threads, which the file locks of render_rtl and
+    # elaborate do not exclude from one another: render every design and
+    # elaborate the shared reference at each W before dispatching them.
+    for design in [GOLD, *designs]:
+        common.render_rtl(design)
+    gold_ils = {w: elaborate(GOLD, w, _BUILD_DIR / f"w{w}", executable) for w in widths}
+
+    runners = [
+        EquivalenceRunner(
+            gate=design,
+            w=w,
+            executable=executable,
+            gold_il=gold_ils[w],
+            timeout_s=timeout_s,
+        )
+        for w in widths
+        for design in designs
+    ]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for _ in executor.map(lambda r: r.run(), runners):
+            pass
+
+    results = [r.result() for r in runners]
+
+    for r in results:
+        line = f"{r['gold']} == {r['gate']} (W={r['w']}): {r['status']}"
+        line += f" in {r['proof_s']:.2f}s"
+        if r["counterexample"] is not None:
+            (x, pos) = r["counterexample"]
+            line += f", counterexample x=0x{x:x} pos={pos}"
+        print(line)
+
+    _BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_BUILD_DIR / "formal.json", "w") as f:
+        json.dump(results, f, indent=2)
+
+    if replay:
+        from .tb import replay as replay_vectors
+
+        for r in results:
+            if r["counterexample"] is not None:
+                replay_vectors(r["gate"], r["w"], [r["counterexample"]])
+
+    return all(r["status"] == "proven" for r in results)
@@ -0,0 +1,235 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+# Reference model of the circular leftmost-zero search.
+#
+# For a W-bit vector x and a position pos, the search starts at bit pos-1 and
+# proceeds towards the LSB, wrapping from bit 0 to bit W-1, and ends at bit
+# pos. The first 0 found is reported one-hot (y) and encoded (y_enc); 'any'
+# is clear when x has no 0 at all, in which case y and y_enc are undefined
+# (returned as 0).
+#
+# Equivalently, with z = ~x: the most significant set bit of z below pos or,
+# if there is none, the most significant set bit of z overall.
+
+import numpy as np
+
+# Bits per limb of the batch representation of vectors wider than 64 bits.
+LIMB = 64
+
+# README truth table (W=16): (x, pos, y, y_enc, any)
+README_VECTORS = [
+    (0xFFFE, 0, 0x0001, 0, True),
+    (0x0000, 0, 0x8000, 15, True),
+    (0x0000, 1, 0x0001, 0, True),
+    (0x0000, 15, 0x4000, 14, True),
+    (0x2A37, 8, 0x0080, 7, True),
+    (0xFFFF, 0, 0x0000, 0, False),
+]
+
+
+def search(x: int, pos: int, w: int) -> tuple[int, int, bool]:
+    """Scalar model: (y, y_enc, any) for one W-bit x and pos."""
+    z = ~x & ((1 << w) - 1)
+    if z == 0:
+        return (0, 0, False)
+
+    low = z & ((1 << pos) - 1)
+    y_enc = (low or z).bit_length() - 1
+    return (1 << y_enc, y_enc, True)
+
+
+def directed_stimulus(w: int) -> list[tuple[int, int]]:
+    """Corner cases at any W: (x, pos) with no 0, all 0s, and a single 0 at
+    each bit searched from either side of it."""
+    ones = (1 << w) - 1
+    vectors = [(ones, 0), (0, 0), (0, 1), (0, w - 1)]
+    for k in range(w):
+        x = ones & ~(1 << k)
+        vectors += [(x, k), (x, (k + 1) % w)]
+    return vectors
+
+
+def limbs(w: int) -> int:
+    """Number of uint64 limbs of a W-bit vector in the batch API."""
+    return -(-w // LIMB)
+
+
+def to_limbs(values, w: int) -> np.ndarray:
+    """Python ints to a batch of W-bit vectors.
+
+    Vectors of up to 64 bits are a uint64 array of shape (n,); wider vectors
+    are of shape (n, limbs(w)), least significant limb first.
+    """
+    mask = (1 << LIMB) - 1
+    if w <= LIMB:
+        return np.array([v & mask for v in values], dtype=np.uint64)
+    return np.array(
+        [[(v >> (LIMB * i)) & mask for i in range(limbs(w))] for v in values],
+        dtype=np.uint64,
+    ).reshape(-1, limbs(w))
+
+
+def from_limbs(a: np.ndarray) -> list[int]:
+    """Batch of vectors (see to_limbs) back to Python ints."""
+    if a.ndim == 1:
+        return [int(v) for v in a]
+    return [sum(int(limb) << (LIMB * i) for i, limb in enumerate(row)) for row in a]
+
+
+def _msb(v: np.ndarray) -> np.ndarray:
+    # Index of the most significant set bit of each (nonzero) uint64.
+    v = v.copy()
+    r = np.zeros(v.shape, dtype=np.int64)
+    for s in (32, 16, 8, 4, 2, 1):
+        hi = v >> np.uint64(s)
+        m = hi != 0
+        v = np.where(m, hi, v)
+        r += m * s
+    return r
+
+
+def _low_mask(pos: np.ndarray, base: int) -> np.ndarray:
+    # Bits [base, base + 64) of (1 << pos) - 1, for each pos.
+    n = np.clip(pos.astype(np.int64) - base, 0, LIMB)
+    partial = (np.uint64(1) << (n % LIMB).astype(np.uint64)) - np.uint64(1)
+    return np.where(n == LIMB, np.uint64(~np.uint64(0)), partial)
+
+
+def search_batch(
+    x: np.ndarray, pos: np.ndarray, w: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized model over a batch of (x, pos).
+
+    x is a batch of W-bit vectors as produced by to_limbs and pos an integer
+    array of shape (n,). Returns (y, y_enc, any): y in the representation of
+    x, y_enc as int64 and any as bool.
+    """
+    pos = np.asarray(pos)
+    wide = x.ndim == 2
+    xs = x if wide else x[:, None]
+    n_limbs = xs.shape[1]
+
+    # z = ~x within W bits, per limb
+    z = ~xs
+    top = w - LIMB * (n_limbs - 1)
+    if top < LIMB:
+        z[:, -1] &= np.uint64((1 << top) - 1)
+
+    low = np.stack([z[:, i] & _low_mask(pos, LIMB * i) for i in range(n_limbs)], axis=1)
+
+    def _leftmost(v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Bit index of the most significant set bit over all limbs, and
+        # whether any bit is set.
+        nonzero = v != 0
+        found = nonzero.any(axis=1)
+        limb = n_limbs - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+        word = v[np.arange(len(v)), limb]
+        return (LIMB * limb + _msb(word), found)
+
+    low_enc, low_found = _leftmost(low)
+    all_enc, any_ = _leftmost(z)
+    y_enc = np.where(low_found, low_enc, np.where(any_, all_enc, 0))
+
+    y = np.zeros_like(xs)
+    rows = np.nonzero(any_)[0]
+    enc = y_enc[rows]
+    y[rows, enc // LIMB] = np.uint64(1) << (enc % LIMB).astype(np.uint64)
+
+    return (y if wide else y[:, 0], y_enc, any_)
+
+
+def random_stimulus(
+    n: int, w: int, rng: np.random.Generator | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Random batch of (x, pos).
+
+    Vectors are drawn with a random density of ones per vector, so that
+    sparse, dense and all-ones vectors (no 0 to find) are all exercised.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+
+    density = rng.random((n, 1))
+    bits = rng.random((n, limbs(w) * LIMB)) < density
+    bits[:, w:] = False
+    weights = np.uint64(1) << np.arange(LIMB, dtype=np.uint64)
+    x = (bits.reshape(n, limbs(w), LIMB).astype(np.uint64) * weights).sum(
+        axis=2, dtype=np.uint64
+    )
+
+    pos = rng.integers(0, w, size=n)
+    return (x if w > LIMB else x[:, 0], pos)
+
+
+def self_check(widths=(8, 16, 24, 32, 63, 64, 65, 128, 200), n: int = 4096) -> None:
+    """Check the model against the README table and the batch API against
+    the scalar one at several W; raises AssertionError on a mismatch."""
+    for x, pos, y, y_enc, any_ in README_VECTORS:
+        got = search(x, pos, 16)
+        expected = (y, y_enc, any_) if any_ else (0, 0, False)
+        assert got == expected, f"x={x:#06x} pos={pos}: {got} != {expected}"
+
+        by, benc, bany = search_batch(to_limbs([x], 16), np.array([pos]), 16)
+        assert (from_limbs(by)[0], int(benc[0]), bool(bany[0])) == expected
+
+    rng = np.random.default_rng(0)
+    for w in widths:
+        (xs, ps) = random_stimulus(n, w, rng)
+        (ys, encs, anys) = search_batch(xs, ps, w)
+        for xi, pi, yi, ei, ai in zip(from_limbs(xs), ps, from_limbs(ys), encs, anys):
+            expected = search(xi, int(pi), w)
+            assert (
+                yi,
+                int(ei),
+                bool(ai),
+            ) == expected, f"W={w} x={xi:#x} pos={pi}: {(yi, ei, ai)} != {expected}"
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Check the reference model and report its throughput."
+    )
+    parser.add_argument("-n", type=int, default=1 << 20, help="Batch size.")
+    parser.add_argument("-w", type=int, action="append", help="Width (repeatable).")
+    opts = parser.parse_args()
+
+    self_check()
+    print("Reference model matches the README table and the scalar model.")
+
+    for w in opts.w or [16, 64, 128]:
+        x, pos = random_stimulus(opts.n, w, np.random.default_rng(1))
+        start = time.perf_counter()
+        search_batch(x, pos, w)
+        elapsed = time.perf_counter() - start
+        print(f"W={w}: {opts.n / elapsed / 1e6:.1f} M results/s")
+
+
+if __name__ == "__main__":
+    main()
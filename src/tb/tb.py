@@ -25,25 +25,152 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
+import argparse
 import pathlib
 import os
+import re
+import subprocess
 import sys
 import common
 
 WS = [16]
 
+# Random vectors per run (override with $TB_RANDOM_N or --random-n)
+RANDOM_N = int(os.environ.get("TB_RANDOM_N", 1000))
+
+# Random runs of at least this many vectors are simulated in batch mode:
+# stimulus and expected results are pre-computed into memory files and
+# checked by tb.sv itself, so no Python runs per cycle. Smaller runs, and
+# directed tests, stay under cocotb.
+BATCH_MIN_N = 10_000
+
+# Wall-clock limit on a batch simulation: a fixed allowance plus a generous
+# rate per vector. tb.sv's own cycle watchdog should trip long before.
+BATCH_TIMEOUT_S = 60
+BATCH_TIMEOUT_PER_VECTOR_S = 1e-3
+
+_BATCH_SUMMARY = re.compile(r"TB_BATCH: vectors=(\d+) mismatches=(\d+)")
+
 TB_FILES = [
     pathlib.Path(__file__).parent / "tb.sv",
 ]
 
 
+def _escape_string(s: str) -> str:
+    return f'"{s}"'
+
+
+def write_batch(
+    path: pathlib.Path, w: int, n: int, seed: int | None = None
+) -> tuple[pathlib.Path, pathlib.Path]:
+    """Write random stimulus and expected results as $readmemh files.
+
+    One word per line: {x, pos} in the stimulus file and {any, y_enc, y}
+    in the expected file, matching the packing in tb.sv.
+    """
+    import numpy as np
+    from .model import from_limbs, random_stimulus, search_batch
+
+    (x, pos) = random_stimulus(n, w, np.random.default_rng(seed))
+    (y, y_enc, any_) = search_batch(x, pos, w)
+
+    # $clog2(W)
+    pos_w = (w - 1).bit_length()
+
+    stimulus_digits = -(-(w + pos_w) // 4)
+    expected_digits = -(-(1 + pos_w + w) // 4)
+
+    stimulus = path / "stimulus.hex"
+    expected = path / "expected.hex"
+
+    with open(stimulus, "w") as f:
+        for x_i, pos_i in zip(from_limbs(x), pos.tolist()):
+            f.write(f"{(x_i << pos_w) | pos_i:0{stimulus_digits}x}\n")
+
+    with open(expected, "w") as f:
+        for y_i, y_enc_i, any_i in zip(from_limbs(y), y_enc.tolist(), any_.tolist()):
+            word = (int(any_i) << (pos_w + w)) | (y_enc_i << w) | y_i
+            f.write(f"{word:0{expected_digits}x}\n")
+
+    return (stimulus, expected)
+
+
+def run_batch(
+    project: str,
+    w: int,
+    sources: list[pathlib.Path],
+    include_dirs: list[pathlib.Path],
+    n: int,
+    seed: int | None = None,
+) -> bool:
+    """Build tb.sv in batch mode as a standalone Verilator binary and run it."""
+    build_dir = pathlib.Path(f"build_{project}_w{w}/batch")
+    os.makedirs(build_dir, exist_ok=True)
+
+    (stimulus, expected) = write_batch(build_dir, w, n, seed)
+
+    parameters = {
+        "W": w,
+        "P_UUT_NAME": _escape_string(project),
+        "P_BATCH": 1,
+        "P_BATCH_N": n,
+        "P_STIMULUS": _escape_string(str(stimulus.resolve())),
+        "P_EXPECTED": _escape_string(str(expected.resolve())),
+    }
+
+    cmd = ["verilator", "--binary", "--timing", "-Wno-fatal", "-j", "0"]
+    cmd += ["--top-module", "tb", "-Mdir", str(build_dir / "obj_dir"), "-o", "Vtb"]
+    cmd += [f"-I{d}" for d in include_dirs]
+    cmd += [f"-G{k}={v}" for k, v in parameters.items()]
+    cmd += [str(s) for s in sources]
+
+    subprocess.run(cmd, check=True)
+
+    try:
+        result = subprocess.run(
+            [str(build_dir / "obj_dir" / "Vtb")],
+            capture_output=True,
+            text=True,
+            timeout=BATCH_TIMEOUT_S + n * BATCH_TIMEOUT_PER_VECTOR_S,
+        )
+    except subprocess.TimeoutExpired as e:
+        print(f"Batch simulation timed out after {e.timeout:.0f}s.", file=sys.stderr)
+        return False
+    print(result.stdout, end="")
+    print(result.stderr, end="", file=sys.stderr)
+
+    summary = _BATCH_SUMMARY.search(result.stdout)
+    if result.returncode != 0 or summary is None:
+        return False
+
+    (vectors, mismatches) = map(int, summary.groups())
+    return vectors == n and mismatches == 0
+
+
 def compile_and_run(
-    project: str, w: int, sources: list[pathlib.Path], include_dirs: list[pathlib.Path]
-) -> None:
-    from cocotb_tools.runner import get_runner
+    project: str,
+    w: int,
+    sources: list[pathlib.Path],
+    include_dirs: list[pathlib.Path],
+    random_n: int = RANDOM_N,
+    debug: bool = False,
+    replay: list[tuple[int, int]] | None = None,
+) -> bool:
+    from cocotb_tools.runner import get_results, get_runner
+
+    # Large random runs go to batch mode; cocotb keeps the directed tests
+    # (and everything, with waves, when debugging).
+    batch = (random_n >= BATCH_MIN_N) and not debug and not replay
 
-    def _escape_string(s: str) -> str:
-        return f'"{s}"'
+    testcase = None
+    if replay:
+        testcase = ["test_replay"]
+    elif batch:
+        testcase = ["test_directed"]
+
+    extra_env = {"TB_RANDOM_N": str(random_n)}
+    if replay:
+        extra_env["TB_REPLAY"] = " ".join(f"{x:x}:{pos:x}" for x, pos in replay)
 
     parameters = {
         "W": w,
@@ -67,30 +194,114 @@ def compile_and_run(
 
     sys.path.insert(0, str(test_module.parent))
 
-    runner.test(hdl_toplevel="tb", test_module="tests", waves=True)
+    results = runner.test(
+        hdl_toplevel="tb",
+        test_module="tests",
+        testcase=testcase,
+        waves=True,
+        extra_env=extra_env,
+    )
+
+    (_, failed) = get_results(results)
+    if failed:
+        return False
+
+    if batch:
+        return run_batch(project, w, sources, include_dirs, random_n)
 
+    return True
 
-def run_testbench(project: str, w: int) -> bool:
-    out_dir = f"build_{project}_w{w}/rtl"
 
-    # Copy all sources to a temporary directory and render top-level testbench
-    hdl_files, include_dirs = common.render_rtl(project, pathlib.Path(out_dir))
+def run_testbench(
+    project: str, w: int, random_n: int = RANDOM_N, debug: bool = False
+) -> bool:
+    # Render sources into the project's shared RTL tree
+    hdl_files, include_dirs = common.render_rtl(project)
 
     # Add testbench to the HDL files
     hdl_files.extend(TB_FILES)
 
-    # Compile and run the testbench using cocotb
-    compile_and_run(project, w, hdl_files, include_dirs)
+    # Compile and run the testbench, using cocotb and/or batch mode
+    return compile_and_run(project, w, hdl_files, include_dirs, random_n, debug)
 
-    return True
 
+def replay(project: str, w: int, vectors: list[tuple[int, int]]) -> bool:
+    """Replay (x, pos) vectors, e.g. a formal counterexample, under cocotb."""
+    (hdl_files, include_dirs) = common.render_rtl(project)
+    hdl_files.extend(TB_FILES)
+
+    return compile_and_run(project, w, hdl_files, include_dirs, replay=vectors)
+
+
+def _parse_widths(s: str) -> list[int]:
+    return [int(w) for w in s.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the testbench regression.")
+    parser.add_argument(
+        "-n",
+        "--random-n",
+        type=int,
+        default=RANDOM_N,
+        help=f"Random vectors per run (batch mode from {BATCH_MIN_N}).",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Run all tests under cocotb, never in batch mode.",
+    )
+    parser.add_argument(
+        "--formal",
+        action="store_true",
+        help="Prove each design equivalent to the reference instead of simulating.",
+    )
+    parser.add_argument(
+        "-w",
+        "--widths",
+        type=_parse_widths,
+        help="Comma-separated widths (default: 16; 8,16,32,64 with --formal).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Concurrent proofs with --formal (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--proof-timeout",
+        type=int,
+        default=None,
+        help="SAT solver timeout per proof, in seconds (0 for none).",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Replay formal counterexamples in the cocotb testbench.",
+    )
+    opts = parser.parse_args(argv)
+
+    if opts.formal:
+        from . import formal
 
-def main():
+        proven = formal.prove_all(
+            widths=opts.widths,
+            jobs=opts.jobs,
+            timeout_s=(
+                formal.PROOF_TIMEOUT_S
+                if opts.proof_timeout is None
+                else opts.proof_timeout
+            ),
+            replay=opts.replay,
+        )
+        return 0 if proven else 1
 
     for project in common.ALL_PROJECTS:
-        for w in WS:
+        for w in opts.widths or WS:
             print(f"Running testbench for project '{project}' with width {w}")
-            success = run_testbench(project, w=w)
+            success = run_testbench(
+                project, w=w, random_n=opts.random_n, debug=opts.debug
+            )
             if not success:
                 print(f"Testbench failed for project '{project}' with width {w}")
                 return 1
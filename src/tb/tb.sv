@@ -32,6 +32,14 @@ module tb #(
   parameter int W
 
 , parameter string P_UUT_NAME
+
+// Batch mode: stimulus {x, pos} and expected results {any, y_enc, y} are
+// read from files, driven back-to-back and checked here, without cocotb.
+, parameter bit P_BATCH = 1'b0
+, parameter int P_BATCH_N = 1
+, parameter string P_STIMULUS = "stimulus.hex"
+, parameter string P_EXPECTED = "expected.hex"
+, parameter int P_MAX_MISMATCHES = 10
 ) (
   input wire logic                               vld_i
 , input wire logic [W - 1:0]                     x_i
@@ -54,6 +62,11 @@ module tb #(
 //                                                                           //
 //========================================================================== //
 
+logic                           tb_arst_n;
+logic                           tb_vld;
+logic [W - 1:0]                 tb_x;
+logic [$clog2(W) - 1:0]         tb_pos;
+
 logic                           in_vld_r;
 logic [W - 1:0]                 in_x_r;
 logic [$clog2(W) - 1:0]         in_pos_r;
@@ -88,22 +101,131 @@ logic clk = 0;
 
 always #5 clk = ~clk;
 
+//========================================================================== //
+//                                                                           //
+// Stimulus                                                                  //
+//                                                                           //
+//========================================================================== //
+
+generate begin : stimulus_GEN
+  if (P_BATCH) begin : batch_GEN
+
+    localparam int STIMULUS_W = W + $clog2(W);
+    localparam int EXPECTED_W = 1 + $clog2(W) + W;
+
+    // Cycles from reset to the last result: one vector per cycle, then the
+    // input and output registers. Past this (plus a margin), give up.
+    localparam int LATENCY = 2;
+    localparam int WATCHDOG_MARGIN = 100;
+    localparam int WATCHDOG_CYCLES = P_BATCH_N + LATENCY + WATCHDOG_MARGIN;
+
+    logic [STIMULUS_W - 1:0]        stimulus_mem [P_BATCH_N];
+    logic [EXPECTED_W - 1:0]        expected_mem [P_BATCH_N];
+
+    logic                           batch_arst_n;
+    int unsigned                    drv_i;
+    int unsigned                    chk_i;
+    int unsigned                    mismatches;
+    int unsigned                    cycles;
+
+    logic                           exp_any;
+    logic [$clog2(W) - 1:0]         exp_y_enc;
+    logic [W - 1:0]                 exp_y;
+
+    initial begin : load_PROC
+      $readmemh(P_STIMULUS, stimulus_mem);
+      $readmemh(P_EXPECTED, expected_mem);
+    end : load_PROC
+
+    initial begin : reset_PROC
+      batch_arst_n = 1'b1;
+      @(posedge clk);
+      batch_arst_n = 1'b0;
+      repeat (5) @(posedge clk);
+      batch_arst_n = 1'b1;
+    end : reset_PROC
+
+    // One vector per cycle, back-to-back, once out of reset.
+    always_ff @(posedge clk or negedge batch_arst_n) begin : drv_PROC
+      if (~batch_arst_n)
+        drv_i <= '0;
+      else if (drv_i < P_BATCH_N)
+        drv_i <= drv_i + 1;
+    end : drv_PROC
+
+    assign tb_arst_n = batch_arst_n;
+    assign tb_vld = (drv_i < P_BATCH_N);
+    assign {tb_x, tb_pos} = stimulus_mem[(drv_i < P_BATCH_N) ? drv_i : 0];
+
+    // Results emerge in stimulus order; y and y_enc are only defined when
+    // any is set.
+    assign {exp_any, exp_y_enc, exp_y} =
+      expected_mem[(chk_i < P_BATCH_N) ? chk_i : 0];
+
+    always_ff @(posedge clk or negedge batch_arst_n) begin : chk_PROC
+      if (~batch_arst_n) begin
+        chk_i <= '0;
+        mismatches <= '0;
+      end else if (out_vld_r) begin
+        if ((out_any_r != exp_any) ||
+            (exp_any && ((out_y_r != exp_y) || (out_y_enc_r != exp_y_enc)))) begin
+          if (mismatches < P_MAX_MISMATCHES)
+            $display("TB_BATCH: mismatch at %0d: x=%h pos=%0d expected any=%b y=%h y_enc=%0d, got any=%b y=%h y_enc=%0d",
+                     chk_i, out_x_r, out_pos_r, exp_any, exp_y, exp_y_enc,
+                     out_any_r, out_y_r, out_y_enc_r);
+          mismatches <= mismatches + 1;
+        end
+        chk_i <= chk_i + 1;
+      end
+    end : chk_PROC
+
+    always_ff @(posedge clk) begin : finish_PROC
+      if (batch_arst_n && (chk_i == P_BATCH_N)) begin
+        $display("TB_BATCH: vectors=%0d mismatches=%0d", P_BATCH_N, mismatches);
+        if (mismatches != 0)
+          $fatal(1, "Batch simulation failed.");
+        $finish;
+      end
+    end : finish_PROC
+
+    always_ff @(posedge clk or negedge batch_arst_n) begin : watchdog_PROC
+      if (~batch_arst_n)
+        cycles <= '0;
+      else if (cycles == WATCHDOG_CYCLES)
+        $fatal(1, "TB_BATCH: watchdog: %0d of %0d results after %0d cycles.",
+               chk_i, P_BATCH_N, cycles);
+      else
+        cycles <= cycles + 1;
+    end : watchdog_PROC
+
+  end : batch_GEN
+  else begin : port_GEN
+
+    assign tb_arst_n = arst_n;
+    assign tb_vld = vld_i;
+    assign tb_x = x_i;
+    assign tb_pos = pos_i;
+
+  end : port_GEN
+end : stimulus_GEN
+endgenerate
+
 //========================================================================== //
 //                                                                           //
 // UUT                                                                       //
 //                                                                           //
 //========================================================================== //
 
-always_ff @(posedge clk or negedge arst_n) begin : vld_reg_PROC
-  if (~arst_n)
+always_ff @(posedge clk or negedge tb_arst_n) begin : vld_reg_PROC
+  if (~tb_arst_n)
     in_vld_r <= 1'b0;
   else
-    in_vld_r <= vld_i;
+    in_vld_r <= tb_vld;
 end : vld_reg_PROC
 
 always_ff @(posedge clk) begin : in_reg_PROC
-  in_x_r <= x_i;
-  in_pos_r <= pos_i;
+  in_x_r <= tb_x;
+  in_pos_r <= tb_pos;
 end : in_reg_PROC
 
 assign uut_x_i = in_x_r;
@@ -168,15 +290,15 @@ generate begin : uut_GEN
 end : uut_GEN
 endgenerate
 
-always_ff @(posedge clk or negedge arst_n) begin : out_vld_reg_PROC
-  if (~arst_n)
+always_ff @(posedge clk or negedge tb_arst_n) begin : out_vld_reg_PROC
+  if (~tb_arst_n)
     out_vld_r <= 1'b0;
   else
     out_vld_r <= in_vld_r;
 end : out_vld_reg_PROC
 
-always_ff @(posedge clk or negedge arst_n) begin : out_any_reg_PROC
-  if (~arst_n)
+always_ff @(posedge clk or negedge tb_arst_n) begin : out_any_reg_PROC
+  if (~tb_arst_n)
     out_any_r <= 1'b0;
   else
     out_any_r <= uut_any_o;
@@ -25,11 +25,20 @@
 ## POSSIBILITY OF SUCH DAMAGE.
 ## ========================================================================= ##
 
+import os
+
 import cocotb
 
 from cocotb.clock import Clock
 from cocotb.triggers import Timer, RisingEdge, FallingEdge
 
+# Vectors checked by test_random (override with $TB_RANDOM_N)
+RANDOM_N = int(os.environ.get("TB_RANDOM_N", 1000))
+
+# Vectors checked by test_replay, as hex 'x:pos' pairs (e.g. a counterexample
+# from 'regress --formal'); the test is skipped when unset.
+REPLAY = os.environ.get("TB_REPLAY", "")
+
 
 async def reset_sequence(dut, cycles_n: int) -> None:
     dut.arst_n.value = 1
@@ -120,32 +129,73 @@ async def await_cycles(dut, cycles_n: int) -> None:
         await RisingEdge(dut.clk)
 
 
-@cocotb.test()
-async def test_directed(dut):
-    """Run the test of known test cases as specified in the top-level module."""
+async def _run_vectors(
+    dut,
+    stimulus: list[tuple[int, int]],
+    w: int,
+    expected: list[tuple[int, int, bool]] | None = None,
+) -> None:
+    """Reset, drive 'stimulus' and check every result.
+
+    Results are checked against 'expected', as (y, y_enc, any), or else
+    against the reference model.
+    """
+    from tb.model import search
 
-    if dut.W.value != 16:
-        print(f"Testbench only supports W=16 for now (W={dut.W.value}).")
-        return
+    if expected is None:
+        expected = [search(x, pos, w) for x, pos in stimulus]
 
     # Perform reset
     await reset_sequence(dut, cycles_n=5)
 
-    test_cases = [
-        (0xFFFE, 0, 0x0001, 0, True),
-        (0x0000, 0, 0x8000, 15, True),
-        (0x0000, 1, 0x0001, 0, True),
-        (0x0000, 15, 0x4000, 14, True),
-        (0x2A37, 8, 0x0080, 7, True),
-        (0xFFFF, 0, 0x0000, 0, False),
-    ]
+    cocotb.start_soon(emit_stimulus(dut, stimulus))
 
-    cocotb.start_soon(emit_stimulus(dut, [(tc[0], tc[1]) for tc in test_cases]))
-
-    await validate_output(dut, [(tc[2], tc[3], tc[4]) for tc in test_cases])
+    await validate_output(dut, expected)
 
     # End of simulation wind-down.
     for _ in range(5):
         await RisingEdge(dut.clk)
 
     dut._log.info("Test Completed Successfully")
+
+
+@cocotb.test()
+async def test_directed(dut):
+    """Run directed corner cases at any W, and the README table at W=16."""
+    from tb.model import README_VECTORS, directed_stimulus, search
+
+    w = dut.W.value.to_unsigned()
+
+    stimulus = directed_stimulus(w)
+    expected = [search(x, pos, w) for x, pos in stimulus]
+    if w == 16:
+        # The README table is checked against its own expected values.
+        stimulus += [(tc[0], tc[1]) for tc in README_VECTORS]
+        expected += [(tc[2], tc[3], tc[4]) for tc in README_VECTORS]
+
+    await _run_vectors(dut, stimulus, w, expected)
+
+
+@cocotb.test()
+async def test_random(dut):
+    """Run random stimulus at any W, checked against the reference model."""
+    import numpy as np
+    from tb.model import from_limbs, random_stimulus
+
+    w = dut.W.value.to_unsigned()
+    rng = np.random.default_rng(cocotb.RANDOM_SEED)
+
+    (x, pos) = random_stimulus(RANDOM_N, w, rng)
+    stimulus = list(zip(from_limbs(x), (int(p) for p in pos)))
+
+    await _run_vectors(dut, stimulus, w)
+
+
+@cocotb.test(skip=not REPLAY)
+async def test_replay(dut):
+    """Replay the vectors in $TB_REPLAY, checked against the reference model."""
+    w = dut.W.value.to_unsigned()
+
+    stimulus = [tuple(int(v, 16) for v in pair.split(":")) for pair in REPLAY.split()]
+
+    await _run_vectors(dut, stimulus, w)
@@ -0,0 +1,105 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import random
+
+from common.espresso import (
+    complement,
+    cube_from_str,
+    cube_to_str,
+    equivalent,
+    minimize,
+    tautology,
+    _reduce,
+)
+
+
+def _minterms(n: int) -> list[int]:
+    # Every point of the input space, as a fully specified cube.
+    return [
+        sum((0b10 if (m >> k) & 1 else 0b01) << (2 * k) for k in range(n))
+        for m in range(1 << n)
+    ]
+
+
+def _eval(cover: list[int], point: int) -> bool:
+    return any((point & ~c) == 0 for c in cover)
+
+
+def _random_cover(rng: random.Random, n: int, size: int) -> list[int]:
+    return [
+        sum(rng.choice((0b01, 0b10, 0b11)) << (2 * k) for k in range(n))
+        for _ in range(size)
+    ]
+
+
+def test_cube_round_trip():
+    for s in ("0", "1", "-", "10-", "-0-1", "1111"):
+        assert cube_to_str(cube_from_str(s), len(s)) == s
+
+
+def test_minimize_random_on_dc_off():
+    rng = random.Random(0)
+
+    for _ in range(1000):
+        n = rng.randint(1, 6)
+        on = _random_cover(rng, n, rng.randint(0, 8))
+        dc = _random_cover(rng, n, rng.randint(0, 3))
+
+        result = minimize(on, n, dc)
+
+        # The DC-set (which takes precedence over the ON-set) may go either
+        # way; the rest of the ON-set must be covered and the OFF-set not.
+        for point in _minterms(n):
+            if not _eval(dc, point):
+                assert _eval(result, point) == _eval(on, point)
+
+
+def test_complement_and_tautology():
+    rng = random.Random(1)
+
+    for _ in range(500):
+        n = rng.randint(1, 6)
+        cover = _random_cover(rng, n, rng.randint(0, 8))
+        inverse = complement(cover, n)
+
+        for point in _minterms(n):
+            assert _eval(cover, point) != _eval(inverse, point)
+
+        assert tautology(cover + inverse, n)
+        assert tautology(cover, n) == all(_eval(cover, p) for p in _minterms(n))
+
+
+def test_reduce_duplicate_cubes():
+    n = 3
+    cover = [cube_from_str(s) for s in ("1--", "1--", "-1-", "11-", "1--")]
+
+    reduced = _reduce(cover, [], n)
+
+    assert len(reduced) == len(cover)
+    assert equivalent(reduced, cover, n)
+    assert equivalent(minimize(cover, n), [cube_from_str(s) for s in ("1--", "-1-")], n)
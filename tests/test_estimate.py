@@ -0,0 +1,111 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import json
+
+import pytest
+
+from syn import estimate
+from syn.env import OUTPUT_LOAD
+
+from test_liberty import LIBERTY
+
+# r0.Q -> u0 -> u1 -> r1.D, with r1.Q driving both the output port and r0.D.
+# Yosys omits the port directions of liberty cells.
+NETLIST = {
+    "modules": {
+        "top": {
+            "attributes": {"top": "00000000000000000000000000000001"},
+            "ports": {
+                "clk": {"direction": "input", "bits": [6]},
+                "q": {"direction": "output", "bits": [5]},
+            },
+            "cells": {
+                "r0": {"type": "DFF", "connections": {"CLK": [6], "D": [5], "Q": [2]}},
+                "u0": {"type": "INV", "connections": {"A": [2], "Y": [3]}},
+                "u1": {"type": "INV", "connections": {"A": [3], "Y": [4]}},
+                "r1": {"type": "DFF", "connections": {"CLK": [6], "D": [4], "Q": [5]}},
+            },
+        }
+    }
+}
+
+
+def _estimate(tmp_path, netlist: dict) -> dict:
+    (lib, syn_json) = (tmp_path / "test.lib", tmp_path / "syn.json")
+    lib.write_text(LIBERTY)
+    syn_json.write_text(json.dumps(netlist))
+    return estimate.estimate(syn_json, lib)
+
+
+def test_estimate(tmp_path):
+    result = _estimate(tmp_path, NETLIST)
+
+    assert result["area"] == pytest.approx(47.5)
+    assert result["sequential_area"] == pytest.approx(40.0)
+    assert result["cell_count"] == 4
+    assert result["logic_depth"] == 2
+    assert result["unknown_cells"] == []
+
+    # Every internal net drives one input pin: its capacitance plus a wire.
+    load = 0.002 + estimate.WIRE_CAP_PER_SINK
+    clk_to_q = 0.2 + 10.0 * load
+    inv = 0.15 + 10.0 * load
+    delay = clk_to_q + 2 * inv + 0.12
+    assert result["delay_ns"] == pytest.approx(delay)
+    assert result["f_max_mhz"] == pytest.approx(1000 / delay)
+
+
+def test_estimate_unknown_cells(tmp_path):
+    netlist = json.loads(json.dumps(NETLIST))
+    netlist["modules"]["top"]["cells"]["u1"]["type"] = "BUF"
+
+    result = _estimate(tmp_path, netlist)
+    assert result["unknown_cells"] == ["BUF"]
+    assert result["area"] == pytest.approx(43.75)
+
+    # The path through the unknown cell is lost, leaving r1.Q -> r0.D, whose
+    # launch sees the output port's load.
+    assert result["logic_depth"] == 0
+    load = OUTPUT_LOAD + 0.002 + estimate.WIRE_CAP_PER_SINK
+    assert result["delay_ns"] == pytest.approx(0.2 + 10.0 * load + 0.12)
+
+
+def test_calibrate():
+    rows = [
+        {"estimate": {"delay_ns": d}, "f_max_mhz": 1000 / (2 * d + 1)}
+        for d in (1.0, 2.0, 4.0)
+    ]
+    rows.append({"estimate": None, "f_max_mhz": 100.0})
+
+    calibration = estimate.calibrate(rows)
+    assert calibration["points"] == 3
+    assert calibration["scale"] == pytest.approx(2.0)
+    assert calibration["offset"] == pytest.approx(1.0)
+    assert calibration["max_error"] == pytest.approx(0.0, abs=1e-9)
+    assert estimate.f_max(3.0, calibration) == pytest.approx(1000 / 7)
+    assert estimate.calibrate(rows[:1]) is None
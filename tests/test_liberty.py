@@ -0,0 +1,134 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import pytest
+
+from syn import liberty
+
+# Two cells: an inverter timed by a rise table and a scalar fall table, and a
+# flop with a clock-to-Q arc and a setup constraint on D.
+LIBERTY = r"""
+library (test) {
+  /* Units are nominal; only the values matter. */
+  time_unit : "1ns" ;
+  capacitive_load_unit (1, pf) ;
+  lu_table_template (tmpl) {
+    variable_1 : input_net_transition ;
+    variable_2 : total_output_net_capacitance ;
+    index_1 ("0.05, 0.1") ;
+    index_2 ("0.01, 0.03") ;
+  }
+  cell ("INV") {
+    area : 3.75 ;
+    pin (A) { direction : input ; capacitance : 0.002 ; }
+    pin (Y) {
+      direction : output ;
+      timing () {
+        related_pin : "A" ;
+        cell_rise (tmpl) { values ("0.1, 0.3", \
+                                   "0.2, 0.4") ; }
+        cell_fall (scalar) { values ("0.15") ; }
+      }
+    }
+  }
+  cell (DFF) {
+    area : 20 ;
+    ff (IQ, IQN) { next_state : "D" ; clocked_on : "CLK" ; }
+    pin (CLK) { direction : input ; capacitance : 0.002 ; clock : true ; }
+    pin (D) {
+      direction : input ;
+      capacitance : 0.002 ;
+      timing () {
+        related_pin : "CLK" ;
+        timing_type : setup_rising ;
+        rise_constraint (scalar) { values ("0.12") ; }
+      }
+    }
+    pin (Q) {
+      direction : output ;
+      timing () {
+        related_pin : "CLK" ;
+        timing_type : rising_edge ;
+        cell_rise (tmpl) { values ("0.3, 0.5", "0.3, 0.5") ; }
+      }
+    }
+  }
+}
+"""
+
+
+def _cell(library: dict, name: str) -> dict:
+    return next(g for g in library["groups"] if g["names"] == [name])
+
+
+def test_parse():
+    library = liberty.parse(LIBERTY)
+    assert (library["type"], library["names"]) == ("library", ["test"])
+    assert library["attrs"]["time_unit"] == "1ns"
+    assert library["attrs"]["capacitive_load_unit"] == ["1", "pf"]
+
+    template = library["groups"][0]
+    assert (template["type"], template["names"]) == ("lu_table_template", ["tmpl"])
+    assert template["attrs"]["index_1"] == ["0.05, 0.1"]
+
+    inv = _cell(library, "INV")
+    assert inv["attrs"]["area"] == "3.75"
+    (a, y) = inv["groups"]
+    assert (a["names"], a["attrs"]["direction"]) == (["A"], "input")
+
+    (timing,) = y["groups"]
+    assert timing["attrs"]["related_pin"] == "A"
+    (rise, fall) = timing["groups"]
+    # The line continuation joins the rows of one complex attribute.
+    assert rise["attrs"]["values"] == ["0.1, 0.3", "0.2, 0.4"]
+    assert fall["attrs"]["values"] == ["0.15"]
+
+    ff = _cell(library, "DFF")["groups"][0]
+    assert (ff["type"], ff["names"]) == ("ff", ["IQ", "IQN"])
+
+
+def test_read_timing(tmp_path):
+    path = tmp_path / "test.lib"
+    path.write_text(LIBERTY)
+    cells = liberty.read_timing(path)
+
+    inv = cells["INV"]
+    assert (inv["area"], inv["sequential"]) == (3.75, False)
+    assert inv["pins"]["A"] == {"direction": "input", "capacitance": 0.002}
+    (arc,) = inv["arcs"]
+    assert (arc["from"], arc["to"], arc["type"]) == ("A", "Y", "combinational")
+    # Rise at the nominal slew is 0.1 + 10 * load; fall is a flat 0.15.
+    assert arc["intrinsic"] == pytest.approx(0.15)
+    assert arc["slope"] == pytest.approx(10.0)
+
+    dff = cells["DFF"]
+    assert dff["sequential"]
+    assert dff["setup"] == {"D": pytest.approx(0.12)}
+    (arc,) = dff["arcs"]
+    assert (arc["from"], arc["to"], arc["type"]) == ("CLK", "Q", "rising_edge")
+    assert arc["intrinsic"] == pytest.approx(0.2)
+    assert arc["slope"] == pytest.approx(10.0)
@@ -0,0 +1,68 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tb import model
+from tb.model import README_VECTORS, from_limbs, search, search_batch, to_limbs
+
+
+def test_readme_vectors():
+    for x, pos, y, y_enc, any_ in README_VECTORS:
+        expected = (y, y_enc, any_) if any_ else (0, 0, False)
+        assert search(x, pos, 16) == expected
+
+        (ys, encs, anys) = search_batch(to_limbs([x], 16), np.array([pos]), 16)
+        assert (from_limbs(ys)[0], int(encs[0]), bool(anys[0])) == expected
+
+
+def test_directed_stimulus():
+    # A single 0 is found wherever the search starts.
+    for w in (8, 65):
+        for x, pos in model.directed_stimulus(w):
+            (y, y_enc, any_) = search(x, pos, w)
+            zeros = [k for k in range(w) if not (x >> k) & 1]
+            assert any_ == bool(zeros)
+            if len(zeros) == 1:
+                assert (y, y_enc) == (1 << zeros[0], zeros[0])
+
+
+@pytest.mark.parametrize("w", [8, 16, 64, 65, 128])
+def test_batch_matches_scalar(w):
+    rng = np.random.default_rng(w)
+    (xs, ps) = model.random_stimulus(2048, w, rng)
+
+    # Directed vectors straddle the limb boundaries of wide W.
+    stimulus = list(zip(from_limbs(xs), (int(p) for p in ps)))
+    stimulus += model.directed_stimulus(w)
+    (x, pos) = zip(*stimulus)
+
+    (ys, encs, anys) = search_batch(to_limbs(x, w), np.array(pos), w)
+    got = list(zip(from_limbs(ys), (int(e) for e in encs), (bool(a) for a in anys)))
+    assert got == [search(xi, pi, w) for xi, pi in stimulus]
@@ -0,0 +1,169 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import re
+
+import pytest
+
+from common import rtl
+from common.env import PROJECT_ROOT
+from common.espresso import cube_from_str, equivalent
+from common.pla_check import _SOPParser, pla_regions
+from common.rtl import PLARenderer
+
+_REGION_A = [
+    "//! .i a b\n",
+    "//! .o y\n",
+    "//!  10 1\n",
+    "//!  -1 1\n",
+    "//! .e\n",
+]
+
+_REGION_B = [
+    "//! .i c d\n",
+    "//! .o z\n",
+    "//!  00 1\n",
+    "//! .e\n",
+]
+
+# ABC output for the merged table, with internal nets shared between assigns.
+_ABC_VERILOG = """\
+module pla (pla0__a, pla0__b, pla1__c, pla1__d, pla0__y, pla1__z);
+  input pla0__a, pla0__b, pla1__c, pla1__d;
+  output pla0__y, pla1__z;
+  wire new_n5_, new_n6_, new_n7_;
+  assign new_n5_ = pla0__a & ~pla0__b;
+  assign new_n6_ = pla1__c | pla1__d;
+  assign new_n7_ = ~new_n6_;
+  assign pla0__y = new_n5_ | pla0__b;
+  assign pla1__z = new_n7_;
+endmodule
+"""
+
+
+def _covers(renderer: PLARenderer, lines: list[str]) -> dict[str, list[int]]:
+    sop = _SOPParser(renderer.inputs(), lines)
+    return {name: sop.cover(name) for name in renderer.outputs()}
+
+
+def _parsed(region: list[str]) -> PLARenderer:
+    renderer = PLARenderer(region, cache=None, backend="abc")
+    renderer._parse()
+    return renderer
+
+
+def test_batch_split_keeps_internal_nets(monkeypatch):
+    def _fake_abc(self, scriptfilename) -> bool:
+        with open(scriptfilename) as f:
+            (verilog,) = re.findall(r"write_verilog (\S+)", f.read())
+        with open(verilog, "w") as f:
+            f.write(_ABC_VERILOG)
+        return True
+
+    monkeypatch.setattr(PLARenderer, "_invoke_abc", _fake_abc)
+
+    renderers = [_parsed(_REGION_A), _parsed(_REGION_B)]
+    (a, b) = PLARenderer.render_abc_batch(renderers)
+
+    assert [line.split()[1] for line in a] == ["new_n5_", "y"]
+    assert [line.split()[1] for line in b] == ["new_n6_", "new_n7_", "z"]
+
+    # a & ~b | b and ~(c | d), as in the tables.
+    y = [cube_from_str(c) for c in ("10", "-1")]
+    assert equivalent(_covers(renderers[0], a)["y"], y, 2)
+    assert equivalent(_covers(renderers[1], b)["z"], [cube_from_str("00")], 2)
+
+
+# ABC output for regions A, B and B again, where new_n5_ (of region A) also
+# feeds region 1's output; region 2 is independent.
+_ABC_SHARED_VERILOG = """\
+module pla (pla0__a, pla0__b, pla1__c, pla1__d, pla2__c, pla2__d, pla0__y, pla1__z,
+  pla2__z);
+  input pla0__a, pla0__b, pla1__c, pla1__d, pla2__c, pla2__d;
+  output pla0__y, pla1__z, pla2__z;
+  wire new_n5_, new_n6_;
+  assign new_n5_ = pla0__a & ~pla0__b;
+  assign new_n6_ = ~pla1__c & ~pla1__d;
+  assign pla0__y = new_n5_ | pla0__b;
+  assign pla1__z = new_n6_ & ~new_n5_;
+  assign pla2__z = ~pla2__c & ~pla2__d;
+endmodule
+"""
+
+
+def test_batch_renders_shared_logic_alone(monkeypatch):
+    # Splitting would emit, and drive, new_n5_ in both regions 0 and 1.
+    def _fake_abc(self, scriptfilename) -> bool:
+        with open(scriptfilename) as f:
+            (verilog,) = re.findall(r"write_verilog (\S+)", f.read())
+        with open(verilog, "w") as f:
+            f.write(_ABC_SHARED_VERILOG)
+        return True
+
+    alone = list()
+
+    def _render_abc(self) -> list[str]:
+        alone.append(self)
+        return ["alone"]
+
+    monkeypatch.setattr(PLARenderer, "_invoke_abc", _fake_abc)
+    monkeypatch.setattr(PLARenderer, "_render_abc", _render_abc)
+
+    renderers = [_parsed(_REGION_A), _parsed(_REGION_B), _parsed(_REGION_B)]
+    batch = PLARenderer.render_abc_batch(renderers)
+
+    assert alone == renderers[:2]
+    assert batch[:2] == [["alone"], ["alone"]]
+    assert [line.split()[1] for line in batch[2]] == ["z"]
+
+
+@pytest.mark.skipif(not rtl._ABC_EXE, reason="ABC_EXE not set")
+def test_batch_matches_per_region():
+    regions = pla_regions(PROJECT_ROOT / "rtl" / "e" / "e_priority.sv")
+
+    renderers = [_parsed(region) for region in regions]
+    batch = PLARenderer.render_abc_batch(renderers)
+
+    for renderer, region, lines in zip(renderers, regions, batch):
+        single = PLARenderer(region, cache=None, backend="abc").render()
+        n = len(renderer.inputs())
+
+        expected = _covers(renderer, single)
+        for name, cover in _covers(renderer, lines).items():
+            assert equivalent(cover, expected[name], n), name
+
+
+def test_espresso_key_tracks_minimizer(monkeypatch):
+    # Covers cached under one version of espresso.py are not reused by another.
+    def _key() -> str:
+        renderer = PLARenderer(_REGION_A, cache=None, backend="espresso")
+        renderer._parse()
+        return renderer._cache_key()
+
+    before = _key()
+    monkeypatch.setattr(rtl, "_espresso_digest", lambda: "changed")
+    assert _key() != before
@@ -0,0 +1,116 @@
+## ========================================================================= ##
+## Copyright (c) 2026, Stephen Henry
+## All rights reserved.
+##
+## Redistribution and use in source and binary forms, with or without
+## modification, are permitted provided that the following conditions are met:
+##
+## * Redistributions of source code must retain the above copyright notice, this
+##   list of conditions and the following disclaimer.
+##
+## * Redistributions in binary form must reproduce the above copyright notice,
+##   this list of conditions and the following disclaimer in the documentation
+##   and/or other materials provided with the distribution.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+## IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+## ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+## LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+## CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+## SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+## INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+## CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+## ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+## POSSIBILITY OF SUCH DAMAGE.
+## ========================================================================= ##
+
+import time
+
+from syn import workqueue
+from syn.workqueue import DONE, FAILED, MAX_ATTEMPTS, PENDING, RUNNING, WorkQueue
+
+_FLOW = {"mapping": "liberty"}
+
+_JOBS = [("n", {"W": 8}), ("e", {"W": 8})]
+
+
+def _queue(tmp_path, lease_s: float = 60) -> WorkQueue:
+    queue = WorkQueue(tmp_path / "queue.db", lease_s=lease_s)
+    queue.publish(_JOBS, _FLOW)
+    return queue
+
+
+def _attempts(queue: WorkQueue, job_id: int) -> int:
+    return queue._db.execute(
+        "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+    ).fetchone()[0]
+
+
+def test_publish_is_idempotent(tmp_path):
+    queue = _queue(tmp_path)
+    assert queue.publish(_JOBS, _FLOW) == 0
+    assert queue.publish(_JOBS, {"mapping": "generic"}) == 2
+    assert queue.counts() == {PENDING: 4}
+
+
+def test_claim_renew_complete(tmp_path):
+    queue = _queue(tmp_path)
+
+    (job_id, design, params, flow) = queue.claim("a")
+    assert (design, params, flow) == ("n", {"W": 8}, _FLOW)
+    assert queue.counts() == {PENDING: 1, RUNNING: 1}
+
+    # Held by 'a' only.
+    assert queue.renew(job_id, "a")
+    assert not queue.renew(job_id, "b")
+    assert not queue.complete(job_id, "b", {})
+
+    assert queue.complete(job_id, "a", {"area": 1.0})
+    assert not queue.renew(job_id, "a")
+    assert queue.results() == [("n", {"W": 8}, _FLOW, {"area": 1.0})]
+    assert queue.counts() == {PENDING: 1, DONE: 1}
+
+
+def test_fail_requeues_until_attempts_run_out(tmp_path):
+    queue = _queue(tmp_path)
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        (job_id, design, _, _) = queue.claim("a")
+        assert design == "n"
+        assert _attempts(queue, job_id) == attempt
+        queue.fail(job_id, "a", "boom")
+
+    assert queue.counts() == {PENDING: 1, FAILED: 1}
+    assert queue.claim("a")[1] == "e"
+
+
+def test_expired_lease_is_reclaimed(tmp_path, monkeypatch):
+    queue = _queue(tmp_path, lease_s=10)
+    (job_id, _, _, _) = queue.claim("a")
+
+    # Worker 'a' stops renewing; its lease runs out.
+    now = time.time()
+    monkeypatch.setattr(workqueue.time, "time", lambda: now + 11)
+
+    assert queue.counts() == {PENDING: 2}
+    assert queue.claim("b")[0] == job_id
+    assert _attempts(queue, job_id) == 2
+    assert not queue.complete(job_id, "a", {})
+    assert queue.complete(job_id, "b", {})
+
+
+def test_release_spends_no_attempt(tmp_path):
+    queue = _queue(tmp_path)
+
+    (job_id, _, _, _) = queue.claim("a")
+    queue.release(job_id, "a")
+    assert _attempts(queue, job_id) == 0
+    assert queue.counts() == {PENDING: 2}
+
+    # A worker that cannot run a job skips it rather than reclaiming it.
+    (other, design, _, _) = queue.claim("a", exclude={job_id})
+    assert design == "e"
+    queue.release(other, "a")
+    assert queue.claim("a", exclude={job_id, other}) is None
+    assert queue.counts() == {PENDING: 2}